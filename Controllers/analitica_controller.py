@@ -0,0 +1,249 @@
+"""
+Controlador de exportación analítica del torneo.
+
+Escribe cada tabla en un fichero Parquet con tipos de columna reales
+(enteros, booleanos, fechas y marcas de tiempo) en lugar del texto
+localizado de los CSV, para cargarlo directamente con pandas o Arrow:
+
+    pandas.read_parquet("analitica/partidos.parquet")
+
+Los nombres (equipos, jugadores, árbitros, eliminatorias...) se guardan
+codificados como diccionario. Las filas se leen con un cursor de solo
+avance y se escriben en lotes de TAMANO_LOTE, así que la memoria no crece
+con el tamaño del torneo.
+"""
+
+import os
+from datetime import date, datetime
+
+from PySide6.QtSql import QSqlQuery
+
+# ── Motor Arrow ─────────────────────────────────────────────────────────────
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PYARROW_DISPONIBLE = True
+except ImportError:
+    PYARROW_DISPONIBLE = False
+
+# Filas por lote (record batch) escrito en el fichero
+TAMANO_LOTE = 10000
+
+# Las fechas de alta importadas sin hora se leen como medianoche
+FORMATOS_FECHA_HORA = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d")
+
+
+def _entero(valor):
+    return None if valor in (None, "") else int(valor)
+
+
+def _booleano(valor):
+    return None if valor in (None, "") else bool(valor)
+
+
+def _texto(valor):
+    return None if valor in (None, "") else str(valor)
+
+
+def _fecha(valor):
+    try:
+        return date.fromisoformat(str(valor)[:10])
+    except (TypeError, ValueError):
+        return None
+
+
+def _fecha_hora(valor):
+    for formato in FORMATOS_FECHA_HORA:
+        try:
+            return datetime.strptime(str(valor), formato)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+# Tipos lógicos de columna: (tipo Arrow, conversión del valor de QtSql)
+_TIPOS = {
+    "id": (lambda: pa.int64(), _entero),
+    "entero": (lambda: pa.int32(), _entero),
+    "booleano": (lambda: pa.bool_(), _booleano),
+    "nombre": (lambda: pa.dictionary(pa.int32(), pa.string()), _texto),
+    "texto": (lambda: pa.string(), _texto),
+    "fecha": (lambda: pa.date32(), _fecha),
+    "fecha_hora": (lambda: pa.timestamp("s"), _fecha_hora),
+}
+
+# Tabla -> (columnas [(nombre, tipo, expresión SQL)], FROM ... ORDER BY)
+TABLAS = {
+    "equipos": (
+        [
+            ("id", "id", "e.id"),
+            ("nombre", "nombre", "e.nombre"),
+            ("curso", "nombre", "e.curso"),
+            ("color", "nombre", "e.color"),
+            ("escudo", "texto", "e.escudo"),
+            ("fecha_creacion", "fecha_hora", "e.fecha_creacion"),
+        ],
+        "FROM equipos e ORDER BY e.id",
+    ),
+    "participantes": (
+        [
+            ("id", "id", "p.id"),
+            ("nombre", "nombre", "p.nombre"),
+            ("fecha_nacimiento", "fecha", "p.fecha_nacimiento"),
+            ("curso", "nombre", "p.curso"),
+            ("es_jugador", "booleano", "p.es_jugador"),
+            ("es_arbitro", "booleano", "p.es_arbitro"),
+            ("posicion", "nombre", "p.posicion"),
+            ("goles", "entero", "p.goles"),
+            ("t_amarillas", "entero", "p.t_amarillas"),
+            ("t_rojas", "entero", "p.t_rojas"),
+        ],
+        "FROM participantes p ORDER BY p.id",
+    ),
+    "jugadores_equipos": (
+        [
+            ("id", "id", "je.id"),
+            ("jugador_id", "id", "je.jugador_id"),
+            ("jugador", "nombre", "j.nombre"),
+            ("equipo_id", "id", "je.equipo_id"),
+            ("equipo", "nombre", "e.nombre"),
+            ("fecha_asignacion", "fecha_hora", "je.fecha_asignacion"),
+        ],
+        "FROM jugadores_equipos je "
+        "LEFT JOIN participantes j ON j.id = je.jugador_id "
+        "LEFT JOIN equipos e ON e.id = je.equipo_id "
+        "ORDER BY je.id",
+    ),
+    "partidos": (
+        [
+            ("id", "id", "p.id"),
+            ("fecha_hora", "fecha_hora", "p.fecha_hora"),
+            ("eliminatoria", "nombre", "p.eliminatoria"),
+            ("posicion", "entero", "p.posicion"),
+            ("equipo_local_id", "id", "p.equipo_local_id"),
+            ("equipo_local", "nombre", "el.nombre"),
+            ("equipo_visitante_id", "id", "p.equipo_visitante_id"),
+            ("equipo_visitante", "nombre", "ev.nombre"),
+            ("arbitro_id", "id", "p.arbitro_id"),
+            ("arbitro", "nombre", "a.nombre"),
+            ("jugado", "booleano", "p.jugado"),
+            ("goles_local", "entero", "p.goles_local"),
+            ("goles_visitante", "entero", "p.goles_visitante"),
+            ("prorroga", "booleano", "p.prorroga"),
+            ("penales_local", "entero", "p.penales_local"),
+            ("penales_visitante", "entero", "p.penales_visitante"),
+            ("ganador_id", "id", "p.ganador_id"),
+        ],
+        "FROM partidos p "
+        "LEFT JOIN equipos el ON el.id = p.equipo_local_id "
+        "LEFT JOIN equipos ev ON ev.id = p.equipo_visitante_id "
+        "LEFT JOIN participantes a ON a.id = p.arbitro_id "
+        "ORDER BY p.id",
+    ),
+    "goles": (
+        [
+            ("id", "id", "g.id"),
+            ("partido_id", "id", "g.partido_id"),
+            ("jugador_id", "id", "g.jugador_id"),
+            ("jugador", "nombre", "j.nombre"),
+            ("minuto", "entero", "g.minuto"),
+        ],
+        "FROM goles g LEFT JOIN participantes j ON j.id = g.jugador_id ORDER BY g.id",
+    ),
+    "tarjetas": (
+        [
+            ("id", "id", "t.id"),
+            ("partido_id", "id", "t.partido_id"),
+            ("jugador_id", "id", "t.jugador_id"),
+            ("jugador", "nombre", "j.nombre"),
+            ("tipo", "nombre", "t.tipo"),
+            ("minuto", "entero", "t.minuto"),
+        ],
+        "FROM tarjetas t LEFT JOIN participantes j ON j.id = t.jugador_id ORDER BY t.id",
+    ),
+}
+
+
+def _esquema(columnas):
+    return pa.schema(
+        [pa.field(nombre, _TIPOS[tipo][0]()) for nombre, tipo, _ in columnas]
+    )
+
+
+def _lote(columnas, valores, esquema):
+    arrays = []
+    for (_, tipo, _), datos in zip(columnas, valores):
+        if tipo == "nombre":
+            arrays.append(pa.array(datos, pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(datos, type=_TIPOS[tipo][0]()))
+    return pa.RecordBatch.from_arrays(arrays, schema=esquema)
+
+
+def exportar_tabla(tabla, ruta_archivo):
+    """
+    Exporta una tabla a un fichero Parquet en lotes.
+
+    Args:
+        tabla (str): Nombre de la tabla (clave de TABLAS)
+        ruta_archivo (str): Ruta del fichero .parquet
+
+    Returns:
+        int: Número de filas escritas
+
+    Raises:
+        RuntimeError: Si pyarrow no está instalado o falla la consulta
+    """
+    if not PYARROW_DISPONIBLE:
+        raise RuntimeError(
+            "pyarrow no está instalado.\nInstálelo con: pip install pyarrow"
+        )
+
+    columnas, origen = TABLAS[tabla]
+    conversiones = [_TIPOS[tipo][1] for _, tipo, _ in columnas]
+    esquema = _esquema(columnas)
+
+    query = QSqlQuery()
+    query.setForwardOnly(True)
+    sql = f"SELECT {', '.join(expr for _, _, expr in columnas)} {origen}"
+    if not query.exec(sql):
+        raise RuntimeError(f"Error al leer {tabla}: {query.lastError().text()}")
+
+    filas = 0
+    valores = [[] for _ in columnas]
+    with pq.ParquetWriter(ruta_archivo, esquema, compression="zstd") as escritor:
+        while query.next():
+            for i, convertir in enumerate(conversiones):
+                valores[i].append(convertir(query.value(i)))
+            filas += 1
+
+            if len(valores[0]) >= TAMANO_LOTE:
+                escritor.write_batch(_lote(columnas, valores, esquema))
+                valores = [[] for _ in columnas]
+
+        if valores[0] or filas == 0:
+            escritor.write_batch(_lote(columnas, valores, esquema))
+
+    query.finish()
+    return filas
+
+
+def exportar_torneo(directorio):
+    """
+    Exporta todas las tablas del torneo como ficheros Parquet.
+
+    Args:
+        directorio (str): Carpeta de destino; se crea si no existe
+
+    Returns:
+        dict: Filas escritas por tabla
+
+    Raises:
+        RuntimeError: Si pyarrow no está instalado o falla alguna consulta
+    """
+    os.makedirs(directorio, exist_ok=True)
+    return {
+        tabla: exportar_tabla(tabla, os.path.join(directorio, f"{tabla}.parquet"))
+        for tabla in TABLAS
+    }
@@ -0,0 +1,325 @@
+"""
+Controlador de la API JSON de solo lectura para marcadores y pantallas.
+
+Sirve por HTTP los equipos, partidos, resultados, el cuadro y los
+goleadores en formato JSON:
+
+    GET /api                      Lista de recursos
+    GET /api/equipos
+    GET /api/partidos             ?estado=pendientes|jugados
+    GET /api/resultados           Partidos jugados, del más reciente al más antiguo
+    GET /api/cuadro               Partidos agrupados por eliminatoria y posición
+    GET /api/goleadores           ?limite=N (10 por defecto)
+
+El servidor abre su propia conexión sqlite3 en modo solo lectura, así que
+no comparte la conexión de QtSql de la interfaz ni puede modificar datos.
+
+Cada respuesta lleva un ETag calculado con las versiones (versiones_tablas)
+de las tablas de las que depende. Si la pantalla lo envía en If-None-Match
+y nada ha cambiado, se responde 304 sin cuerpo. Además PRAGMA data_version
+indica si alguna otra conexión escribió desde la última petición: mientras
+no cambie, las respuestas salen de la caché sin consultar nada más.
+"""
+
+import json
+import sqlite3
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from Models import database
+from Models.partido import Partido
+
+HOST_POR_DEFECTO = "127.0.0.1"
+PUERTO_POR_DEFECTO = 8765
+
+# Segundos que los clientes pueden reutilizar una respuesta sin preguntar
+MAX_AGE_SEGUNDOS = 2
+
+MAX_GOLEADORES = 100
+
+
+def _equipos(conexion, parametros):
+    filas = conexion.execute(
+        """
+        SELECT e.id, e.nombre, e.curso, e.color, e.escudo,
+               (SELECT COUNT(*) FROM jugadores_equipos je WHERE je.equipo_id = e.id)
+        FROM equipos e
+        ORDER BY e.nombre
+        """
+    )
+    return [
+        {
+            "id": f[0],
+            "nombre": f[1],
+            "curso": f[2],
+            "color": f[3],
+            "escudo": f[4],
+            "jugadores": f[5],
+        }
+        for f in filas
+    ]
+
+
+_SELECT_PARTIDOS = """
+    SELECT p.id, p.fecha_hora, p.eliminatoria, p.posicion,
+           p.equipo_local_id, el.nombre, p.equipo_visitante_id, ev.nombre,
+           a.nombre, p.jugado, p.goles_local, p.goles_visitante,
+           p.prorroga, p.penales_local, p.penales_visitante, p.ganador_id
+    FROM partidos p
+    LEFT JOIN equipos el ON el.id = p.equipo_local_id
+    LEFT JOIN equipos ev ON ev.id = p.equipo_visitante_id
+    LEFT JOIN participantes a ON a.id = p.arbitro_id
+"""
+
+
+def _partido(f):
+    jugado = bool(f[9])
+    return {
+        "id": f[0],
+        "fecha_hora": f[1],
+        "eliminatoria": f[2],
+        "posicion": f[3],
+        "local": {"id": f[4], "nombre": f[5]},
+        "visitante": {"id": f[6], "nombre": f[7]},
+        "arbitro": f[8],
+        "jugado": jugado,
+        "goles_local": f[10] if jugado else None,
+        "goles_visitante": f[11] if jugado else None,
+        "prorroga": bool(f[12]),
+        "penales_local": f[13],
+        "penales_visitante": f[14],
+        "ganador_id": f[15],
+    }
+
+
+def _partidos(conexion, parametros):
+    estado = parametros.get("estado")
+    condicion = {"pendientes": "WHERE p.jugado = 0", "jugados": "WHERE p.jugado = 1"}
+    filas = conexion.execute(
+        f"{_SELECT_PARTIDOS} {condicion.get(estado, '')} ORDER BY p.fecha_hora"
+    )
+    return [_partido(f) for f in filas]
+
+
+def _resultados(conexion, parametros):
+    filas = conexion.execute(
+        f"{_SELECT_PARTIDOS} WHERE p.jugado = 1 ORDER BY p.fecha_hora DESC"
+    )
+    return [_partido(f) for f in filas]
+
+
+def _cuadro(conexion, parametros):
+    rondas = {fase: [] for fase in Partido.ELIMINATORIAS}
+    filas = conexion.execute(
+        f"{_SELECT_PARTIDOS} ORDER BY p.posicion IS NULL, p.posicion, p.fecha_hora"
+    )
+    for f in filas:
+        if f[2] in rondas:
+            rondas[f[2]].append(_partido(f))
+    return [
+        {"eliminatoria": fase, "partidos": partidos}
+        for fase, partidos in rondas.items()
+        if partidos
+    ]
+
+
+def _goleadores(conexion, parametros):
+    limite = parametros.get("limite", 10)
+    filas = conexion.execute(
+        """
+        SELECT p.id, p.nombre, p.curso, e.nombre, p.goles
+        FROM participantes p
+        LEFT JOIN jugadores_equipos je ON je.jugador_id = p.id
+        LEFT JOIN equipos e ON e.id = je.equipo_id
+        WHERE p.es_jugador = 1 AND p.goles > 0
+        ORDER BY p.goles DESC, p.nombre
+        LIMIT ?
+        """,
+        (limite,),
+    )
+    return [
+        {"id": f[0], "nombre": f[1], "curso": f[2], "equipo": f[3], "goles": f[4]}
+        for f in filas
+    ]
+
+
+# Ruta -> (función, tablas de las que depende la respuesta)
+RECURSOS = {
+    "/api/equipos": (_equipos, ("equipos", "jugadores_equipos")),
+    "/api/partidos": (_partidos, ("partidos", "equipos", "participantes")),
+    "/api/resultados": (_resultados, ("partidos", "equipos", "participantes")),
+    "/api/cuadro": (_cuadro, ("partidos", "equipos", "participantes")),
+    "/api/goleadores": (
+        _goleadores,
+        ("participantes", "jugadores_equipos", "equipos"),
+    ),
+}
+
+
+def _normalizar(parametros):
+    """Solo parámetros conocidos y válidos: la caché no crece con valores arbitrarios."""
+    normalizados = {}
+    if parametros.get("estado") in ("pendientes", "jugados"):
+        normalizados["estado"] = parametros["estado"]
+    if "limite" in parametros:
+        try:
+            normalizados["limite"] = max(1, min(int(parametros["limite"]), MAX_GOLEADORES))
+        except ValueError:
+            pass
+    return normalizados
+
+
+class _Lector:
+    """Conexión de solo lectura compartida por los hilos del servidor."""
+
+    def __init__(self, ruta_bd):
+        self.conexion = sqlite3.connect(
+            f"file:{ruta_bd}?mode=ro", uri=True, check_same_thread=False
+        )
+        self.conexion.execute(f"PRAGMA busy_timeout = {database.BUSY_TIMEOUT_MS}")
+        self.bloqueo = threading.Lock()
+        self.data_version = None
+        self.versiones = {}
+        # (ruta, parámetros) -> (etag, cuerpo)
+        self.cache = {}
+
+    def obtener(self, ruta, parametros):
+        """Devuelve (etag, cuerpo JSON) del recurso, reutilizando la caché."""
+        funcion, tablas = RECURSOS[ruta]
+        clave = (ruta, tuple(sorted(parametros.items())))
+
+        with self.bloqueo:
+            data_version = self.conexion.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self.data_version:
+                self.versiones = dict(
+                    self.conexion.execute("SELECT tabla, version FROM versiones_tablas")
+                )
+                self.data_version = data_version
+
+            etag = '"' + "-".join(str(self.versiones.get(t, 0)) for t in tablas) + '"'
+
+            en_cache = self.cache.get(clave)
+            if en_cache is not None and en_cache[0] == etag:
+                return en_cache
+
+            datos = funcion(self.conexion, parametros)
+            cuerpo = json.dumps(datos, ensure_ascii=False).encode("utf-8")
+            self.cache[clave] = (etag, cuerpo)
+            return etag, cuerpo
+
+    def cerrar(self):
+        with self.bloqueo:
+            self.conexion.close()
+
+
+class _Manejador(BaseHTTPRequestHandler):
+    server_version = "TorneoAPI/1.0"
+
+    def do_GET(self):
+        partes = urlsplit(self.path)
+        ruta = partes.path.rstrip("/") or "/api"
+
+        if ruta == "/api":
+            cuerpo = json.dumps(sorted(RECURSOS)).encode("utf-8")
+            self._responder(200, cuerpo)
+            return
+
+        if ruta not in RECURSOS:
+            self._responder(404, b'{"error": "Recurso no encontrado"}')
+            return
+
+        parametros = _normalizar(
+            {k: v[0] for k, v in parse_qs(partes.query).items()}
+        )
+        try:
+            etag, cuerpo = self.server.lector.obtener(ruta, parametros)
+        except sqlite3.Error as e:
+            cuerpo = json.dumps({"error": str(e)}, ensure_ascii=False)
+            self._responder(503, cuerpo.encode("utf-8"))
+            return
+
+        if etag in self.headers.get("If-None-Match", ""):
+            self._responder(304, None, etag)
+        else:
+            self._responder(200, cuerpo, etag)
+
+    def _responder(self, codigo, cuerpo, etag=None):
+        self.send_response(codigo)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", f"max-age={MAX_AGE_SEGUNDOS}")
+        # Las pantallas suelen ser páginas servidas desde otro origen
+        self.send_header("Access-Control-Allow-Origin", "*")
+        if cuerpo is not None:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        if cuerpo is not None:
+            self.wfile.write(cuerpo)
+
+    def log_message(self, formato, *args):
+        # Sin registro por petición: decenas de pantallas consultan cada pocos segundos
+        pass
+
+
+class ServidorApi:
+    """
+    Servidor HTTP de la API en un hilo en segundo plano.
+
+    Attributes:
+        host (str): Dirección en la que escucha
+        puerto (int): Puerto en el que escucha
+    """
+
+    def __init__(self, host=HOST_POR_DEFECTO, puerto=PUERTO_POR_DEFECTO):
+        """
+        Inicializa el servidor sin arrancarlo.
+        """
+        self.host = host
+        self.puerto = puerto
+        self._http = None
+        self._hilo = None
+
+    @property
+    def activo(self):
+        """bool: True si el servidor está atendiendo peticiones."""
+        return self._http is not None
+
+    @property
+    def url(self):
+        """str: URL base de la API."""
+        return f"http://{self.host}:{self.puerto}/api"
+
+    def iniciar(self):
+        """
+        Abre la conexión de solo lectura y empieza a atender peticiones.
+
+        Raises:
+            OSError: Si el puerto está ocupado
+            sqlite3.Error: Si no se puede abrir la base de datos
+        """
+        if self.activo:
+            return
+        lector = _Lector(database.obtener_ruta_bd())
+        try:
+            self._http = ThreadingHTTPServer((self.host, self.puerto), _Manejador)
+        except OSError:
+            lector.cerrar()
+            raise
+        self._http.daemon_threads = True
+        self._http.lector = lector
+        self._hilo = threading.Thread(
+            target=self._http.serve_forever, name="api-torneo", daemon=True
+        )
+        self._hilo.start()
+
+    def detener(self):
+        """Deja de atender peticiones y cierra la conexión."""
+        if not self.activo:
+            return
+        self._http.shutdown()
+        self._http.server_close()
+        self._http.lector.cerrar()
+        self._http = None
+        self._hilo = None
@@ -0,0 +1,242 @@
+"""
+Controlador de asignación automática de árbitros.
+
+Reparte los árbitros entre los partidos pendientes sin árbitro resolviendo
+un flujo de coste mínimo:
+
+    origen → árbitro → (árbitro, bloque horario) → partido → destino
+
+- Cada bloque agrupa partidos que se solapan en el tiempo; la arista de
+  capacidad 1 hacia el bloque impide pitar dos partidos a la vez.
+- No hay arista hacia partidos de equipos del curso del árbitro, ni hacia
+  bloques en los que el árbitro ya pita o juega con su equipo.
+- Del origen a cada árbitro salen aristas de capacidad 1 con coste creciente
+  (su carga actual, más uno por cada partido nuevo). Al ser un coste convexo,
+  el flujo máximo más barato reparte la carga de forma equilibrada.
+"""
+
+import heapq
+from bisect import bisect_left
+
+from Controllers.calendario_controller import equipos_de_jugadores, leer_fecha
+from Models import database
+from Models.equipo import Equipo
+from Models.participante import Participante
+from Models.partido import Partido
+
+
+class _RedFlujo:
+    """Red de flujo con aristas de capacidad y coste enteros."""
+
+    def __init__(self):
+        self.grafo = []
+
+    def nodo(self):
+        self.grafo.append([])
+        return len(self.grafo) - 1
+
+    def arista(self, origen, destino, capacidad, coste):
+        # [destino, capacidad restante, coste, índice de la arista inversa]
+        self.grafo[origen].append([destino, capacidad, coste, len(self.grafo[destino])])
+        self.grafo[destino].append([origen, 0, -coste, len(self.grafo[origen]) - 1])
+
+    def flujo_maximo_coste_minimo(self, origen, destino):
+        """
+        Caminos mínimos sucesivos (Dijkstra con potenciales).
+
+        Returns:
+            tuple: (flujo, coste)
+        """
+        n = len(self.grafo)
+        potencial = [0] * n
+        flujo = coste_total = 0
+
+        while True:
+            distancia = [None] * n
+            previo = [None] * n
+            distancia[origen] = 0
+            cola = [(0, origen)]
+            while cola:
+                d, u = heapq.heappop(cola)
+                if d != distancia[u]:
+                    continue
+                for i, (v, capacidad, coste, _) in enumerate(self.grafo[u]):
+                    if capacidad <= 0:
+                        continue
+                    nd = d + coste + potencial[u] - potencial[v]
+                    if distancia[v] is None or nd < distancia[v]:
+                        distancia[v] = nd
+                        previo[v] = (u, i)
+                        heapq.heappush(cola, (nd, v))
+
+            if distancia[destino] is None:
+                return flujo, coste_total
+
+            for v in range(n):
+                if distancia[v] is not None:
+                    potencial[v] += distancia[v]
+
+            # Todas las capacidades que salen del origen son 1: se aumenta en 1
+            v = destino
+            while v != origen:
+                u, i = previo[v]
+                arista = self.grafo[u][i]
+                arista[1] -= 1
+                self.grafo[v][arista[3]][1] += 1
+                coste_total += arista[2]
+                v = u
+            flujo += 1
+
+
+def _bloques(partidos, duracion):
+    """Agrupa en bloques los partidos cuyos horarios se solapan en cadena."""
+    con_fecha = []
+    for p in partidos:
+        fecha = leer_fecha(p.fecha_hora)
+        if fecha is not None:
+            con_fecha.append((fecha.timestamp() / 60, p))
+    con_fecha.sort(key=lambda x: x[0])
+
+    bloques = []
+    for inicio, p in con_fecha:
+        if bloques and inicio < bloques[-1][1]:
+            bloque = bloques[-1]
+            bloque[1] = max(bloque[1], inicio + duracion)
+            bloque[2].append(p)
+        else:
+            bloques.append([inicio, inicio + duracion, [p]])
+    return bloques
+
+
+def calcular_asignacion(
+    partidos, fijos, arbitros, cursos_equipos, equipo_de_jugador, duracion=None
+):
+    """
+    Calcula el reparto de árbitros sin tocar la base de datos.
+
+    Args:
+        partidos (list): Partidos sin árbitro a cubrir
+        fijos (list): Resto de partidos, que conservan su árbitro
+        arbitros (list): Participantes que pueden arbitrar
+        cursos_equipos (dict): Curso de cada equipo por ID
+        equipo_de_jugador (dict): Equipo de cada jugador por ID
+        duracion (int, optional): Minutos que dura un partido
+
+    Returns:
+        dict: {partido_id: arbitro_id} de los partidos que se pueden cubrir
+    """
+    duracion = duracion or Partido.DURACION_MINUTOS
+
+    # Inicios ya comprometidos de cada árbitro y de cada equipo
+    carga = {}
+    ocupado_arbitro = {}
+    ocupado_equipo = {}
+    for p in list(fijos) + list(partidos):
+        fecha = leer_fecha(p.fecha_hora)
+        if fecha is None:
+            continue
+        inicio = fecha.timestamp() / 60
+        for equipo_id in (p.equipo_local_id, p.equipo_visitante_id):
+            ocupado_equipo.setdefault(equipo_id, []).append(inicio)
+        if p.arbitro_id:
+            ocupado_arbitro.setdefault(p.arbitro_id, []).append(inicio)
+            carga[p.arbitro_id] = carga.get(p.arbitro_id, 0) + 1
+    for inicios in list(ocupado_arbitro.values()) + list(ocupado_equipo.values()):
+        inicios.sort()
+
+    def solapa(inicios, desde, hasta):
+        i = bisect_left(inicios, desde - duracion + 1e-9)
+        return i < len(inicios) and inicios[i] < hasta
+
+    red = _RedFlujo()
+    origen = red.nodo()
+    destino = red.nodo()
+
+    nodo_partido = {}
+    for p in partidos:
+        nodo_partido[p.id] = red.nodo()
+        red.arista(nodo_partido[p.id], destino, 1, 0)
+
+    bloques = _bloques(partidos, duracion)
+    aristas_asignacion = []
+
+    for a in arbitros:
+        equipo_propio = equipo_de_jugador.get(a.id)
+        nodo_arbitro = red.nodo()
+        disponibles = 0
+
+        for desde, hasta, del_bloque in bloques:
+            if solapa(ocupado_arbitro.get(a.id, []), desde, hasta):
+                continue
+            if equipo_propio is not None and solapa(
+                ocupado_equipo.get(equipo_propio, []), desde, hasta
+            ):
+                continue
+
+            validos = [
+                p
+                for p in del_bloque
+                if a.curso
+                not in (
+                    cursos_equipos.get(p.equipo_local_id),
+                    cursos_equipos.get(p.equipo_visitante_id),
+                )
+            ]
+            if not validos:
+                continue
+
+            nodo_bloque = red.nodo()
+            red.arista(nodo_arbitro, nodo_bloque, 1, 0)
+            for p in validos:
+                aristas_asignacion.append(
+                    (nodo_bloque, len(red.grafo[nodo_bloque]), p.id, a.id)
+                )
+                red.arista(nodo_bloque, nodo_partido[p.id], 1, 0)
+            disponibles += 1
+
+        # Coste marginal creciente: carga equilibrada entre árbitros
+        for k in range(disponibles):
+            red.arista(origen, nodo_arbitro, 1, carga.get(a.id, 0) + k)
+
+    red.flujo_maximo_coste_minimo(origen, destino)
+
+    asignacion = {}
+    for nodo_bloque, indice, partido_id, arbitro_id in aristas_asignacion:
+        if red.grafo[nodo_bloque][indice][1] == 0:
+            asignacion[partido_id] = arbitro_id
+    return asignacion
+
+
+def asignar_arbitros():
+    """
+    Asigna árbitro a los partidos pendientes que no lo tienen y lo guarda.
+
+    Todos los cambios se escriben en una única transacción.
+
+    Returns:
+        tuple: (partidos asignados, partidos que siguen sin árbitro), o None si falló
+    """
+    todos = Partido.obtener_todos()
+    abiertos = [p for p in todos if not p.jugado and not p.arbitro_id]
+    fijos = [p for p in todos if p.arbitro_id]
+
+    asignacion = calcular_asignacion(
+        abiertos,
+        fijos,
+        Participante.obtener_arbitros(),
+        {e.id: e.curso for e in Equipo.iterar()},
+        equipos_de_jugadores(),
+    )
+
+    try:
+        with database.transaccion():
+            for p in abiertos:
+                if p.id in asignacion:
+                    p.arbitro_id = asignacion[p.id]
+                    if not p.actualizar_campos("arbitro_id"):
+                        raise Exception(f"No se pudo actualizar el partido {p.id}")
+    except Exception as e:
+        print(f"Error al asignar árbitros: {e}")
+        return None
+
+    return len(asignacion), len(abiertos) - len(asignacion)
@@ -0,0 +1,435 @@
+"""
+Controlador de planificación automática del calendario.
+
+Asigna fecha y árbitro a los partidos pendientes dentro de las franjas de
+pista disponibles sin solapes:
+- Un equipo no juega dos partidos sin el descanso mínimo entre ellos.
+- Un partido de una ronda empieza después de sus dos partidos de origen.
+- Un árbitro no pita dos partidos a la vez ni partidos de su propio curso.
+- Un árbitro que también es jugador no pita mientras juega su equipo.
+
+Los partidos se colocan ronda a ronda y, dentro de cada ronda, primero los
+que tienen menos árbitros posibles. El primer hueco libre se localiza con
+búsqueda binaria sobre las franjas ordenadas y un conjunto disjunto que
+salta las ya ocupadas, en O(log n) amortizado. En cada franja probada se
+recorren los árbitros posibles del partido (O(a log n)), y como mucho se
+prueban MAX_FRANJAS_BUSCANDO_ARBITRO franjas, así que cada partido cuesta
+O(log n + a log n) con a árbitros candidatos.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta
+
+from PySide6.QtSql import QSqlQuery
+
+from Models import database
+from Models.equipo import Equipo
+from Models.participante import Participante
+from Models.partido import Partido
+
+FORMATO_FECHA = "%Y-%m-%d %H:%M:%S"
+
+# Franjas que se prueban buscando árbitro antes de dejar el partido sin él
+MAX_FRANJAS_BUSCANDO_ARBITRO = 20
+
+_EPOCA = datetime(2000, 1, 1)
+
+
+def _a_minutos(fecha):
+    return int((fecha - _EPOCA).total_seconds() // 60)
+
+
+def _desde_minutos(minutos):
+    return _EPOCA + timedelta(minutes=minutos)
+
+
+def leer_fecha(texto):
+    """Convierte una fecha_hora guardada en datetime, o None si no es válida."""
+    for formato in (FORMATO_FECHA, "%Y-%m-%d %H:%M"):
+        try:
+            return datetime.strptime(texto, formato)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def generar_franjas(desde, hasta, horas, pistas=1, dias_semana=None):
+    """
+    Genera las franjas de juego disponibles entre dos fechas.
+
+    Args:
+        desde (date): Primer día
+        hasta (date): Último día (incluido)
+        horas (list): Horas de inicio de cada día como objetos time
+        pistas (int): Partidos simultáneos posibles en cada hora
+        dias_semana (iterable, optional): Días permitidos (0=lunes). None para todos
+
+    Returns:
+        list: Fechas de inicio ordenadas, repetidas una vez por pista
+    """
+    permitidos = set(dias_semana) if dias_semana is not None else None
+    franjas = []
+    dia = desde
+    while dia <= hasta:
+        if permitidos is None or dia.weekday() in permitidos:
+            for hora in horas:
+                inicio = datetime.combine(dia, hora)
+                franjas.extend([inicio] * pistas)
+        dia += timedelta(days=1)
+    franjas.sort()
+    return franjas
+
+
+class _Ocupacion:
+    """Inicios de partido ordenados de un equipo o árbitro."""
+
+    __slots__ = ("inicios",)
+
+    def __init__(self):
+        self.inicios = []
+
+    def conflicto(self, inicio, margen):
+        """Devuelve el primer minuto libre tras el solape, o None si no lo hay."""
+        i = bisect_right(self.inicios, inicio - margen)
+        if i < len(self.inicios) and self.inicios[i] < inicio + margen:
+            return self.inicios[i] + margen
+        return None
+
+    def ocupar(self, inicio):
+        insort(self.inicios, inicio)
+
+
+class Planificacion:
+    """
+    Resultado de una planificación, pendiente de aplicar.
+
+    Attributes:
+        asignaciones (list): Tuplas (partido, fecha_hora, arbitro_id)
+        sin_franja (list): Partidos que no caben en las franjas dadas
+        sin_arbitro (list): Partidos colocados sin árbitro disponible
+        solapes (list): Tuplas (partido programado, partido sin franja) que
+            se solapan porque el segundo conserva su fecha anterior
+    """
+
+    def __init__(self):
+        self.asignaciones = []
+        self.sin_franja = []
+        self.sin_arbitro = []
+        self.solapes = []
+
+    def resumen(self):
+        """
+        Describe el resultado para mostrarlo al usuario.
+
+        Returns:
+            str: Texto con el número de partidos en cada situación
+        """
+        lineas = [f"{len(self.asignaciones)} partido(s) programado(s)"]
+        if self.sin_arbitro:
+            lineas.append(f"{len(self.sin_arbitro)} sin árbitro disponible")
+        if self.sin_franja:
+            lineas.append(f"{len(self.sin_franja)} sin franja libre")
+        if self.solapes:
+            lineas.append(
+                f"{len(self.solapes)} solape(s) con partidos sin franja que "
+                "conservan su fecha"
+            )
+        return "\n".join(lineas)
+
+
+class Planificador:
+    """
+    Clase que reparte partidos en franjas y les asigna árbitro.
+
+    Attributes:
+        franjas (list): Fechas de inicio disponibles, una por pista
+        descanso_minutos (int): Descanso mínimo de un equipo entre partidos
+        duracion_minutos (int): Duración de cada partido
+    """
+
+    def __init__(self, franjas, descanso_minutos=24 * 60, duracion_minutos=None):
+        """
+        Inicializa el planificador con las franjas disponibles.
+        """
+        self.franjas = sorted(_a_minutos(f) for f in franjas)
+        self.descanso_minutos = descanso_minutos
+        self.duracion_minutos = duracion_minutos or Partido.DURACION_MINUTOS
+
+        # siguiente[i]: primera franja libre con índice >= i (conjunto disjunto)
+        self._siguiente = list(range(len(self.franjas) + 1))
+        self._equipos = {}
+        self._arbitros = {}
+        self._arbitros_de_equipo = {}
+        self._carga = {}
+
+    def _franja_libre(self, i):
+        raiz = i
+        while self._siguiente[raiz] != raiz:
+            raiz = self._siguiente[raiz]
+        while self._siguiente[i] != raiz:
+            self._siguiente[i], i = raiz, self._siguiente[i]
+        return raiz
+
+    def _ocupar_franja(self, i):
+        self._siguiente[i] = i + 1
+
+    def _ocupacion(self, tabla, clave):
+        if clave not in tabla:
+            tabla[clave] = _Ocupacion()
+        return tabla[clave]
+
+    def planificar(self, partidos, fijos, arbitros, cursos_equipos, equipo_de_jugador):
+        """
+        Calcula fecha y árbitro para cada partido sin tocar la base de datos.
+
+        Args:
+            partidos (list): Partidos a colocar
+            fijos (list): Partidos que conservan su fecha y árbitro
+            arbitros (list): Participantes que pueden arbitrar
+            cursos_equipos (dict): Curso de cada equipo por ID
+            equipo_de_jugador (dict): Equipo de cada jugador por ID
+
+        Returns:
+            Planificacion: Asignaciones calculadas
+        """
+        resultado = Planificacion()
+        margen_equipo = self.duracion_minutos + self.descanso_minutos
+        inicios = {}
+
+        # Árbitros que juegan en cada equipo: su equipo no juega mientras pitan
+        self._arbitros_de_equipo = {}
+        for a in arbitros:
+            equipo_id = equipo_de_jugador.get(a.id)
+            if equipo_id is not None:
+                self._arbitros_de_equipo.setdefault(equipo_id, []).append(a.id)
+
+        for p in fijos:
+            fecha = leer_fecha(p.fecha_hora)
+            if fecha is None:
+                continue
+            inicio = _a_minutos(fecha)
+            inicios[(p.eliminatoria, p.posicion)] = inicio
+            for equipo_id in (p.equipo_local_id, p.equipo_visitante_id):
+                self._ocupacion(self._equipos, equipo_id).ocupar(inicio)
+            if p.arbitro_id:
+                self._ocupacion(self._arbitros, p.arbitro_id).ocupar(inicio)
+                self._carga[p.arbitro_id] = self._carga.get(p.arbitro_id, 0) + 1
+
+        def posibles(p):
+            cursos = {
+                cursos_equipos.get(p.equipo_local_id),
+                cursos_equipos.get(p.equipo_visitante_id),
+            }
+            return [a for a in arbitros if a.curso not in cursos]
+
+        def ronda(p):
+            if p.eliminatoria in Partido.ELIMINATORIAS:
+                return Partido.ELIMINATORIAS.index(p.eliminatoria)
+            return len(Partido.ELIMINATORIAS)
+
+        # Ronda a ronda; dentro de cada una, el más restringido primero
+        candidatos = {p.id: posibles(p) for p in partidos}
+        orden = sorted(
+            partidos,
+            key=lambda p: (ronda(p), len(candidatos[p.id]), p.posicion or 0),
+        )
+
+        for p in orden:
+            # No antes de que terminen sus partidos de origen
+            minimo = self.franjas[0] if self.franjas else 0
+            if p.posicion is not None and 0 < ronda(p) < len(Partido.ELIMINATORIAS):
+                anterior = Partido.ELIMINATORIAS[ronda(p) - 1]
+                for hueco in (2 * p.posicion, 2 * p.posicion + 1):
+                    origen = inicios.get((anterior, hueco))
+                    if origen is not None:
+                        minimo = max(minimo, origen + margen_equipo)
+
+            colocado = self._colocar(p, minimo, candidatos[p.id], equipo_de_jugador)
+            if colocado is None:
+                resultado.sin_franja.append(p)
+                continue
+
+            inicio, arbitro_id = colocado
+            inicios[(p.eliminatoria, p.posicion)] = inicio
+            resultado.asignaciones.append(
+                (p, _desde_minutos(inicio).strftime(FORMATO_FECHA), arbitro_id)
+            )
+            if arbitro_id is None:
+                resultado.sin_arbitro.append(p)
+
+        return resultado
+
+    def _colocar(self, partido, minimo, arbitros, equipo_de_jugador):
+        equipos = (partido.equipo_local_id, partido.equipo_visitante_id)
+        margen_equipo = self.duracion_minutos + self.descanso_minutos
+
+        primera_valida = None
+        probadas = 0
+        i = self._franja_libre(bisect_left(self.franjas, minimo))
+
+        while i < len(self.franjas):
+            inicio = self.franjas[i]
+
+            # Saltar directamente al final del solape más lejano
+            libre_desde = None
+            for equipo_id in equipos:
+                fin = self._ocupacion(self._equipos, equipo_id).conflicto(
+                    inicio, margen_equipo
+                )
+                if fin is not None:
+                    libre_desde = max(libre_desde or fin, fin)
+                for arbitro_id in self._arbitros_de_equipo.get(equipo_id, ()):
+                    fin = self._ocupacion(self._arbitros, arbitro_id).conflicto(
+                        inicio, self.duracion_minutos
+                    )
+                    if fin is not None:
+                        libre_desde = max(libre_desde or fin, fin)
+            if libre_desde is not None:
+                i = self._franja_libre(bisect_left(self.franjas, libre_desde))
+                continue
+
+            if primera_valida is None:
+                primera_valida = i
+
+            arbitro_id = self._elegir_arbitro(inicio, arbitros, equipo_de_jugador)
+            if arbitro_id is not None:
+                self._reservar(i, equipos, arbitro_id)
+                return inicio, arbitro_id
+
+            probadas += 1
+            if probadas >= MAX_FRANJAS_BUSCANDO_ARBITRO:
+                break
+            i = self._franja_libre(i + 1)
+
+        if primera_valida is None:
+            return None
+
+        self._reservar(primera_valida, equipos, None)
+        return self.franjas[primera_valida], None
+
+    def _elegir_arbitro(self, inicio, arbitros, equipo_de_jugador):
+        """Árbitro libre con menos partidos asignados, o None."""
+        mejor = None
+        for a in arbitros:
+            if self._ocupacion(self._arbitros, a.id).conflicto(
+                inicio, self.duracion_minutos
+            ) is not None:
+                continue
+            equipo_id = equipo_de_jugador.get(a.id)
+            if equipo_id is not None and self._ocupacion(
+                self._equipos, equipo_id
+            ).conflicto(inicio, self.duracion_minutos) is not None:
+                continue
+            if mejor is None or self._carga.get(a.id, 0) < self._carga.get(mejor, 0):
+                mejor = a.id
+        return mejor
+
+    def _reservar(self, i, equipos, arbitro_id):
+        inicio = self.franjas[i]
+        self._ocupar_franja(i)
+        for equipo_id in equipos:
+            self._ocupacion(self._equipos, equipo_id).ocupar(inicio)
+        if arbitro_id is not None:
+            self._ocupacion(self._arbitros, arbitro_id).ocupar(inicio)
+            self._carga[arbitro_id] = self._carga.get(arbitro_id, 0) + 1
+
+
+def equipos_de_jugadores():
+    """Devuelve {jugador_id: equipo_id} de todos los jugadores asignados."""
+    resultado = {}
+    q = QSqlQuery("SELECT jugador_id, equipo_id FROM jugadores_equipos")
+    while q.next():
+        resultado[q.value(0)] = q.value(1)
+    return resultado
+
+
+def planificar_pendientes(franjas, descanso_minutos=24 * 60):
+    """
+    Planifica todos los partidos no jugados con los datos de la base de datos.
+
+    Los partidos ya jugados conservan su fecha y cuentan como ocupación.
+
+    Args:
+        franjas (list): Fechas de inicio disponibles, una por pista
+        descanso_minutos (int): Descanso mínimo de un equipo entre partidos
+
+    Returns:
+        Planificacion: Asignaciones calculadas, sin guardar
+    """
+    todos = Partido.obtener_todos()
+    pendientes = [p for p in todos if not p.jugado]
+    jugados = [p for p in todos if p.jugado]
+
+    # Las franjas ya usadas por partidos jugados no se reutilizan
+    ocupadas = {}
+    for p in jugados:
+        fecha = leer_fecha(p.fecha_hora)
+        if fecha is not None:
+            ocupadas[fecha] = ocupadas.get(fecha, 0) + 1
+    disponibles = []
+    for f in sorted(franjas):
+        if ocupadas.get(f):
+            ocupadas[f] -= 1
+        else:
+            disponibles.append(f)
+
+    planificador = Planificador(disponibles, descanso_minutos)
+    return planificador.planificar(
+        pendientes,
+        jugados,
+        Participante.obtener_arbitros(),
+        {e.id: e.curso for e in Equipo.iterar()},
+        equipos_de_jugadores(),
+    )
+
+
+def aplicar(planificacion):
+    """
+    Guarda en una sola transacción las fechas y árbitros calculados.
+
+    Antes de confirmar se verifica cada partido con Partido.buscar_conflictos();
+    si alguno se solapa se deshace todo. Los solapes con partidos sin franja,
+    que conservan su fecha anterior, no deshacen nada: se anotan en
+    planificacion.solapes para que el organizador los mueva a mano.
+
+    Args:
+        planificacion (Planificacion): Resultado de planificar_pendientes()
+
+    Returns:
+        bool: True si se guardó todo, False si se deshizo
+    """
+    sin_franja = {p.id for p in planificacion.sin_franja}
+    solapes = []
+    try:
+        with database.transaccion():
+            for partido, fecha_hora, arbitro_id in planificacion.asignaciones:
+                partido.fecha_hora = fecha_hora
+                partido.arbitro_id = arbitro_id
+                if not partido.actualizar_campos("fecha_hora", "arbitro_id"):
+                    raise Exception(f"No se pudo actualizar el partido {partido.id}")
+
+            # Comprobación final contra la base de datos ya modificada
+            for partido, _, _ in planificacion.asignaciones:
+                conflictos = Partido.buscar_conflictos(
+                    partido.fecha_hora,
+                    partido.equipo_local_id,
+                    partido.equipo_visitante_id,
+                    partido.arbitro_id,
+                    excluir_id=partido.id,
+                )
+                # El mismo partido puede salir por equipo y por árbitro
+                vistos = set()
+                for otro, motivo in conflictos:
+                    if otro.id in sin_franja:
+                        if otro.id not in vistos:
+                            vistos.add(otro.id)
+                            solapes.append((partido, otro))
+                    else:
+                        raise Exception(
+                            f"El partido {partido.id} se solapa con el {otro.id} ({motivo})"
+                        )
+        planificacion.solapes = solapes
+        return True
+    except Exception as e:
+        print(f"Error al aplicar la planificación: {e}")
+        return False
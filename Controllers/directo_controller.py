@@ -0,0 +1,332 @@
+"""
+Controlador del directo de resultados por Server-Sent Events.
+
+Las pantallas se conectan una vez a /directo y reciben los cambios de los
+partidos en cuanto se guardan, en lugar de consultar la API cada segundo:
+
+    const fuente = new EventSource("http://servidor:8766/directo");
+    fuente.addEventListener("partido", (e) => aplicar(JSON.parse(e.data)));
+    fuente.addEventListener("reinicio", () => recargarTodo());
+
+El emisor se suscribe a Models.eventos, así que lo alimentan los resultados
+guardados en ResultadosPage, los partidos que el cuadro crea o actualiza al
+avanzar (Models.progresion) y cualquier otra escritura de partidos. Solo se
+envían los campos que cambiaron respecto al último estado conocido.
+
+Todas las conexiones las atiende un único bucle asyncio en un hilo aparte:
+
+- Cada suscriptor tiene una cola acotada. Si un cliente lento la llena, se
+  le desconecta en lugar de acumular memoria; al reconectar se recupera.
+- Los últimos eventos se guardan en un búfer circular. El navegador reenvía
+  Last-Event-ID al reconectar y se le envían solo los eventos perdidos; si
+  ya no están en el búfer recibe "reinicio" para recargar el estado completo.
+- Los ids de evento llevan delante la época del arranque ("época-número"),
+  porque la numeración vuelve a empezar cada vez que se inicia el servidor.
+  Un id de otro arranque también recibe "reinicio".
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from urllib.parse import parse_qs, urlsplit
+
+from Models import eventos
+from Models.partido import Partido
+
+HOST_POR_DEFECTO = "127.0.0.1"
+PUERTO_POR_DEFECTO = 8766
+
+# Eventos pendientes por cliente antes de desconectarlo
+MAX_PENDIENTES = 256
+
+# Eventos recientes que se pueden reenviar al reconectar
+TAMANO_HISTORIAL = 1000
+
+# Segundos entre comentarios de mantenimiento de la conexión
+INTERVALO_LATIDO = 15
+
+# Milisegundos que el navegador espera antes de reconectar
+REINTENTO_MS = 3000
+
+_CAMPOS = (
+    "fecha_hora",
+    "eliminatoria",
+    "posicion",
+    "equipo_local_id",
+    "equipo_visitante_id",
+    "arbitro_id",
+    "jugado",
+    "goles_local",
+    "goles_visitante",
+    "prorroga",
+    "penales_local",
+    "penales_visitante",
+    "ganador_id",
+)
+
+
+def _estado(partido):
+    return {campo: getattr(partido, campo) for campo in _CAMPOS}
+
+
+def _formatear(id_evento, tipo, datos):
+    texto = json.dumps(datos, ensure_ascii=False, separators=(",", ":"))
+    return f"id: {id_evento}\nevent: {tipo}\ndata: {texto}\n\n".encode("utf-8")
+
+
+class EmisorDirecto:
+    """
+    Servidor de Server-Sent Events con los cambios de los partidos.
+
+    Attributes:
+        host (str): Dirección en la que escucha
+        puerto (int): Puerto en el que escucha
+    """
+
+    def __init__(self, host=HOST_POR_DEFECTO, puerto=PUERTO_POR_DEFECTO):
+        """
+        Inicializa el emisor sin arrancarlo.
+        """
+        self.host = host
+        self.puerto = puerto
+        self._bucle = None
+        self._hilo = None
+        self._servidor = None
+        self._suscriptores = set()
+        self._historial = deque(maxlen=TAMANO_HISTORIAL)
+        self._ultimo_id = 0
+        self._epoca = ""
+        # Último estado enviado de cada partido; solo se usa en el hilo de Qt
+        self._estados = {}
+
+    @property
+    def activo(self):
+        """bool: True si el servidor está atendiendo conexiones."""
+        return self._bucle is not None
+
+    @property
+    def url(self):
+        """str: URL del flujo de eventos."""
+        return f"http://{self.host}:{self.puerto}/directo"
+
+    # ── Hilo de Qt ──────────────────────────────────────────────────────────
+
+    def iniciar(self):
+        """
+        Arranca el bucle asyncio y se suscribe a los cambios de partidos.
+
+        Debe llamarse desde el hilo de la interfaz, que es el que lee los
+        partidos de la base de datos.
+
+        Raises:
+            OSError: Si el puerto está ocupado
+        """
+        if self.activo:
+            return
+
+        self._estados = {p.id: _estado(p) for p in Partido.iterar()}
+        # Lo emitido en un arranque anterior no sirve para este
+        self._epoca = format(time.time_ns(), "x")
+        self._historial.clear()
+        self._ultimo_id = 0
+
+        listo = threading.Event()
+        errores = []
+
+        def ejecutar():
+            bucle = asyncio.new_event_loop()
+            asyncio.set_event_loop(bucle)
+            try:
+                self._servidor = bucle.run_until_complete(
+                    asyncio.start_server(self._atender, self.host, self.puerto)
+                )
+            except OSError as e:
+                errores.append(e)
+                bucle.close()
+                listo.set()
+                return
+            self._bucle = bucle
+            listo.set()
+            bucle.run_forever()
+
+            self._servidor.close()
+            for cola in list(self._suscriptores):
+                self._cortar(cola)
+            # Dejar que cada conexión lea su None y se cierre
+            bucle.run_until_complete(asyncio.sleep(0.1))
+            bucle.run_until_complete(self._servidor.wait_closed())
+            bucle.close()
+
+        self._hilo = threading.Thread(target=ejecutar, name="directo-torneo", daemon=True)
+        self._hilo.start()
+        listo.wait()
+        if errores:
+            self._hilo = None
+            raise errores[0]
+
+        eventos.suscribir(self._al_cambiar, ("partidos",))
+
+    def detener(self):
+        """Cierra las conexiones y detiene el bucle."""
+        if not self.activo:
+            return
+        eventos.desuscribir(self._al_cambiar)
+        bucle, self._bucle = self._bucle, None
+        bucle.call_soon_threadsafe(bucle.stop)
+        self._hilo.join(timeout=5)
+        self._hilo = None
+
+    def _al_cambiar(self, cambio):
+        """Calcula el diff del partido cambiado y lo envía al bucle."""
+        if cambio.id is None:
+            # Cambio de varias filas: se compara con todos los partidos
+            actuales = {p.id: p for p in Partido.iterar()}
+            for partido_id in set(self._estados) | set(actuales):
+                self._comparar(partido_id, actuales.get(partido_id))
+            return
+
+        self._comparar(cambio.id, Partido.obtener_por_id(cambio.id))
+
+    def _comparar(self, partido_id, partido):
+        anterior = self._estados.get(partido_id)
+
+        if partido is None:
+            if anterior is not None:
+                del self._estados[partido_id]
+                self._emitir("partido", {"id": partido_id, "eliminado": True})
+            return
+
+        actual = _estado(partido)
+        self._estados[partido_id] = actual
+        if anterior is None:
+            diff = dict(actual, nuevo=True)
+        else:
+            diff = {c: v for c, v in actual.items() if anterior.get(c) != v}
+            if not diff:
+                return
+
+        if "equipo_local_id" in diff or "equipo_visitante_id" in diff:
+            nombres = partido.obtener_nombres_equipos()
+            diff["local"] = nombres["local"]
+            diff["visitante"] = nombres["visitante"]
+
+        diff["id"] = partido_id
+        self._emitir("partido", diff)
+
+    def _emitir(self, tipo, datos):
+        bucle = self._bucle
+        if bucle is not None:
+            bucle.call_soon_threadsafe(self._difundir, tipo, datos)
+
+    # ── Hilo de asyncio ─────────────────────────────────────────────────────
+
+    def _difundir(self, tipo, datos):
+        self._ultimo_id += 1
+        mensaje = _formatear(self._id_evento(self._ultimo_id), tipo, datos)
+        self._historial.append((self._ultimo_id, mensaje))
+
+        for cola in list(self._suscriptores):
+            try:
+                cola.put_nowait(mensaje)
+            except asyncio.QueueFull:
+                # Cliente demasiado lento: se le corta y recupera con Last-Event-ID
+                self._cortar(cola)
+
+    def _cortar(self, cola):
+        """Vacía la cola de un suscriptor y le indica que cierre la conexión."""
+        self._suscriptores.discard(cola)
+        while not cola.empty():
+            cola.get_nowait()
+        cola.put_nowait(None)
+
+    def _id_evento(self, numero):
+        return f"{self._epoca}-{numero}"
+
+    def _leer_ultimo(self, texto):
+        """Número de un id recibido, o None si es de otro arranque o no es válido."""
+        epoca, _, numero = texto.rpartition("-")
+        # ?ultimo=N a mano no lleva época: se entiende del arranque actual
+        if epoca and epoca != self._epoca:
+            return None
+        return int(numero) if numero.isdigit() else None
+
+    def _pendientes_desde(self, ultimo):
+        """Eventos posteriores a ultimo, o None si ya salieron del historial."""
+        if ultimo > self._ultimo_id:
+            # Número de otro arranque sin época: no se sabe qué se perdió
+            return None
+        if ultimo == self._ultimo_id:
+            return []
+        if not self._historial or self._historial[0][0] > ultimo + 1:
+            return None
+        return [mensaje for id_evento, mensaje in self._historial if id_evento > ultimo]
+
+    async def _atender(self, lector, escritor):
+        try:
+            peticion = await asyncio.wait_for(lector.readuntil(b"\r\n\r\n"), 10)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+            escritor.close()
+            return
+
+        lineas = peticion.decode("latin-1").split("\r\n")
+        partes = lineas[0].split(" ")
+        cabeceras = {}
+        for linea in lineas[1:]:
+            if ":" in linea:
+                nombre, valor = linea.split(":", 1)
+                cabeceras[nombre.strip().lower()] = valor.strip()
+
+        url = urlsplit(partes[1] if len(partes) > 1 else "/")
+        if partes[0] != "GET" or url.path.rstrip("/") != "/directo":
+            escritor.write(
+                b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+            )
+            await escritor.drain()
+            escritor.close()
+            return
+
+        # EventSource reenvía Last-Event-ID; ?ultimo=N permite elegirlo a mano
+        ultimo = cabeceras.get("last-event-id") or parse_qs(url.query).get(
+            "ultimo", [""]
+        )[0]
+
+        escritor.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream; charset=utf-8\r\n"
+            b"Cache-Control: no-cache\r\n"
+            b"Connection: keep-alive\r\n"
+            b"Access-Control-Allow-Origin: *\r\n\r\n"
+            + f"retry: {REINTENTO_MS}\n\n".encode("ascii")
+        )
+
+        cola = asyncio.Queue(maxsize=MAX_PENDIENTES)
+        if ultimo:
+            numero = self._leer_ultimo(ultimo)
+            pendientes = self._pendientes_desde(numero) if numero is not None else None
+            if pendientes is None:
+                escritor.write(
+                    _formatear(self._id_evento(self._ultimo_id), "reinicio", {})
+                )
+            else:
+                for mensaje in pendientes:
+                    escritor.write(mensaje)
+        self._suscriptores.add(cola)
+
+        try:
+            await escritor.drain()
+            while True:
+                try:
+                    mensaje = await asyncio.wait_for(cola.get(), INTERVALO_LATIDO)
+                except asyncio.TimeoutError:
+                    mensaje = b": latido\n\n"
+                if mensaje is None:
+                    break
+                escritor.write(mensaje)
+                await escritor.drain()
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self._suscriptores.discard(cola)
+            escritor.close()
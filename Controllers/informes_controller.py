@@ -15,6 +15,8 @@ from datetime import datetime
 
 from PySide6.QtSql import QSqlQuery
 
+from Models.partido import Partido
+
 # ── Motor Jasper ────────────────────────────────────────────────────────────
 try:
     from pyreportjasper import PyReportJasper
@@ -83,7 +85,7 @@ def obtener_lista_equipos():
 
 def obtener_lista_eliminatorias():
     """Devuelve las eliminatorias disponibles."""
-    return ["Octavos", "Cuartos", "Semifinales", "Final"]
+    return list(Partido.ELIMINATORIAS)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
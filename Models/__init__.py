@@ -5,19 +5,23 @@ Este paquete contiene todos los modelos de datos y la configuración de la base
 """
 
 from . import database
+from . import eventos
 from .equipo import Equipo
 from .participante import Participante
 from .partido import Partido
 from .jugador_equipo import JugadorEquipo
 from .gol import Gol
 from .tarjeta import Tarjeta
+from . import progresion
 
 __all__ = [
     "database",
+    "eventos",
     "Equipo",
     "Participante",
     "Partido",
     "JugadorEquipo",
     "Gol",
     "Tarjeta",
+    "progresion",
 ]
@@ -7,10 +7,30 @@ la integridad de los datos.
 """
 
 from PySide6.QtSql import QSqlDatabase, QSqlQuery
+from contextlib import contextmanager
 import sys
 import os
 import shutil
 
+from . import eventos
+from .sancion import SQL_UMBRAL as SQL_UMBRAL_SANCIONES
+
+# Tablas cuyos cambios se cuentan en versiones_tablas
+TABLAS_VERSIONADAS = (
+    "equipos",
+    "participantes",
+    "jugadores_equipos",
+    "partidos",
+    "goles",
+    "tarjetas",
+)
+
+# Entradas de registro_cambios que se conservan al conectar
+MAX_REGISTRO_CAMBIOS = 5000
+
+# Milisegundos que una escritura espera si otro equipo tiene la base bloqueada
+BUSY_TIMEOUT_MS = 5000
+
 
 def obtener_ruta_bd():
     """
@@ -52,7 +72,9 @@ def conectar():
     - Crea la conexión con el driver QSQLITE
     - Abre la base de datos (la crea si no existe)
     - Activa las foreign keys
+    - Configura la espera ante bloqueos de otros procesos
     - Crea todas las tablas necesarias
+    - Añade las columnas nuevas a bases de datos existentes
     - Configura los triggers
     - Crea índices para optimización
 
@@ -79,11 +101,18 @@ def conectar():
     else:
         print("Foreign keys activadas correctamente")
 
+    # Esperar en lugar de fallar si otro equipo está escribiendo en el fichero
+    if not query.exec(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS};"):
+        print(f"Error al configurar busy_timeout: {query.lastError().text()}")
+
     # Crear todas las tablas
     crear_tablas(query)
+    migrar_esquema(query)
 
     # Crear triggers
     crear_triggers(query)
+    crear_triggers_versiones(query)
+    crear_triggers_sanciones(query)
 
     # Crear índices
     crear_indices(query)
@@ -103,6 +132,10 @@ def crear_tablas(query):
     - goles: Registro de goles por jugador en cada partido
     - tarjetas: Registro de tarjetas amarillas y rojas
     - configuracion: Parámetros de configuración del sistema
+    - sanciones: Tarjetas acumuladas y partidos de sanción cumplidos por jugador
+    - sanciones_cumplidas: Partido en el que cada jugador cumplió sanción
+    - versiones_tablas: Contador de cambios de cada tabla
+    - registro_cambios: Últimas filas modificadas de cada tabla
 
     Args:
         query (QSqlQuery): Objeto query para ejecutar sentencias SQL
@@ -181,6 +214,7 @@ def crear_tablas(query):
             prorroga INTEGER DEFAULT 0,
             penales_local INTEGER,
             penales_visitante INTEGER,
+            posicion INTEGER,
             FOREIGN KEY (equipo_local_id) REFERENCES equipos(id) ON DELETE CASCADE,
             FOREIGN KEY (equipo_visitante_id) REFERENCES equipos(id) ON DELETE CASCADE,
             FOREIGN KEY (arbitro_id) REFERENCES participantes(id) ON DELETE SET NULL,
@@ -247,6 +281,7 @@ def crear_tablas(query):
 
     configuraciones = [
         ("max_jugadores_equipo", "18"),
+        ("umbral_amarillas", "5"),
         ("version", "1.0"),
         ("fecha_actualizacion", "2026-01-08"),
     ]
@@ -256,6 +291,174 @@ def crear_tablas(query):
         query.addBindValue(valor)
         query.exec()
 
+    # Sanciones por tarjetas: acumulados por jugador mantenidos por triggers
+    if not query.exec(
+        """
+        CREATE TABLE IF NOT EXISTS sanciones (
+            jugador_id INTEGER PRIMARY KEY,
+            amarillas INTEGER NOT NULL DEFAULT 0,
+            rojas INTEGER NOT NULL DEFAULT 0,
+            cumplidos INTEGER NOT NULL DEFAULT 0,
+            FOREIGN KEY (jugador_id) REFERENCES participantes(id) ON DELETE CASCADE
+        )
+    """
+    ):
+        print(f"Error al crear tabla sanciones: {query.lastError().text()}")
+    else:
+        print("Tabla 'sanciones' verificada/creada correctamente")
+
+    # Tarjetas anteriores a la tabla: sus sanciones se dan por cumplidas
+    if not query.exec(
+        f"""
+        INSERT OR IGNORE INTO sanciones (jugador_id, amarillas, rojas, cumplidos)
+        SELECT jugador_id, amarillas, rojas, amarillas / {SQL_UMBRAL_SANCIONES} + rojas
+        FROM (
+            SELECT jugador_id,
+                   SUM(tipo = 'amarilla') AS amarillas,
+                   SUM(tipo = 'roja') AS rojas
+            FROM tarjetas GROUP BY jugador_id
+        )
+    """
+    ):
+        print(f"Error al inicializar sanciones: {query.lastError().text()}")
+
+    # Partido de sanción cumplido en cada partido jugado, para devolverlo si
+    # el partido deja de estar jugado o se borra. Sin clave foránea al
+    # partido: la limpieza la hacen los triggers antes de borrarlo
+    if not query.exec(
+        """
+        CREATE TABLE IF NOT EXISTS sanciones_cumplidas (
+            partido_id INTEGER NOT NULL,
+            jugador_id INTEGER NOT NULL,
+            PRIMARY KEY (partido_id, jugador_id),
+            FOREIGN KEY (jugador_id) REFERENCES participantes(id) ON DELETE CASCADE
+        )
+    """
+    ):
+        print(f"Error al crear tabla sanciones_cumplidas: {query.lastError().text()}")
+    else:
+        print("Tabla 'sanciones_cumplidas' verificada/creada correctamente")
+
+    # Marca de modo_carga_masiva(): solo existe dentro de su transacción
+    if not query.exec(
+        """
+        CREATE TABLE IF NOT EXISTS carga_masiva (
+            activa INTEGER PRIMARY KEY CHECK (activa = 1)
+        )
+    """
+    ):
+        print(f"Error al crear tabla carga_masiva: {query.lastError().text()}")
+    else:
+        print("Tabla 'carga_masiva' verificada/creada correctamente")
+
+    # Tabla de versiones: contador por tabla que incrementan los triggers
+    if not query.exec(
+        """
+        CREATE TABLE IF NOT EXISTS versiones_tablas (
+            tabla TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+    """
+    ):
+        print(f"Error al crear tabla versiones_tablas: {query.lastError().text()}")
+    else:
+        print("Tabla 'versiones_tablas' verificada/creada correctamente")
+
+    query.prepare("INSERT OR IGNORE INTO versiones_tablas (tabla, version) VALUES (?, 0)")
+    for tabla in TABLAS_VERSIONADAS:
+        query.addBindValue(tabla)
+        query.exec()
+
+    # Registro de cambios fila a fila, leído por Models.vigilante_cambios
+    if not query.exec(
+        """
+        CREATE TABLE IF NOT EXISTS registro_cambios (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            tabla TEXT NOT NULL,
+            fila_id INTEGER,
+            operacion TEXT NOT NULL
+        )
+    """
+    ):
+        print(f"Error al crear tabla registro_cambios: {query.lastError().text()}")
+    else:
+        print("Tabla 'registro_cambios' verificada/creada correctamente")
+
+    # Conservar solo las entradas recientes del registro
+    podar_registro_cambios()
+
+
+def podar_registro_cambios(hasta_id=None):
+    """
+    Borra las entradas antiguas de registro_cambios.
+
+    Se conservan las últimas MAX_REGISTRO_CAMBIOS. Quien se quede atrás lo
+    detecta por el hueco en los ids y recarga las tablas completas.
+
+    Args:
+        hasta_id (int, optional): Último id conocido del registro. Por defecto
+            el máximo actual
+
+    Returns:
+        bool: True si se ejecutó correctamente, False en caso contrario
+    """
+    query = QSqlQuery()
+    if hasta_id is None:
+        query.prepare(
+            """
+            DELETE FROM registro_cambios
+            WHERE id <= (SELECT MAX(id) FROM registro_cambios) - ?
+        """
+        )
+        query.addBindValue(MAX_REGISTRO_CAMBIOS)
+    else:
+        query.prepare("DELETE FROM registro_cambios WHERE id <= ?")
+        query.addBindValue(hasta_id - MAX_REGISTRO_CAMBIOS)
+
+    if not query.exec():
+        print(f"Error al podar registro de cambios: {query.lastError().text()}")
+        return False
+    return True
+
+
+def migrar_esquema(query):
+    """
+    Añade a una base de datos existente las columnas de versiones posteriores.
+
+    - partidos.posicion: hueco del partido dentro de su eliminatoria en el
+      cuadro. Los partidos existentes se numeran por orden de fecha.
+
+    Args:
+        query (QSqlQuery): Objeto query para ejecutar sentencias SQL
+    """
+    columnas = set()
+    if query.exec("PRAGMA table_info(partidos)"):
+        while query.next():
+            columnas.add(query.value(1))
+
+    if "posicion" in columnas:
+        return
+
+    if not query.exec("ALTER TABLE partidos ADD COLUMN posicion INTEGER"):
+        print(f"Error al añadir columna posicion: {query.lastError().text()}")
+        return
+
+    if not query.exec(
+        """
+        UPDATE partidos
+        SET posicion = (
+            SELECT COUNT(*) FROM partidos AS anterior
+            WHERE anterior.eliminatoria = partidos.eliminatoria
+              AND (anterior.fecha_hora < partidos.fecha_hora
+                   OR (anterior.fecha_hora = partidos.fecha_hora
+                       AND anterior.id < partidos.id))
+        )
+    """
+    ):
+        print(f"Error al numerar posiciones: {query.lastError().text()}")
+    else:
+        print("Columna 'partidos.posicion' añadida correctamente")
+
 
 def crear_triggers(query):
     """
@@ -267,6 +470,9 @@ def crear_triggers(query):
     - Actualizar contador de tarjetas rojas
     - Actualizar totales de goles en partido
 
+    Ninguno actúa mientras la conexión está en modo_carga_masiva(): la fila
+    de carga_masiva solo la ve la transacción que la insertó.
+
     Args:
         query (QSqlQuery): Objeto query para ejecutar sentencias SQL
     """
@@ -277,6 +483,7 @@ def crear_triggers(query):
         """
         CREATE TRIGGER actualizar_goles_participante
         AFTER INSERT ON goles
+        WHEN NOT EXISTS (SELECT 1 FROM carga_masiva)
         BEGIN
             UPDATE participantes 
             SET goles = goles + 1 
@@ -296,7 +503,7 @@ def crear_triggers(query):
         """
         CREATE TRIGGER actualizar_t_amarillas
         AFTER INSERT ON tarjetas
-        WHEN NEW.tipo = 'amarilla'
+        WHEN NEW.tipo = 'amarilla' AND NOT EXISTS (SELECT 1 FROM carga_masiva)
         BEGIN
             UPDATE participantes 
             SET t_amarillas = t_amarillas + 1 
@@ -316,7 +523,7 @@ def crear_triggers(query):
         """
         CREATE TRIGGER actualizar_t_rojas
         AFTER INSERT ON tarjetas
-        WHEN NEW.tipo = 'roja'
+        WHEN NEW.tipo = 'roja' AND NOT EXISTS (SELECT 1 FROM carga_masiva)
         BEGIN
             UPDATE participantes 
             SET t_rojas = t_rojas + 1 
@@ -334,6 +541,7 @@ def crear_triggers(query):
         """
         CREATE TRIGGER decrementar_goles_participante
         AFTER DELETE ON goles
+        WHEN NOT EXISTS (SELECT 1 FROM carga_masiva)
         BEGIN
             UPDATE participantes 
             SET goles = goles - 1 
@@ -353,7 +561,7 @@ def crear_triggers(query):
         """
         CREATE TRIGGER decrementar_t_amarillas
         AFTER DELETE ON tarjetas
-        WHEN OLD.tipo = 'amarilla'
+        WHEN OLD.tipo = 'amarilla' AND NOT EXISTS (SELECT 1 FROM carga_masiva)
         BEGIN
             UPDATE participantes 
             SET t_amarillas = t_amarillas - 1 
@@ -373,7 +581,7 @@ def crear_triggers(query):
         """
         CREATE TRIGGER decrementar_t_rojas
         AFTER DELETE ON tarjetas
-        WHEN OLD.tipo = 'roja'
+        WHEN OLD.tipo = 'roja' AND NOT EXISTS (SELECT 1 FROM carga_masiva)
         BEGIN
             UPDATE participantes 
             SET t_rojas = t_rojas - 1 
@@ -386,6 +594,166 @@ def crear_triggers(query):
         print("Trigger 'decrementar_t_rojas' creado correctamente")
 
 
+def crear_triggers_sanciones(query):
+    """
+    Crea los triggers que mantienen la tabla sanciones (ver Models.sancion).
+
+    - Al insertar o borrar una tarjeta se suma o resta en el jugador. Al
+      borrarla, los partidos cumplidos no pasan de los que ahora debe.
+    - Al marcar un partido como jugado, los sancionados de ambos equipos que
+      no recibieron tarjetas en él cumplen un partido de sanción, que se
+      anota en sanciones_cumplidas.
+    - Si el partido vuelve a no jugado o se borra, esos jugadores recuperan
+      el partido de sanción que cumplieron en él.
+
+    Args:
+        query (QSqlQuery): Objeto query para ejecutar sentencias SQL
+    """
+    triggers = {
+        "sancion_tarjeta_insertada": """
+            AFTER INSERT ON tarjetas
+            BEGIN
+                INSERT OR IGNORE INTO sanciones (jugador_id) VALUES (NEW.jugador_id);
+                UPDATE sanciones
+                SET amarillas = amarillas + (NEW.tipo = 'amarilla'),
+                    rojas = rojas + (NEW.tipo = 'roja')
+                WHERE jugador_id = NEW.jugador_id;
+            END;
+        """,
+        "sancion_tarjeta_eliminada": f"""
+            AFTER DELETE ON tarjetas
+            BEGIN
+                UPDATE sanciones
+                SET amarillas = MAX(0, amarillas - (OLD.tipo = 'amarilla')),
+                    rojas = MAX(0, rojas - (OLD.tipo = 'roja'))
+                WHERE jugador_id = OLD.jugador_id;
+                -- Sin la tarjeta puede haber cumplido más partidos de los que debe
+                UPDATE sanciones
+                SET cumplidos = MIN(cumplidos, amarillas / {SQL_UMBRAL_SANCIONES} + rojas)
+                WHERE jugador_id = OLD.jugador_id;
+            END;
+        """,
+        "sancion_partido_jugado": f"""
+            AFTER UPDATE OF jugado ON partidos
+            WHEN NEW.jugado = 1 AND OLD.jugado = 0
+            BEGIN
+                INSERT OR IGNORE INTO sanciones_cumplidas (partido_id, jugador_id)
+                SELECT NEW.id, jugador_id FROM sanciones
+                WHERE jugador_id IN (
+                        SELECT jugador_id FROM jugadores_equipos
+                        WHERE equipo_id IN (NEW.equipo_local_id, NEW.equipo_visitante_id)
+                    )
+                  AND amarillas / {SQL_UMBRAL_SANCIONES} + rojas > cumplidos
+                  AND jugador_id NOT IN (
+                        SELECT jugador_id FROM tarjetas WHERE partido_id = NEW.id
+                    );
+                UPDATE sanciones
+                SET cumplidos = cumplidos + 1
+                WHERE jugador_id IN (
+                    SELECT jugador_id FROM sanciones_cumplidas WHERE partido_id = NEW.id
+                );
+            END;
+        """,
+        "sancion_partido_no_jugado": """
+            AFTER UPDATE OF jugado ON partidos
+            WHEN NEW.jugado = 0 AND OLD.jugado = 1
+            BEGIN
+                UPDATE sanciones
+                SET cumplidos = MAX(0, cumplidos - 1)
+                WHERE jugador_id IN (
+                    SELECT jugador_id FROM sanciones_cumplidas WHERE partido_id = OLD.id
+                );
+                DELETE FROM sanciones_cumplidas WHERE partido_id = OLD.id;
+            END;
+        """,
+        "sancion_partido_eliminado": """
+            BEFORE DELETE ON partidos
+            BEGIN
+                UPDATE sanciones
+                SET cumplidos = MAX(0, cumplidos - 1)
+                WHERE jugador_id IN (
+                    SELECT jugador_id FROM sanciones_cumplidas WHERE partido_id = OLD.id
+                );
+                DELETE FROM sanciones_cumplidas WHERE partido_id = OLD.id;
+            END;
+        """,
+    }
+
+    for nombre, cuerpo in triggers.items():
+        query.exec(f"DROP TRIGGER IF EXISTS {nombre}")
+        if not query.exec(f"CREATE TRIGGER {nombre} {cuerpo}"):
+            print(f"Error al crear trigger {nombre}: {query.lastError().text()}")
+        else:
+            print(f"Trigger '{nombre}' creado correctamente")
+
+
+def crear_triggers_versiones(query):
+    """
+    Crea los triggers que registran los cambios de cada tabla versionada.
+
+    Cada inserción, modificación o borrado en una tabla versionada suma uno a
+    su fila de versiones_tablas, de modo que las vistas pueden saber si algo
+    cambió desde la última vez que se mostraron sin releer los datos. Además
+    anota la fila afectada en registro_cambios para que otra instancia de la
+    aplicación que comparta el fichero pueda actualizar solo esas filas.
+
+    En modo_carga_masiva() no actúan: el bloque anota al terminar un único
+    cambio de tabla completa por cada tabla que escribe.
+
+    Args:
+        query (QSqlQuery): Objeto query para ejecutar sentencias SQL
+    """
+    operaciones = (
+        ("INSERT", "NEW", "crear"),
+        ("UPDATE", "NEW", "actualizar"),
+        ("DELETE", "OLD", "eliminar"),
+    )
+    for tabla in TABLAS_VERSIONADAS:
+        # En jugadores_equipos se registra el jugador, igual que en Models.eventos
+        columna_id = "jugador_id" if tabla == "jugadores_equipos" else "id"
+        for operacion, fila, tipo in operaciones:
+            nombre = f"version_{tabla}_{operacion.lower()}"
+            query.exec(f"DROP TRIGGER IF EXISTS {nombre}")
+            if not query.exec(
+                f"""
+                CREATE TRIGGER {nombre}
+                AFTER {operacion} ON {tabla}
+                WHEN NOT EXISTS (SELECT 1 FROM carga_masiva)
+                BEGIN
+                    UPDATE versiones_tablas
+                    SET version = version + 1
+                    WHERE tabla = '{tabla}';
+                    INSERT INTO registro_cambios (tabla, fila_id, operacion)
+                    VALUES ('{tabla}', {fila}.{columna_id}, '{tipo}');
+                END;
+            """
+            ):
+                print(f"Error al crear trigger {nombre}: {query.lastError().text()}")
+
+    print("Triggers de versiones de tablas creados correctamente")
+
+
+def obtener_versiones(tablas=None):
+    """
+    Obtiene el contador de versiones de las tablas indicadas.
+
+    Args:
+        tablas (iterable, optional): Tablas a consultar. None para todas
+
+    Returns:
+        dict: Diccionario {tabla: version}
+    """
+    versiones = {}
+    query = QSqlQuery("SELECT tabla, version FROM versiones_tablas")
+
+    while query.next():
+        versiones[query.value(0)] = query.value(1)
+
+    if tablas is not None:
+        versiones = {tabla: versiones.get(tabla) for tabla in tablas}
+    return versiones
+
+
 def crear_indices(query):
     """
     Crea índices para optimizar las consultas frecuentes.
@@ -399,12 +767,45 @@ def crear_indices(query):
         "CREATE INDEX IF NOT EXISTS idx_jugadores_equipos_equipo ON jugadores_equipos(equipo_id)",
         "CREATE INDEX IF NOT EXISTS idx_partidos_fecha ON partidos(fecha_hora)",
         "CREATE INDEX IF NOT EXISTS idx_partidos_eliminatoria ON partidos(eliminatoria)",
-        "CREATE INDEX IF NOT EXISTS idx_goles_partido ON goles(partido_id)",
+        # Un hueco del cuadro solo puede tener un partido
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_partidos_hueco ON partidos(eliminatoria, posicion)",
+        "CREATE INDEX IF NOT EXISTS idx_partidos_local_fecha ON partidos(equipo_local_id, fecha_hora)",
+        "CREATE INDEX IF NOT EXISTS idx_partidos_visitante_fecha ON partidos(equipo_visitante_id, fecha_hora)",
+        "CREATE INDEX IF NOT EXISTS idx_partidos_arbitro_fecha ON partidos(arbitro_id, fecha_hora)",
+        "CREATE INDEX IF NOT EXISTS idx_goles_partido_minuto ON goles(partido_id, minuto)",
         "CREATE INDEX IF NOT EXISTS idx_goles_jugador ON goles(jugador_id)",
-        "CREATE INDEX IF NOT EXISTS idx_tarjetas_partido ON tarjetas(partido_id)",
+        "CREATE INDEX IF NOT EXISTS idx_tarjetas_partido_minuto ON tarjetas(partido_id, minuto)",
         "CREATE INDEX IF NOT EXISTS idx_tarjetas_jugador ON tarjetas(jugador_id)",
+        # Clasificaciones de Participante._ranking: solo jugadores, en el orden
+        # exacto de la consulta para leer únicamente las primeras filas
+        "CREATE INDEX IF NOT EXISTS idx_ranking_goles ON participantes(goles DESC, id) WHERE es_jugador = 1",
+        "CREATE INDEX IF NOT EXISTS idx_ranking_amarillas ON participantes(t_amarillas DESC, id) WHERE es_jugador = 1",
+        "CREATE INDEX IF NOT EXISTS idx_ranking_rojas ON participantes(t_rojas DESC, id) WHERE es_jugador = 1",
+        "CREATE INDEX IF NOT EXISTS idx_ranking_total ON participantes((t_amarillas + t_rojas) DESC, id) WHERE es_jugador = 1",
     ]
 
+    # Sustituidos por los índices (partido_id, minuto), que cubren su prefijo,
+    # y por la versión única de (eliminatoria, posicion)
+    for obsoleto in (
+        "idx_goles_partido",
+        "idx_tarjetas_partido",
+        "idx_partidos_eliminatoria_posicion",
+    ):
+        query.exec(f"DROP INDEX IF EXISTS {obsoleto}")
+
+    # Bases anteriores al índice único pueden tener huecos repetidos: se deja
+    # el partido más antiguo y los demás reciben hueco al volver a guardarlos
+    if not query.exec(
+        """
+        UPDATE partidos SET posicion = NULL
+        WHERE posicion IS NOT NULL
+          AND id > (SELECT MIN(otro.id) FROM partidos otro
+                    WHERE otro.eliminatoria = partidos.eliminatoria
+                      AND otro.posicion = partidos.posicion)
+    """
+    ):
+        print(f"Error al liberar huecos repetidos: {query.lastError().text()}")
+
     for indice_sql in indices:
         if not query.exec(indice_sql):
             print(f"Error al crear índice: {query.lastError().text()}")
@@ -417,6 +818,284 @@ def crear_indices(query):
             print(f"Índice 'idx_{nombre_indice}' creado correctamente")
 
 
+_en_transaccion = False
+
+
+@contextmanager
+def transaccion():
+    """
+    Ejecuta un bloque de escrituras como una única transacción.
+
+    Los cambios publicados en Models.eventos durante el bloque se notifican
+    solo tras confirmar. Si el bloque lanza una excepción se deshace todo.
+    Un bloque anidado forma parte de la transacción exterior.
+
+    Yields:
+        QSqlDatabase: Conexión sobre la que se abre la transacción
+
+    Raises:
+        Exception: Si no se puede iniciar o confirmar la transacción
+    """
+    global _en_transaccion
+    db = QSqlDatabase.database()
+    if _en_transaccion:
+        yield db
+        return
+
+    if not db.transaction():
+        raise Exception(f"No se pudo iniciar la transacción: {db.lastError().text()}")
+
+    _en_transaccion = True
+    try:
+        with eventos.diferir():
+            yield db
+            if not db.commit():
+                raise Exception(
+                    f"No se pudo confirmar la transacción: {db.lastError().text()}"
+                )
+    except BaseException:
+        db.rollback()
+        raise
+    finally:
+        _en_transaccion = False
+
+
+# Contadores de cada participante calculados a partir de goles y tarjetas
+_CONTADORES_REALES = """
+    WITH reales AS (
+        SELECT p.id,
+               COALESCE(g.goles, 0) AS goles,
+               COALESCE(t.amarillas, 0) AS t_amarillas,
+               COALESCE(t.rojas, 0) AS t_rojas
+        FROM participantes p
+        LEFT JOIN (
+            SELECT jugador_id, COUNT(*) AS goles
+            FROM goles GROUP BY jugador_id
+        ) g ON g.jugador_id = p.id
+        LEFT JOIN (
+            SELECT jugador_id,
+                   SUM(tipo = 'amarilla') AS amarillas,
+                   SUM(tipo = 'roja') AS rojas
+            FROM tarjetas GROUP BY jugador_id
+        ) t ON t.jugador_id = p.id
+    )
+"""
+
+_en_carga_masiva = False
+
+
+@contextmanager
+def modo_carga_masiva(tablas=TABLAS_VERSIONADAS):
+    """
+    Ejecuta escrituras masivas sin mantener contadores ni registro fila a fila.
+
+    El bloque es una única transacción en la que no actúan los triggers de
+    participantes.goles, t_amarillas y t_rojas ni los de versiones_tablas y
+    registro_cambios. Al terminar:
+    - Si se escribieron goles o tarjetas, los contadores se recalculan con
+      una sola sentencia (reconciliar_contadores).
+    - Cada tabla escrita suma una versión y anota en registro_cambios un
+      cambio de tabla completa (fila_id NULL), así que las demás instancias
+      la recargan una vez en lugar de fila a fila.
+    Las demás conexiones no ven la marca y siguen usando los triggers.
+
+    Args:
+        tablas (iterable): Tablas versionadas que escribe el bloque
+
+    Yields:
+        QSqlDatabase: Conexión sobre la que se abre la transacción
+
+    Raises:
+        Exception: Si no se puede activar el modo o reconciliar los contadores
+    """
+    global _en_carga_masiva
+    with transaccion() as db:
+        if _en_carga_masiva:
+            yield db
+            return
+
+        query = QSqlQuery()
+        if not query.exec("INSERT INTO carga_masiva (activa) VALUES (1)"):
+            raise Exception(
+                f"No se pudo activar la carga masiva: {query.lastError().text()}"
+            )
+
+        _en_carga_masiva = True
+        try:
+            yield db
+        finally:
+            _en_carga_masiva = False
+
+        if not query.exec("DELETE FROM carga_masiva"):
+            raise Exception(
+                f"No se pudo desactivar la carga masiva: {query.lastError().text()}"
+            )
+        tablas = [t for t in TABLAS_VERSIONADAS if t in set(tablas)]
+        if "goles" in tablas or "tarjetas" in tablas:
+            reconciliar_contadores()
+        _registrar_cambio_masivo(query, tablas)
+
+
+def _registrar_cambio_masivo(query, tablas):
+    """Anota como cambio de tabla completa lo escrito en modo_carga_masiva()."""
+    for tabla in tablas:
+        query.prepare("UPDATE versiones_tablas SET version = version + 1 WHERE tabla = ?")
+        query.addBindValue(tabla)
+        if not query.exec():
+            raise Exception(f"No se pudo versionar {tabla}: {query.lastError().text()}")
+        query.prepare(
+            "INSERT INTO registro_cambios (tabla, fila_id, operacion) "
+            "VALUES (?, NULL, 'actualizar')"
+        )
+        query.addBindValue(tabla)
+        if not query.exec():
+            raise Exception(
+                f"No se pudo registrar el cambio de {tabla}: {query.lastError().text()}"
+            )
+
+
+def reconciliar_contadores():
+    """
+    Recalcula goles y tarjetas de todos los participantes desde sus tablas.
+
+    Solo se escriben las filas cuyo contador no coincide.
+
+    Returns:
+        int: Número de participantes corregidos
+
+    Raises:
+        Exception: Si falla la actualización
+    """
+    query = QSqlQuery()
+    if not query.exec(
+        _CONTADORES_REALES
+        + """
+        UPDATE participantes
+        SET goles = r.goles, t_amarillas = r.t_amarillas, t_rojas = r.t_rojas
+        FROM reales r
+        WHERE r.id = participantes.id
+          AND (participantes.goles IS NOT r.goles
+               OR participantes.t_amarillas IS NOT r.t_amarillas
+               OR participantes.t_rojas IS NOT r.t_rojas)
+    """
+    ):
+        raise Exception(
+            f"No se pudieron reconciliar los contadores: {query.lastError().text()}"
+        )
+
+    corregidos = query.numRowsAffected()
+    if corregidos > 0:
+        eventos.publicar("participantes", None, eventos.ACTUALIZAR)
+    return corregidos
+
+
+def comprobar_contadores():
+    """
+    Compara los contadores de goles y tarjetas con los registros de goles y tarjetas.
+
+    Returns:
+        list: Descripción de cada contador desviado; vacía si todos coinciden
+    """
+    problemas = []
+    query = QSqlQuery()
+    query.setForwardOnly(True)
+    if not query.exec(
+        _CONTADORES_REALES
+        + """
+        SELECT p.id, p.nombre,
+               p.goles, r.goles, p.t_amarillas, r.t_amarillas, p.t_rojas, r.t_rojas
+        FROM participantes p
+        JOIN reales r ON r.id = p.id
+        WHERE p.goles IS NOT r.goles
+           OR p.t_amarillas IS NOT r.t_amarillas
+           OR p.t_rojas IS NOT r.t_rojas
+        ORDER BY p.id
+    """
+    ):
+        return [f"contadores: {query.lastError().text()}"]
+
+    while query.next():
+        for i, campo in ((2, "goles"), (4, "t_amarillas"), (6, "t_rojas")):
+            guardado, real = query.value(i), query.value(i + 1)
+            if guardado != real:
+                problemas.append(
+                    f"{query.value(1)} (id {query.value(0)}): {campo} = {guardado}, "
+                    f"debería ser {real}"
+                )
+
+    return problemas
+
+
+def comprobar_integridad():
+    """
+    Ejecuta PRAGMA integrity_check y PRAGMA foreign_key_check.
+
+    Returns:
+        list: Problemas encontrados; vacía si la base de datos está bien
+    """
+    problemas = []
+    query = QSqlQuery()
+
+    if query.exec("PRAGMA integrity_check"):
+        while query.next():
+            if query.value(0) != "ok":
+                problemas.append(query.value(0))
+    else:
+        problemas.append(f"integrity_check: {query.lastError().text()}")
+
+    if query.exec("PRAGMA foreign_key_check"):
+        while query.next():
+            problemas.append(
+                f"Clave ajena rota en {query.value(0)} (fila {query.value(1)}) "
+                f"hacia {query.value(2)}"
+            )
+    else:
+        problemas.append(f"foreign_key_check: {query.lastError().text()}")
+
+    return problemas
+
+
+def optimizar():
+    """
+    Actualiza las estadísticas del planificador de consultas y compacta el fichero.
+
+    Returns:
+        bool: True si ANALYZE y VACUUM terminaron correctamente
+    """
+    query = QSqlQuery()
+    for sentencia in ("ANALYZE", "VACUUM"):
+        if not query.exec(sentencia):
+            print(f"Error en {sentencia}: {query.lastError().text()}")
+            return False
+    return True
+
+
+def copia_seguridad(ruta_destino):
+    """
+    Copia la base de datos abierta a otro fichero de forma consistente.
+
+    Usa VACUUM INTO, que lee una instantánea aunque haya otra instancia
+    escribiendo, en lugar de copiar el fichero a mano.
+
+    Args:
+        ruta_destino (str): Fichero a crear; no debe existir
+
+    Returns:
+        bool: True si la copia se creó correctamente
+    """
+    if os.path.exists(ruta_destino):
+        print(f"El fichero de destino ya existe: {ruta_destino}")
+        return False
+
+    query = QSqlQuery()
+    query.prepare("VACUUM INTO ?")
+    query.addBindValue(ruta_destino)
+    if not query.exec():
+        print(f"Error al crear la copia de seguridad: {query.lastError().text()}")
+        return False
+    return True
+
+
 def cerrar_conexion():
     """
     Cierra la conexión a la base de datos de forma segura.
@@ -10,6 +10,8 @@ from datetime import datetime
 import csv
 import os
 
+from . import eventos
+
 
 class Equipo:
     """
@@ -82,6 +84,7 @@ class Equipo:
 
         if query.exec():
             self.id = query.lastInsertId()
+            eventos.publicar("equipos", self.id, eventos.CREAR)
             return True
         else:
             print(f"Error al crear equipo: {query.lastError().text()}")
@@ -109,6 +112,7 @@ class Equipo:
         query.addBindValue(self.id)
 
         if query.exec():
+            eventos.publicar("equipos", self.id, eventos.ACTUALIZAR)
             return True
         else:
             print(f"Error al actualizar equipo: {query.lastError().text()}")
@@ -129,6 +133,7 @@ class Equipo:
         query.addBindValue(self.id)
 
         if query.exec():
+            eventos.publicar("equipos", self.id, eventos.ELIMINAR)
             return True
         else:
             print(f"Error al eliminar equipo: {query.lastError().text()}")
@@ -161,19 +166,25 @@ class Equipo:
         return None
 
     @staticmethod
-    def obtener_todos():
+    def iterar():
         """
-        Obtiene todos los equipos de la base de datos.
+        Recorre todos los equipos ordenados por nombre sin cargarlos en una lista.
 
-        Returns:
-            list: Lista de objetos Equipo
+        La consulta es de solo avance (setForwardOnly). No se deben hacer
+        escrituras mientras el generador está abierto.
+
+        Yields:
+            Equipo: Cada equipo en orden alfabético
         """
-        equipos = []
-        query = QSqlQuery("SELECT * FROM equipos ORDER BY nombre")
+        query = QSqlQuery()
+        query.setForwardOnly(True)
+        if not query.exec("SELECT * FROM equipos ORDER BY nombre"):
+            print(f"Error al leer equipos: {query.lastError().text()}")
+            return
 
-        while query.next():
-            equipos.append(
-                Equipo(
+        try:
+            while query.next():
+                yield Equipo(
                     id=query.value(0),
                     nombre=query.value(1),
                     curso=query.value(2),
@@ -181,9 +192,18 @@ class Equipo:
                     escudo=query.value(4),
                     fecha_creacion=query.value(5),
                 )
-            )
+        finally:
+            query.finish()
 
-        return equipos
+    @staticmethod
+    def obtener_todos():
+        """
+        Obtiene todos los equipos de la base de datos.
+
+        Returns:
+            list: Lista de objetos Equipo
+        """
+        return list(Equipo.iterar())
 
     @staticmethod
     def buscar(texto):
@@ -242,15 +262,31 @@ class Equipo:
             print(f"No se encontró la carpeta de escudos: {ruta_escudos}")
             return []
 
-        # Obtener escudos en uso
-        query = QSqlQuery("SELECT escudo FROM equipos")
-        escudos_en_uso = []
+        # Filtrar escudos disponibles
+        escudos_en_uso = set(Equipo.obtener_escudos_en_uso().values())
+        return sorted(set(todos_escudos) - escudos_en_uso)
+
+    @staticmethod
+    def obtener_escudos_en_uso():
+        """
+        Obtiene el escudo asignado a cada equipo.
+
+        Returns:
+            dict: ID de equipo -> nombre del archivo; solo equipos con escudo
+        """
+        escudos = {}
+        query = QSqlQuery()
+        query.setForwardOnly(True)
+        if not query.exec(
+            "SELECT id, escudo FROM equipos WHERE escudo IS NOT NULL AND escudo != ''"
+        ):
+            print(f"Error al obtener escudos en uso: {query.lastError().text()}")
+            return escudos
+
         while query.next():
-            escudos_en_uso.append(query.value(0))
+            escudos[query.value(0)] = query.value(1)
 
-        # Filtrar escudos disponibles
-        escudos_disponibles = [e for e in todos_escudos if e not in escudos_en_uso]
-        return sorted(escudos_disponibles)
+        return escudos
 
     @staticmethod
     def contar_jugadores(equipo_id):
@@ -274,16 +310,20 @@ class Equipo:
     @staticmethod
     def obtener_jugadores(equipo_id):
         """
-        Obtiene todos los jugadores de un equipo.
+        Obtiene la plantilla de un equipo con sus estadísticas.
+
+        Es la consulta de plantilla de referencia: un único JOIN en lugar de
+        leer los IDs de jugadores_equipos y después cada participante.
 
         Args:
             equipo_id (int): ID del equipo
 
         Returns:
-            list: Lista de diccionarios con información de los jugadores
+            list: Lista de diccionarios con id, nombre, posicion, goles, t_amarillas y t_rojas
         """
         jugadores = []
         query = QSqlQuery()
+        query.setForwardOnly(True)
         query.prepare(
             """
             SELECT p.id, p.nombre, p.posicion, p.goles, p.t_amarillas, p.t_rojas
@@ -347,7 +387,19 @@ class Equipo:
             bool: True si se exportó correctamente, False en caso contrario
         """
         try:
-            equipos = Equipo.obtener_todos()
+            # Número de jugadores en la misma consulta, sin una por equipo
+            query = QSqlQuery()
+            query.setForwardOnly(True)
+            if not query.exec(
+                """
+                SELECT e.id, e.nombre, e.curso, e.color, e.escudo, e.fecha_creacion,
+                       (SELECT COUNT(*) FROM jugadores_equipos je
+                        WHERE je.equipo_id = e.id)
+                FROM equipos e
+                ORDER BY e.nombre
+                """
+            ):
+                raise Exception(query.lastError().text())
 
             with open(ruta_archivo, "w", newline="", encoding="utf-8") as archivo:
                 escritor = csv.writer(archivo)
@@ -363,19 +415,8 @@ class Equipo:
                     ]
                 )
 
-                for equipo in equipos:
-                    num_jugadores = Equipo.contar_jugadores(equipo.id)
-                    escritor.writerow(
-                        [
-                            equipo.id,
-                            equipo.nombre,
-                            equipo.curso,
-                            equipo.color,
-                            equipo.escudo,
-                            equipo.fecha_creacion,
-                            num_jugadores,
-                        ]
-                    )
+                while query.next():
+                    escritor.writerow([query.value(i) for i in range(7)])
 
             return True
         except Exception as e:
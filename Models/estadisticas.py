@@ -0,0 +1,181 @@
+"""
+Consultas agregadas de la página de estadísticas.
+
+Cada consulta devuelve un resultado pequeño calculado en SQL: los goleadores
+salen del índice parcial idx_ranking_goles con LIMIT, y las tarjetas por
+equipo y los goles por eliminatoria de un GROUP BY. Todas aceptan un filtro
+para recalcular solo la fila afectada por un cambio.
+"""
+
+from PySide6.QtSql import QSqlQuery
+
+# Filas de la tabla de máximos goleadores
+MAX_GOLEADORES = 20
+
+
+class Estadisticas:
+    """
+    Clase con las consultas agregadas del torneo.
+    """
+
+    _SELECT_JUGADOR = """
+        SELECT p.id, p.nombre, p.goles, p.t_amarillas, p.t_rojas, e.id, e.nombre
+        FROM participantes p
+        LEFT JOIN jugadores_equipos je ON je.jugador_id = p.id
+        LEFT JOIN equipos e ON e.id = je.equipo_id
+    """
+
+    @staticmethod
+    def _jugador(query):
+        return {
+            "id": query.value(0),
+            "nombre": query.value(1),
+            "goles": query.value(2),
+            "t_amarillas": query.value(3),
+            "t_rojas": query.value(4),
+            "equipo_id": query.value(5) or None,
+            "equipo": query.value(6) or "",
+        }
+
+    @staticmethod
+    def goleadores(limite=MAX_GOLEADORES):
+        """
+        Obtiene los jugadores con más goles.
+
+        Args:
+            limite (int): Número máximo de jugadores
+
+        Returns:
+            list: Diccionarios de jugador (id, nombre, goles, t_amarillas,
+                  t_rojas, equipo_id, equipo) ordenados por goles e id
+        """
+        goleadores = []
+        query = QSqlQuery()
+        query.setForwardOnly(True)
+        # Mismo filtro y orden que idx_ranking_goles: se leen solo 'limite' filas
+        query.prepare(
+            Estadisticas._SELECT_JUGADOR
+            + """
+            WHERE p.es_jugador = 1 AND p.goles > 0
+            ORDER BY p.goles DESC, p.id
+            LIMIT ?
+        """
+        )
+        query.addBindValue(limite)
+
+        if not query.exec():
+            print(f"Error al obtener goleadores: {query.lastError().text()}")
+            return goleadores
+
+        while query.next():
+            goleadores.append(Estadisticas._jugador(query))
+
+        return goleadores
+
+    @staticmethod
+    def obtener_jugador(jugador_id):
+        """
+        Obtiene los contadores y el equipo de un jugador.
+
+        Args:
+            jugador_id (int): ID del participante
+
+        Returns:
+            dict: Diccionario de jugador, o None si no existe o no es jugador
+        """
+        query = QSqlQuery()
+        query.prepare(
+            Estadisticas._SELECT_JUGADOR + " WHERE p.id = ? AND p.es_jugador = 1"
+        )
+        query.addBindValue(jugador_id)
+
+        if query.exec() and query.next():
+            return Estadisticas._jugador(query)
+        return None
+
+    @staticmethod
+    def tarjetas_por_equipo(equipo_id=None):
+        """
+        Suma las tarjetas de los jugadores de cada equipo.
+
+        Args:
+            equipo_id (int, optional): Calcular solo este equipo
+
+        Returns:
+            list: Diccionarios con id, nombre, amarillas y rojas del equipo
+        """
+        equipos = []
+        query = QSqlQuery()
+        query.setForwardOnly(True)
+        query.prepare(
+            f"""
+            SELECT e.id, e.nombre,
+                   COALESCE(SUM(p.t_amarillas), 0), COALESCE(SUM(p.t_rojas), 0)
+            FROM equipos e
+            LEFT JOIN jugadores_equipos je ON je.equipo_id = e.id
+            LEFT JOIN participantes p ON p.id = je.jugador_id
+            {"WHERE e.id = ?" if equipo_id is not None else ""}
+            GROUP BY e.id
+        """
+        )
+        if equipo_id is not None:
+            query.addBindValue(equipo_id)
+
+        if not query.exec():
+            print(f"Error al obtener tarjetas por equipo: {query.lastError().text()}")
+            return equipos
+
+        while query.next():
+            equipos.append(
+                {
+                    "id": query.value(0),
+                    "nombre": query.value(1),
+                    "amarillas": query.value(2),
+                    "rojas": query.value(3),
+                }
+            )
+
+        return equipos
+
+    @staticmethod
+    def goles_por_eliminatoria(eliminatoria=None):
+        """
+        Cuenta partidos jugados y goles de cada eliminatoria.
+
+        Args:
+            eliminatoria (str, optional): Calcular solo esta eliminatoria
+
+        Returns:
+            list: Diccionarios con eliminatoria, jugados y goles
+        """
+        rondas = []
+        query = QSqlQuery()
+        query.setForwardOnly(True)
+        query.prepare(
+            f"""
+            SELECT eliminatoria, COUNT(*),
+                   COALESCE(SUM(goles_local + goles_visitante), 0)
+            FROM partidos
+            WHERE jugado = 1 {"AND eliminatoria = ?" if eliminatoria else ""}
+            GROUP BY eliminatoria
+        """
+        )
+        if eliminatoria:
+            query.addBindValue(eliminatoria)
+
+        if not query.exec():
+            print(
+                f"Error al obtener goles por eliminatoria: {query.lastError().text()}"
+            )
+            return rondas
+
+        while query.next():
+            rondas.append(
+                {
+                    "eliminatoria": query.value(0),
+                    "jugados": query.value(1),
+                    "goles": query.value(2),
+                }
+            )
+
+        return rondas
@@ -0,0 +1,132 @@
+"""
+Bus de notificación de cambios del modelo.
+
+Los modelos publican un Cambio (entidad, id, operación) después de cada
+escritura correcta en la base de datos. Las vistas se suscriben a las
+entidades que muestran y actualizan solo las filas afectadas en lugar de
+volver a consultar todas las tablas.
+
+Las entidades se identifican por el nombre de su tabla ("partidos",
+"equipos", "participantes", "jugadores_equipos", "goles", "tarjetas").
+En "jugadores_equipos" el id publicado es el del jugador, ya que cada
+jugador pertenece a un único equipo.
+
+Dentro de database.transaccion() los cambios se retienen y solo se
+notifican si la transacción se confirma.
+"""
+
+from contextlib import contextmanager
+
+CREAR = "crear"
+ACTUALIZAR = "actualizar"
+ELIMINAR = "eliminar"
+
+_suscriptores = []
+# Cambios retenidos mientras hay un bloque diferir() abierto
+_diferidos = None
+
+
+class Cambio:
+    """
+    Clase que representa un cambio realizado sobre una fila de la base de datos.
+
+    Attributes:
+        entidad (str): Nombre de la tabla afectada
+        id (int): ID de la fila afectada, o None si afecta a varias filas
+        operacion (str): Tipo de operación (crear, actualizar o eliminar)
+    """
+
+    __slots__ = ("entidad", "id", "operacion")
+
+    def __init__(self, entidad, id, operacion):
+        """
+        Inicializa un objeto Cambio.
+        """
+        self.entidad = entidad
+        self.id = id
+        self.operacion = operacion
+
+    def __repr__(self):
+        """
+        Representación técnica del cambio.
+
+        Returns:
+            str: Representación con atributos principales
+        """
+        return f"Cambio(entidad='{self.entidad}', id={self.id}, operacion='{self.operacion}')"
+
+
+def suscribir(callback, entidades=None):
+    """
+    Registra una función que se llamará con cada Cambio publicado.
+
+    Args:
+        callback (callable): Función que recibe un objeto Cambio
+        entidades (iterable, optional): Entidades de interés. None para todas
+    """
+    filtro = frozenset(entidades) if entidades else None
+    _suscriptores.append((callback, filtro))
+
+
+def desuscribir(callback):
+    """
+    Elimina todas las suscripciones de una función.
+
+    Args:
+        callback (callable): Función registrada previamente con suscribir()
+    """
+    _suscriptores[:] = [(c, f) for c, f in _suscriptores if c != callback]
+
+
+def publicar(entidad, id, operacion):
+    """
+    Notifica un cambio a todos los suscriptores interesados en la entidad.
+
+    Los errores de un suscriptor se registran y no impiden notificar al resto
+    ni afectan a la escritura que originó el cambio.
+
+    Args:
+        entidad (str): Nombre de la tabla afectada
+        id (int): ID de la fila afectada, o None si afecta a varias filas
+        operacion (str): Tipo de operación (crear, actualizar o eliminar)
+    """
+    cambio = Cambio(entidad, id, operacion)
+    if _diferidos is not None:
+        _diferidos.append(cambio)
+        return
+    _notificar(cambio)
+
+
+@contextmanager
+def diferir():
+    """
+    Retiene las publicaciones hasta salir del bloque.
+
+    Si el bloque termina con una excepción los cambios retenidos se
+    descartan. Los bloques anidados se integran en el más externo.
+    """
+    global _diferidos
+    if _diferidos is not None:
+        yield
+        return
+
+    _diferidos = []
+    try:
+        yield
+    except BaseException:
+        _diferidos = None
+        raise
+
+    pendientes, _diferidos = _diferidos, None
+    for cambio in pendientes:
+        _notificar(cambio)
+
+
+def _notificar(cambio):
+    for callback, filtro in list(_suscriptores):
+        if filtro is not None and cambio.entidad not in filtro:
+            continue
+        try:
+            callback(cambio)
+        except Exception as e:
+            print(f"Error al notificar {cambio}: {e}")
@@ -6,6 +6,8 @@ Este módulo gestiona el registro de goles en los partidos.
 
 from PySide6.QtSql import QSqlQuery
 
+from . import eventos
+
 
 class Gol:
     """
@@ -47,6 +49,9 @@ class Gol:
 
         if query.exec():
             self.id = query.lastInsertId()
+            eventos.publicar("goles", self.id, eventos.CREAR)
+            # El trigger actualiza el contador del jugador
+            eventos.publicar("participantes", self.jugador_id, eventos.ACTUALIZAR)
             return True
         else:
             print(f"Error al registrar gol: {query.lastError().text()}")
@@ -67,6 +72,9 @@ class Gol:
         query.addBindValue(self.id)
 
         if query.exec():
+            eventos.publicar("goles", self.id, eventos.ELIMINAR)
+            if self.jugador_id:
+                eventos.publicar("participantes", self.jugador_id, eventos.ACTUALIZAR)
             return True
         else:
             print(f"Error al eliminar gol: {query.lastError().text()}")
@@ -75,23 +83,25 @@ class Gol:
     @staticmethod
     def obtener_por_partido(partido_id):
         """
-        Obtiene todos los goles de un partido específico.
+        Obtiene los goles de un partido en orden cronológico, uno por gol.
+
+        Recorre el índice (partido_id, minuto); los goles sin minuto van al final.
 
         Args:
             partido_id (int): ID del partido
 
         Returns:
-            list: Lista de diccionarios con información de goles
+            list: Lista de objetos Gol
         """
         goles = []
         query = QSqlQuery()
+        query.setForwardOnly(True)
         query.prepare(
             """
-            SELECT g.id, g.partido_id, g.jugador_id, g.minuto, COUNT(*) as cantidad
-            FROM goles g
-            WHERE g.partido_id = ?
-            GROUP BY g.jugador_id
-            ORDER BY g.minuto
+            SELECT id, partido_id, jugador_id, minuto
+            FROM goles
+            WHERE partido_id = ?
+            ORDER BY minuto IS NULL, minuto, id
         """
         )
         query.addBindValue(partido_id)
@@ -99,13 +109,12 @@ class Gol:
         if query.exec():
             while query.next():
                 goles.append(
-                    {
-                        "id": query.value(0),
-                        "partido_id": query.value(1),
-                        "jugador_id": query.value(2),
-                        "minuto": query.value(3),
-                        "cantidad": query.value(4),
-                    }
+                    Gol(
+                        id=query.value(0),
+                        partido_id=query.value(1),
+                        jugador_id=query.value(2),
+                        minuto=query.value(3),
+                    )
                 )
 
         return goles
@@ -171,11 +180,23 @@ class Gol:
         Returns:
             bool: True si se eliminaron correctamente, False en caso contrario
         """
+        # Jugadores cuyos contadores modificarán los triggers al borrar
+        jugadores_ids = []
+        query = QSqlQuery()
+        query.prepare("SELECT DISTINCT jugador_id FROM goles WHERE partido_id = ?")
+        query.addBindValue(partido_id)
+        if query.exec():
+            while query.next():
+                jugadores_ids.append(query.value(0))
+
         query = QSqlQuery()
         query.prepare("DELETE FROM goles WHERE partido_id = ?")
         query.addBindValue(partido_id)
 
         if query.exec():
+            eventos.publicar("goles", None, eventos.ELIMINAR)
+            for jugador_id in jugadores_ids:
+                eventos.publicar("participantes", jugador_id, eventos.ACTUALIZAR)
             return True
         else:
             print(f"Error al eliminar goles del partido: {query.lastError().text()}")
@@ -204,6 +225,42 @@ class Gol:
 
         return exito
 
+    @staticmethod
+    def sincronizar_partido(partido_id, goles_por_jugador, minuto=None):
+        """
+        Ajusta los goles de un partido a las cantidades indicadas por jugador.
+
+        Solo se insertan los goles nuevos (con el minuto indicado) y se borran
+        los que sobran, empezando por los más recientes. Los goles que no
+        cambian conservan su fila y su minuto.
+
+        Args:
+            partido_id (int): ID del partido
+            goles_por_jugador (dict): {jugador_id: goles en el partido}
+            minuto (int, optional): Minuto de juego de los goles nuevos
+
+        Returns:
+            bool: True si todos los cambios se guardaron correctamente
+        """
+        actuales = {}
+        for gol in Gol.obtener_por_partido(partido_id):
+            actuales.setdefault(gol.jugador_id, []).append(gol)
+
+        exito = True
+        for jugador_id in set(actuales) | set(goles_por_jugador):
+            registrados = actuales.get(jugador_id, [])
+            objetivo = goles_por_jugador.get(jugador_id, 0)
+
+            for _ in range(objetivo - len(registrados)):
+                gol = Gol(partido_id=partido_id, jugador_id=jugador_id, minuto=minuto)
+                exito = gol.guardar() and exito
+
+            # Los que sobran se quitan del final de la cronología
+            for gol in registrados[objetivo:][::-1]:
+                exito = gol.eliminar() and exito
+
+        return exito
+
     def __repr__(self):
         """
         Representación técnica del gol.
@@ -0,0 +1,381 @@
+"""
+Importación masiva desde CSV de equipos, participantes y plantillas.
+
+Los ficheros se leen fila a fila, sin cargarlos enteros en memoria. Cada
+fila se valida al leerla y las erróneas se saltan anotando su número de
+línea. Las válidas se acumulan en lotes que se insertan con una única
+sentencia preparada, ejecutada fila a fila dentro de una transacción por
+lote. No se usa execBatch: el driver QSQLITE lo emula y su coste crece con
+el cuadrado del tamaño del lote.
+
+Cada lote se escribe en database.modo_carga_masiva(), sin los triggers de
+versiones y registro de cambios fila a fila. Si la base de datos rechaza
+alguna fila (clave foránea, duplicado), el lote se deshace y se repite fila a
+fila, de modo que solo se descartan las rechazadas, con su número de línea.
+
+Las cabeceras son las mismas que generan los exportadores, de modo que un
+CSV exportado se puede volver a importar. Las columnas calculadas (ID,
+Edad, Categoría, Jugadores, contadores) se ignoran.
+
+- equipos: Nombre, Curso, Color, Escudo [, Fecha Creación]
+- participantes: Nombre, Fecha Nacimiento, Curso, Es Jugador, Es Árbitro [, Posición]
+- jugadores_equipos: Jugador, Equipo [, Fecha Asignación]
+"""
+
+import csv
+from datetime import datetime
+
+from PySide6.QtSql import QSqlQuery
+
+from . import database, eventos
+from .jugador_equipo import JugadorEquipo
+from .participante import Participante
+
+# Filas válidas que se insertan en cada transacción
+TAMANO_LOTE = 5000
+
+# Formato de las fechas de alta (fecha_creacion, fecha_asignacion)
+FORMATO_FECHA_HORA = "%Y-%m-%d %H:%M:%S"
+
+COLUMNAS_OBLIGATORIAS = {
+    "equipos": ("Nombre", "Curso", "Color", "Escudo"),
+    "participantes": ("Nombre", "Fecha Nacimiento", "Curso", "Es Jugador", "Es Árbitro"),
+    "jugadores_equipos": ("Jugador", "Equipo"),
+}
+
+_VERDADERO = {"sí", "si", "s", "1", "true", "x"}
+_FALSO = {"no", "n", "0", "false", ""}
+
+
+class ErrorImportacion(Exception):
+    """Error de validación de una fila; el mensaje se muestra al usuario."""
+
+
+class ResultadoImportacion:
+    """
+    Clase que resume el resultado de una importación.
+
+    Attributes:
+        tipo (str): Tabla importada
+        insertadas (int): Filas guardadas
+        errores (list): Tuplas (línea, mensaje) de las filas descartadas
+    """
+
+    def __init__(self, tipo):
+        """
+        Inicializa un resultado vacío.
+        """
+        self.tipo = tipo
+        self.insertadas = 0
+        self.errores = []
+
+    def resumen(self, max_errores=20):
+        """
+        Describe el resultado para mostrarlo al usuario.
+
+        Args:
+            max_errores (int): Errores que se detallan como máximo
+
+        Returns:
+            str: Texto con filas importadas y errores por línea
+        """
+        lineas = [f"{self.insertadas} fila(s) importada(s) en {self.tipo}"]
+        if self.errores:
+            lineas.append(f"{len(self.errores)} fila(s) con errores:")
+            for linea, mensaje in self.errores[:max_errores]:
+                lineas.append(f"  Línea {linea}: {mensaje}")
+            if len(self.errores) > max_errores:
+                lineas.append(f"  ... y {len(self.errores) - max_errores} más")
+        return "\n".join(lineas)
+
+
+def detectar_tipo(ruta_archivo):
+    """
+    Deduce qué se importa a partir de la cabecera del CSV.
+
+    Args:
+        ruta_archivo (str): Ruta del fichero CSV
+
+    Returns:
+        str: "equipos", "participantes" o "jugadores_equipos", o None si no se reconoce
+    """
+    with open(ruta_archivo, newline="", encoding="utf-8-sig") as archivo:
+        cabecera = set(next(csv.reader(archivo), []))
+
+    for tipo in ("participantes", "jugadores_equipos", "equipos"):
+        if set(COLUMNAS_OBLIGATORIAS[tipo]) <= cabecera:
+            return tipo
+    return None
+
+
+def importar(tipo, ruta_archivo):
+    """
+    Importa un CSV en la tabla indicada.
+
+    Args:
+        tipo (str): "equipos", "participantes" o "jugadores_equipos"
+        ruta_archivo (str): Ruta del fichero CSV
+
+    Returns:
+        ResultadoImportacion: Filas insertadas y errores por línea
+
+    Raises:
+        ErrorImportacion: Si falta alguna columna obligatoria
+    """
+    importadores = {
+        "equipos": _Importador(
+            "equipos",
+            "INSERT INTO equipos (nombre, curso, color, escudo, fecha_creacion) "
+            "VALUES (?, ?, ?, ?, ?)",
+            _ValidadorEquipos(),
+        ),
+        "participantes": _Importador(
+            "participantes",
+            "INSERT INTO participantes "
+            "(nombre, fecha_nacimiento, curso, es_jugador, es_arbitro, posicion) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            _ValidadorParticipantes(),
+        ),
+        "jugadores_equipos": _Importador(
+            "jugadores_equipos",
+            "INSERT INTO jugadores_equipos (jugador_id, equipo_id, fecha_asignacion) "
+            "VALUES (?, ?, ?)",
+            _ValidadorPlantillas(),
+        ),
+    }
+    if tipo not in importadores:
+        raise ErrorImportacion(f"Tipo de importación desconocido: {tipo}")
+    return importadores[tipo].ejecutar(ruta_archivo)
+
+
+class _Importador:
+    def __init__(self, tabla, sql, validador):
+        self.tabla = tabla
+        self.sql = sql
+        self.validador = validador
+
+    def ejecutar(self, ruta_archivo):
+        resultado = ResultadoImportacion(self.tabla)
+
+        with open(ruta_archivo, newline="", encoding="utf-8-sig") as archivo:
+            lector = csv.DictReader(archivo)
+            faltan = [
+                c
+                for c in COLUMNAS_OBLIGATORIAS[self.tabla]
+                if c not in (lector.fieldnames or [])
+            ]
+            if faltan:
+                raise ErrorImportacion(
+                    f"Faltan columnas obligatorias: {', '.join(faltan)}"
+                )
+
+            lote = []
+            for fila in lector:
+                try:
+                    lote.append((lector.line_num, self.validador.validar(fila)))
+                except ErrorImportacion as e:
+                    resultado.errores.append((lector.line_num, str(e)))
+                    continue
+
+                if len(lote) >= TAMANO_LOTE:
+                    resultado.insertadas += self._insertar(lote, resultado.errores)
+                    lote = []
+
+            if lote:
+                resultado.insertadas += self._insertar(lote, resultado.errores)
+
+        # Los rechazos de la base de datos llegan tras los de validación
+        resultado.errores.sort(key=lambda error: error[0])
+        return resultado
+
+    def _insertar(self, lote, errores):
+        """
+        Inserta un lote en una transacción; devuelve las filas guardadas.
+
+        Si alguna fila falla, el lote se repite fila a fila y las rechazadas
+        se anotan en errores como (línea, mensaje).
+        """
+        with database.modo_carga_masiva((self.tabla,)):
+            # Se prepara una vez y se reutiliza en cada fila
+            query = QSqlQuery()
+            query.prepare(self.sql)
+            control = QSqlQuery()
+
+            control.exec("SAVEPOINT lote")
+            if all(self._insertar_fila(query, valores) for _, valores in lote):
+                insertadas = len(lote)
+            else:
+                control.exec("ROLLBACK TO lote")
+                insertadas = 0
+                for linea, valores in lote:
+                    control.exec("SAVEPOINT fila")
+                    if self._insertar_fila(query, valores):
+                        insertadas += 1
+                    else:
+                        errores.append((linea, query.lastError().text()))
+                        control.exec("ROLLBACK TO fila")
+                    control.exec("RELEASE fila")
+            control.exec("RELEASE lote")
+
+            if insertadas:
+                eventos.publicar(self.tabla, None, eventos.CREAR)
+
+        return insertadas
+
+    @staticmethod
+    def _insertar_fila(query, valores):
+        for valor in valores:
+            query.addBindValue(valor)
+        return query.exec()
+
+
+def _texto(fila, columna, obligatorio=True):
+    valor = (fila.get(columna) or "").strip()
+    if obligatorio and not valor:
+        raise ErrorImportacion(f"'{columna}' está vacío")
+    return valor
+
+
+def _booleano(fila, columna):
+    valor = _texto(fila, columna, obligatorio=False).lower()
+    if valor in _VERDADERO:
+        return True
+    if valor in _FALSO:
+        return False
+    raise ErrorImportacion(f"'{columna}' debe ser Sí o No, no '{valor}'")
+
+
+def _fecha(fila, columna, obligatorio=True, con_hora=False):
+    """Lee una fecha; con_hora la guarda con la hora, como hacen los modelos."""
+    valor = _texto(fila, columna, obligatorio)
+    if not valor:
+        return None
+    # Los exportadores escriben las fechas de alta con la hora
+    for formato in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d", "%d/%m/%Y"):
+        try:
+            fecha = datetime.strptime(valor, formato)
+        except ValueError:
+            continue
+        return fecha.strftime(FORMATO_FECHA_HORA if con_hora else "%Y-%m-%d")
+    raise ErrorImportacion(f"'{columna}' no es una fecha válida: '{valor}'")
+
+
+def _columna_unica(sql):
+    """Valores de una columna ya guardados, en minúsculas."""
+    valores = set()
+    query = QSqlQuery()
+    query.setForwardOnly(True)
+    if query.exec(sql):
+        while query.next():
+            valores.add(str(query.value(0)).lower())
+    return valores
+
+
+class _ValidadorEquipos:
+    def __init__(self):
+        self.nombres = _columna_unica("SELECT nombre FROM equipos")
+        self.escudos = _columna_unica("SELECT escudo FROM equipos")
+        self.ahora = datetime.now().strftime(FORMATO_FECHA_HORA)
+
+    def validar(self, fila):
+        nombre = _texto(fila, "Nombre")
+        escudo = _texto(fila, "Escudo")
+        if nombre.lower() in self.nombres:
+            raise ErrorImportacion(f"Ya existe un equipo llamado '{nombre}'")
+        if escudo.lower() in self.escudos:
+            raise ErrorImportacion(f"El escudo '{escudo}' ya está en uso")
+
+        fila_valida = (
+            nombre,
+            _texto(fila, "Curso"),
+            _texto(fila, "Color"),
+            escudo,
+            _fecha(fila, "Fecha Creación", obligatorio=False, con_hora=True)
+            or self.ahora,
+        )
+        self.nombres.add(nombre.lower())
+        self.escudos.add(escudo.lower())
+        return fila_valida
+
+
+class _ValidadorParticipantes:
+    def __init__(self):
+        self.posiciones = {p.lower(): p for p in Participante.POSICIONES}
+
+    def validar(self, fila):
+        nombre = _texto(fila, "Nombre")
+        fecha = _fecha(fila, "Fecha Nacimiento")
+        curso = _texto(fila, "Curso")
+        es_jugador = _booleano(fila, "Es Jugador")
+        es_arbitro = _booleano(fila, "Es Árbitro")
+        if not es_jugador and not es_arbitro:
+            raise ErrorImportacion("Debe ser jugador, árbitro o ambos")
+
+        posicion = None
+        texto_posicion = _texto(fila, "Posición", obligatorio=False)
+        if es_jugador and texto_posicion:
+            posicion = self.posiciones.get(texto_posicion.lower())
+            if posicion is None:
+                raise ErrorImportacion(f"Posición desconocida: '{texto_posicion}'")
+
+        return (nombre, fecha, curso, int(es_jugador), int(es_arbitro), posicion)
+
+
+class _ValidadorPlantillas:
+    def __init__(self):
+        self.equipos = {}
+        query = QSqlQuery()
+        query.setForwardOnly(True)
+        if query.exec("SELECT id, nombre FROM equipos"):
+            while query.next():
+                self.equipos[query.value(1).lower()] = query.value(0)
+
+        # Nombre de jugador -> IDs (puede haber homónimos)
+        self.jugadores = {}
+        if query.exec("SELECT id, nombre FROM participantes WHERE es_jugador = 1"):
+            while query.next():
+                self.jugadores.setdefault(query.value(1).lower(), []).append(
+                    query.value(0)
+                )
+
+        # Mismo tope que el resto de la aplicación (configuracion)
+        self.max_jugadores = JugadorEquipo.obtener_max_jugadores()
+        self.con_equipo = set()
+        self.plazas = {}
+        if query.exec("SELECT jugador_id, equipo_id FROM jugadores_equipos"):
+            while query.next():
+                self.con_equipo.add(query.value(0))
+                self.plazas[query.value(1)] = self.plazas.get(query.value(1), 0) + 1
+
+        self.ahora = datetime.now().strftime(FORMATO_FECHA_HORA)
+
+    def validar(self, fila):
+        nombre_jugador = _texto(fila, "Jugador")
+        nombre_equipo = _texto(fila, "Equipo")
+
+        equipo_id = self.equipos.get(nombre_equipo.lower())
+        if equipo_id is None:
+            raise ErrorImportacion(f"No existe el equipo '{nombre_equipo}'")
+
+        ids = self.jugadores.get(nombre_jugador.lower(), [])
+        if not ids:
+            raise ErrorImportacion(f"No existe el jugador '{nombre_jugador}'")
+        if len(ids) > 1:
+            raise ErrorImportacion(f"Hay varios jugadores llamados '{nombre_jugador}'")
+        jugador_id = ids[0]
+
+        if jugador_id in self.con_equipo:
+            raise ErrorImportacion(f"'{nombre_jugador}' ya tiene equipo")
+        if self.plazas.get(equipo_id, 0) >= self.max_jugadores:
+            raise ErrorImportacion(
+                f"'{nombre_equipo}' ya tiene {self.max_jugadores} jugadores"
+            )
+
+        self.con_equipo.add(jugador_id)
+        self.plazas[equipo_id] = self.plazas.get(equipo_id, 0) + 1
+        return (
+            jugador_id,
+            equipo_id,
+            _fecha(fila, "Fecha Asignación", obligatorio=False, con_hora=True)
+            or self.ahora,
+        )
@@ -7,6 +7,10 @@ Este módulo gestiona la asignación de jugadores a equipos.
 from PySide6.QtSql import QSqlQuery
 from datetime import datetime
 
+from . import eventos
+
+MAX_JUGADORES_POR_DEFECTO = 18
+
 
 class JugadorEquipo:
     """
@@ -50,6 +54,7 @@ class JugadorEquipo:
 
         if query.exec():
             self.id = query.lastInsertId()
+            eventos.publicar("jugadores_equipos", self.jugador_id, eventos.CREAR)
             return True
         else:
             print(f"Error al asignar jugador a equipo: {query.lastError().text()}")
@@ -70,6 +75,7 @@ class JugadorEquipo:
         query.addBindValue(self.id)
 
         if query.exec():
+            eventos.publicar("jugadores_equipos", self.jugador_id, eventos.ELIMINAR)
             return True
         else:
             print(f"Error al eliminar asignación: {query.lastError().text()}")
@@ -110,6 +116,7 @@ class JugadorEquipo:
         query.addBindValue(equipo_id)
 
         if query.exec():
+            eventos.publicar("jugadores_equipos", jugador_id, eventos.ELIMINAR)
             return True
         else:
             print(f"Error al desasignar jugador: {query.lastError().text()}")
@@ -189,15 +196,35 @@ class JugadorEquipo:
         return 0
 
     @staticmethod
-    def equipo_completo(equipo_id, max_jugadores=18):
+    def obtener_max_jugadores():
+        """
+        Obtiene el máximo de jugadores por equipo configurado.
+
+        Returns:
+            int: Clave max_jugadores_equipo de configuracion, o el valor por
+                 defecto si falta o no es válida
+        """
+        query = QSqlQuery(
+            "SELECT CAST(valor AS INTEGER) FROM configuracion "
+            "WHERE clave = 'max_jugadores_equipo'"
+        )
+        if query.next() and query.value(0):
+            return query.value(0)
+        return MAX_JUGADORES_POR_DEFECTO
+
+    @staticmethod
+    def equipo_completo(equipo_id, max_jugadores=None):
         """
         Verifica si un equipo ya alcanzó el máximo de jugadores permitidos.
 
         Args:
             equipo_id (int): ID del equipo
-            max_jugadores (int): Máximo de jugadores permitidos (por defecto 18)
+            max_jugadores (int, optional): Máximo de jugadores permitidos.
+                Por defecto el configurado (obtener_max_jugadores)
 
         Returns:
             bool: True si está completo, False si aún puede añadir jugadores
         """
+        if max_jugadores is None:
+            max_jugadores = JugadorEquipo.obtener_max_jugadores()
         return JugadorEquipo.contar_jugadores_equipo(equipo_id) >= max_jugadores
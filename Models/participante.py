@@ -9,6 +9,8 @@ from PySide6.QtSql import QSqlQuery
 from datetime import datetime
 import csv
 
+from . import eventos
+
 
 class Participante:
     """
@@ -150,6 +152,7 @@ class Participante:
 
         if query.exec():
             self.id = query.lastInsertId()
+            eventos.publicar("participantes", self.id, eventos.CREAR)
             return True
         else:
             print(f"Error al crear participante: {query.lastError().text()}")
@@ -183,6 +186,7 @@ class Participante:
         query.addBindValue(self.id)
 
         if query.exec():
+            eventos.publicar("participantes", self.id, eventos.ACTUALIZAR)
             return True
         else:
             print(f"Error al actualizar participante: {query.lastError().text()}")
@@ -203,6 +207,7 @@ class Participante:
         query.addBindValue(self.id)
 
         if query.exec():
+            eventos.publicar("participantes", self.id, eventos.ELIMINAR)
             return True
         else:
             print(f"Error al eliminar participante: {query.lastError().text()}")
@@ -239,19 +244,34 @@ class Participante:
         return None
 
     @staticmethod
-    def obtener_todos():
+    def iterar(filtro="todos"):
         """
-        Obtiene todos los participantes de la base de datos.
+        Recorre los participantes ordenados por nombre sin cargarlos en una lista.
 
-        Returns:
-            list: Lista de objetos Participante
+        La consulta es de solo avance (setForwardOnly). No se deben hacer
+        escrituras mientras el generador está abierto.
+
+        Args:
+            filtro (str): 'todos', 'jugadores' o 'arbitros'
+
+        Yields:
+            Participante: Cada participante que cumple el filtro
         """
-        participantes = []
-        query = QSqlQuery("SELECT * FROM participantes ORDER BY nombre")
+        condiciones = {
+            "jugadores": "WHERE es_jugador = 1 ",
+            "arbitros": "WHERE es_arbitro = 1 ",
+        }
+        query = QSqlQuery()
+        query.setForwardOnly(True)
+        if not query.exec(
+            f"SELECT * FROM participantes {condiciones.get(filtro, '')}ORDER BY nombre"
+        ):
+            print(f"Error al leer participantes: {query.lastError().text()}")
+            return
 
-        while query.next():
-            participantes.append(
-                Participante(
+        try:
+            while query.next():
+                yield Participante(
                     id=query.value(0),
                     nombre=query.value(1),
                     fecha_nacimiento=query.value(2),
@@ -263,9 +283,18 @@ class Participante:
                     t_rojas=query.value(8),
                     goles=query.value(9),
                 )
-            )
+        finally:
+            query.finish()
 
-        return participantes
+    @staticmethod
+    def obtener_todos():
+        """
+        Obtiene todos los participantes de la base de datos.
+
+        Returns:
+            list: Lista de objetos Participante
+        """
+        return list(Participante.iterar())
 
     @staticmethod
     def obtener_jugadores():
@@ -275,28 +304,7 @@ class Participante:
         Returns:
             list: Lista de objetos Participante que son jugadores
         """
-        participantes = []
-        query = QSqlQuery(
-            "SELECT * FROM participantes WHERE es_jugador = 1 ORDER BY nombre"
-        )
-
-        while query.next():
-            participantes.append(
-                Participante(
-                    id=query.value(0),
-                    nombre=query.value(1),
-                    fecha_nacimiento=query.value(2),
-                    curso=query.value(3),
-                    es_jugador=bool(query.value(4)),
-                    es_arbitro=bool(query.value(5)),
-                    posicion=query.value(6),
-                    t_amarillas=query.value(7),
-                    t_rojas=query.value(8),
-                    goles=query.value(9),
-                )
-            )
-
-        return participantes
+        return list(Participante.iterar("jugadores"))
 
     @staticmethod
     def obtener_arbitros():
@@ -306,28 +314,7 @@ class Participante:
         Returns:
             list: Lista de objetos Participante que son árbitros
         """
-        participantes = []
-        query = QSqlQuery(
-            "SELECT * FROM participantes WHERE es_arbitro = 1 ORDER BY nombre"
-        )
-
-        while query.next():
-            participantes.append(
-                Participante(
-                    id=query.value(0),
-                    nombre=query.value(1),
-                    fecha_nacimiento=query.value(2),
-                    curso=query.value(3),
-                    es_jugador=bool(query.value(4)),
-                    es_arbitro=bool(query.value(5)),
-                    posicion=query.value(6),
-                    t_amarillas=query.value(7),
-                    t_rojas=query.value(8),
-                    goles=query.value(9),
-                )
-            )
-
-        return participantes
+        return list(Participante.iterar("arbitros"))
 
     @staticmethod
     def obtener_jugadores_sin_equipo():
@@ -408,23 +395,59 @@ class Participante:
 
         return participantes
 
+    # Criterio de cada clasificación -> expresión de orden. Deben coincidir
+    # con las de los índices parciales idx_ranking_* de database.crear_indices
+    RANKINGS = {
+        "goles": "goles",
+        "amarillas": "t_amarillas",
+        "rojas": "t_rojas",
+        "total": "t_amarillas + t_rojas",
+    }
+
     @staticmethod
-    def ordenar_por_goles(limite=None):
+    def _ranking(criterio, limite=None, despues_de=None):
         """
-        Obtiene los participantes ordenados por goles (descendente).
+        Lee una clasificación de jugadores recorriendo su índice.
+
+        El orden es (valor DESC, id), el mismo del índice parcial, así que la
+        consulta lee solo las filas que devuelve. Para paginar se pasa el
+        último participante de la página anterior (paginación por clave) en
+        lugar de un OFFSET, que obligaría a recorrer las filas saltadas.
 
         Args:
+            criterio (str): Clave de RANKINGS
             limite (int, optional): Número máximo de resultados
+            despues_de (Participante, optional): Último participante ya mostrado
 
         Returns:
-            list: Lista de participantes ordenados por goles
+            list: Lista de participantes de la clasificación
         """
-        participantes = []
-        sql = "SELECT * FROM participantes WHERE es_jugador = 1 ORDER BY goles DESC"
-        if limite:
-            sql += f" LIMIT {limite}"
+        expresion = Participante.RANKINGS[criterio]
+        sql = "SELECT * FROM participantes WHERE es_jugador = 1"
+        if despues_de is not None:
+            sql += f" AND {expresion} <= ? AND ({expresion} < ? OR id > ?)"
+        sql += f" ORDER BY {expresion} DESC, id LIMIT ?"
 
-        query = QSqlQuery(sql)
+        query = QSqlQuery()
+        query.setForwardOnly(True)
+        query.prepare(sql)
+        if despues_de is not None:
+            valor = {
+                "goles": despues_de.goles,
+                "amarillas": despues_de.t_amarillas,
+                "rojas": despues_de.t_rojas,
+                "total": despues_de.t_amarillas + despues_de.t_rojas,
+            }[criterio]
+            query.addBindValue(valor)
+            query.addBindValue(valor)
+            query.addBindValue(despues_de.id)
+        # LIMIT -1 en SQLite significa sin límite
+        query.addBindValue(int(limite) if limite else -1)
+
+        participantes = []
+        if not query.exec():
+            print(f"Error al leer la clasificación: {query.lastError().text()}")
+            return participantes
 
         while query.next():
             participantes.append(
@@ -445,49 +468,37 @@ class Participante:
         return participantes
 
     @staticmethod
-    def ordenar_por_tarjetas(tipo="total", limite=None):
+    def ordenar_por_goles(limite=None, despues_de=None):
         """
-        Obtiene los participantes ordenados por tarjetas (descendente).
+        Obtiene los jugadores ordenados por goles (descendente).
 
         Args:
-            tipo (str): 'amarillas', 'rojas' o 'total'
             limite (int, optional): Número máximo de resultados
+            despues_de (Participante, optional): Último jugador de la página
+                anterior; se devuelven los siguientes
 
         Returns:
-            list: Lista de participantes ordenados por tarjetas
+            list: Lista de participantes ordenados por goles
         """
-        participantes = []
-
-        if tipo == "amarillas":
-            orden = "t_amarillas DESC"
-        elif tipo == "rojas":
-            orden = "t_rojas DESC"
-        else:
-            orden = "(t_amarillas + t_rojas) DESC"
+        return Participante._ranking("goles", limite, despues_de)
 
-        sql = f"SELECT * FROM participantes WHERE es_jugador = 1 ORDER BY {orden}"
-        if limite:
-            sql += f" LIMIT {limite}"
-
-        query = QSqlQuery(sql)
+    @staticmethod
+    def ordenar_por_tarjetas(tipo="total", limite=None, despues_de=None):
+        """
+        Obtiene los jugadores ordenados por tarjetas (descendente).
 
-        while query.next():
-            participantes.append(
-                Participante(
-                    id=query.value(0),
-                    nombre=query.value(1),
-                    fecha_nacimiento=query.value(2),
-                    curso=query.value(3),
-                    es_jugador=bool(query.value(4)),
-                    es_arbitro=bool(query.value(5)),
-                    posicion=query.value(6),
-                    t_amarillas=query.value(7),
-                    t_rojas=query.value(8),
-                    goles=query.value(9),
-                )
-            )
+        Args:
+            tipo (str): 'amarillas', 'rojas' o 'total'
+            limite (int, optional): Número máximo de resultados
+            despues_de (Participante, optional): Último jugador de la página
+                anterior; se devuelven los siguientes
 
-        return participantes
+        Returns:
+            list: Lista de participantes ordenados por tarjetas
+        """
+        if tipo not in ("amarillas", "rojas"):
+            tipo = "total"
+        return Participante._ranking(tipo, limite, despues_de)
 
     @staticmethod
     def exportar_csv(ruta_archivo, filtro="todos"):
@@ -502,13 +513,6 @@ class Participante:
             bool: True si se exportó correctamente, False en caso contrario
         """
         try:
-            if filtro == "jugadores":
-                participantes = Participante.obtener_jugadores()
-            elif filtro == "arbitros":
-                participantes = Participante.obtener_arbitros()
-            else:
-                participantes = Participante.obtener_todos()
-
             with open(ruta_archivo, "w", newline="", encoding="utf-8") as archivo:
                 escritor = csv.writer(archivo)
                 escritor.writerow(
@@ -528,7 +532,7 @@ class Participante:
                     ]
                 )
 
-                for p in participantes:
+                for p in Participante.iterar(filtro):
                     escritor.writerow(
                         [
                             p.id,
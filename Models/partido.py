@@ -6,9 +6,26 @@ y operaciones relacionadas con la gestión de partidos.
 """
 
 from PySide6.QtSql import QSqlQuery
-from datetime import datetime
+from datetime import datetime, timedelta
 import csv
 
+from . import eventos
+from .sancion import SQL_PENDIENTES
+
+
+def _valor_columna(campo, valor):
+    """
+    Convierte un atributo de Partido al valor que se guarda en su columna.
+
+    QtSql lee los NULL de la base de datos como '': un ID o unos penaltis
+    vacíos se vuelven a guardar como NULL para no romper las claves foráneas.
+    """
+    if campo in ("jugado", "prorroga"):
+        return 1 if valor else 0
+    if campo.endswith("_id") or campo.startswith("penales_"):
+        return None if valor in ("", None) else valor
+    return valor
+
 
 class Partido:
     """
@@ -28,15 +45,40 @@ class Partido:
         prorroga (bool): Indica si hubo prórroga
         penales_local (int): Goles en penales del equipo local
         penales_visitante (int): Goles en penales del equipo visitante
+        posicion (int): Hueco del partido dentro de su eliminatoria en el cuadro
     """
 
+    # Rondas del cuadro, de la más temprana a la Final
     ELIMINATORIAS = [
+        "Sesentaicuatroavos",
+        "Treintaidosavos",
+        "Dieciseisavos",
         "Octavos",
         "Cuartos",
         "Semifinales",
         "Final",
     ]
 
+    # Minutos que ocupa un partido en la pista, a efectos de solapes
+    DURACION_MINUTOS = 60
+
+    # Columnas que escriben crear() y actualizar(), en el orden de su SQL
+    COLUMNAS = (
+        "equipo_local_id",
+        "equipo_visitante_id",
+        "fecha_hora",
+        "arbitro_id",
+        "eliminatoria",
+        "goles_local",
+        "goles_visitante",
+        "jugado",
+        "ganador_id",
+        "prorroga",
+        "penales_local",
+        "penales_visitante",
+        "posicion",
+    )
+
     def __init__(
         self,
         id=None,
@@ -52,6 +94,7 @@ class Partido:
         prorroga=False,
         penales_local=None,
         penales_visitante=None,
+        posicion=None,
     ):
         """
         Inicializa un objeto Partido.
@@ -69,6 +112,7 @@ class Partido:
         self.prorroga = prorroga
         self.penales_local = penales_local
         self.penales_visitante = penales_visitante
+        self.posicion = posicion
 
     def guardar(self):
         """
@@ -86,33 +130,30 @@ class Partido:
         """
         Inserta un nuevo partido en la base de datos.
 
+        Sin posición indicada, ocupa el primer hueco libre de su eliminatoria.
+
         Returns:
             bool: True si se insertó correctamente, False en caso contrario
         """
+        if self.posicion is None:
+            self.posicion = Partido.siguiente_posicion_libre(self.eliminatoria)
+
         query = QSqlQuery()
         query.prepare(
             """
             INSERT INTO partidos 
             (equipo_local_id, equipo_visitante_id, fecha_hora, arbitro_id, eliminatoria,
-             goles_local, goles_visitante, jugado, ganador_id, prorroga, penales_local, penales_visitante)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+             goles_local, goles_visitante, jugado, ganador_id, prorroga, penales_local, penales_visitante,
+             posicion)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
         )
-        query.addBindValue(self.equipo_local_id)
-        query.addBindValue(self.equipo_visitante_id)
-        query.addBindValue(self.fecha_hora)
-        query.addBindValue(self.arbitro_id)
-        query.addBindValue(self.eliminatoria)
-        query.addBindValue(self.goles_local)
-        query.addBindValue(self.goles_visitante)
-        query.addBindValue(1 if self.jugado else 0)
-        query.addBindValue(self.ganador_id)
-        query.addBindValue(1 if self.prorroga else 0)
-        query.addBindValue(self.penales_local)
-        query.addBindValue(self.penales_visitante)
+        for campo in Partido.COLUMNAS:
+            query.addBindValue(_valor_columna(campo, getattr(self, campo)))
 
         if query.exec():
             self.id = query.lastInsertId()
+            eventos.publicar("partidos", self.id, eventos.CREAR)
             return True
         else:
             print(f"Error al crear partido: {query.lastError().text()}")
@@ -125,31 +166,75 @@ class Partido:
         Returns:
             bool: True si se actualizó correctamente, False en caso contrario
         """
+        if self.posicion is None:
+            self.posicion = Partido.siguiente_posicion_libre(self.eliminatoria)
+
         query = QSqlQuery()
         query.prepare(
             """
             UPDATE partidos 
             SET equipo_local_id = ?, equipo_visitante_id = ?, fecha_hora = ?, 
                 arbitro_id = ?, eliminatoria = ?, goles_local = ?, goles_visitante = ?,
-                jugado = ?, ganador_id = ?, prorroga = ?, penales_local = ?, penales_visitante = ?
+                jugado = ?, ganador_id = ?, prorroga = ?, penales_local = ?, penales_visitante = ?,
+                posicion = ?
             WHERE id = ?
         """
         )
-        query.addBindValue(self.equipo_local_id)
-        query.addBindValue(self.equipo_visitante_id)
-        query.addBindValue(self.fecha_hora)
-        query.addBindValue(self.arbitro_id)
-        query.addBindValue(self.eliminatoria)
-        query.addBindValue(self.goles_local)
-        query.addBindValue(self.goles_visitante)
-        query.addBindValue(1 if self.jugado else 0)
-        query.addBindValue(self.ganador_id)
-        query.addBindValue(1 if self.prorroga else 0)
-        query.addBindValue(self.penales_local)
-        query.addBindValue(self.penales_visitante)
+        for campo in Partido.COLUMNAS:
+            query.addBindValue(_valor_columna(campo, getattr(self, campo)))
         query.addBindValue(self.id)
 
         if query.exec():
+            eventos.publicar("partidos", self.id, eventos.ACTUALIZAR)
+            return True
+        else:
+            print(f"Error al actualizar partido: {query.lastError().text()}")
+            return False
+
+    # Columnas que actualizar_campos() puede escribir por separado
+    CAMPOS_ACTUALIZABLES = (
+        "equipo_local_id",
+        "equipo_visitante_id",
+        "fecha_hora",
+        "arbitro_id",
+        "goles_local",
+        "goles_visitante",
+        "jugado",
+        "ganador_id",
+        "prorroga",
+        "penales_local",
+        "penales_visitante",
+    )
+
+    def actualizar_campos(self, *campos):
+        """
+        Actualiza solo algunas columnas del partido.
+
+        A diferencia de actualizar(), no reescribe el resto de la fila, así
+        que no pisa cambios hechos en otras columnas desde que se leyó.
+
+        Args:
+            *campos (str): Nombres de columna de CAMPOS_ACTUALIZABLES
+
+        Returns:
+            bool: True si se actualizó correctamente, False en caso contrario
+        """
+        if not self.id or not campos:
+            return False
+        for campo in campos:
+            if campo not in Partido.CAMPOS_ACTUALIZABLES:
+                raise ValueError(f"Campo de partido no actualizable: {campo}")
+
+        query = QSqlQuery()
+        query.prepare(
+            f"UPDATE partidos SET {', '.join(f'{c} = ?' for c in campos)} WHERE id = ?"
+        )
+        for campo in campos:
+            query.addBindValue(_valor_columna(campo, getattr(self, campo)))
+        query.addBindValue(self.id)
+
+        if query.exec():
+            eventos.publicar("partidos", self.id, eventos.ACTUALIZAR)
             return True
         else:
             print(f"Error al actualizar partido: {query.lastError().text()}")
@@ -170,6 +255,7 @@ class Partido:
         query.addBindValue(self.id)
 
         if query.exec():
+            eventos.publicar("partidos", self.id, eventos.ELIMINAR)
             return True
         else:
             print(f"Error al eliminar partido: {query.lastError().text()}")
@@ -205,23 +291,31 @@ class Partido:
                 prorroga=bool(query.value(10)),
                 penales_local=query.value(11),
                 penales_visitante=query.value(12),
+                posicion=query.value(13),
             )
         return None
 
     @staticmethod
-    def obtener_todos():
+    def iterar():
         """
-        Obtiene todos los partidos de la base de datos ordenados por fecha.
+        Recorre todos los partidos ordenados por fecha sin cargarlos en una lista.
 
-        Returns:
-            list: Lista de objetos Partido
+        La consulta es de solo avance (setForwardOnly), así que QtSql no
+        guarda las filas ya leídas. No se deben hacer escrituras mientras
+        el generador está abierto.
+
+        Yields:
+            Partido: Cada partido en orden de fecha
         """
-        partidos = []
-        query = QSqlQuery("SELECT * FROM partidos ORDER BY fecha_hora")
+        query = QSqlQuery()
+        query.setForwardOnly(True)
+        if not query.exec("SELECT * FROM partidos ORDER BY fecha_hora"):
+            print(f"Error al leer partidos: {query.lastError().text()}")
+            return
 
-        while query.next():
-            partidos.append(
-                Partido(
+        try:
+            while query.next():
+                yield Partido(
                     id=query.value(0),
                     equipo_local_id=query.value(1),
                     equipo_visitante_id=query.value(2),
@@ -235,10 +329,20 @@ class Partido:
                     prorroga=bool(query.value(10)),
                     penales_local=query.value(11),
                     penales_visitante=query.value(12),
+                    posicion=query.value(13),
                 )
-            )
+        finally:
+            query.finish()
 
-        return partidos
+    @staticmethod
+    def obtener_todos():
+        """
+        Obtiene todos los partidos de la base de datos ordenados por fecha.
+
+        Returns:
+            list: Lista de objetos Partido
+        """
+        return list(Partido.iterar())
 
     @staticmethod
     def obtener_por_eliminatoria(eliminatoria):
@@ -275,11 +379,155 @@ class Partido:
                         prorroga=bool(query.value(10)),
                         penales_local=query.value(11),
                         penales_visitante=query.value(12),
+                        posicion=query.value(13),
                     )
                 )
 
         return partidos
 
+    @staticmethod
+    def obtener_por_posicion(eliminatoria, posicion):
+        """
+        Obtiene el partido que ocupa un hueco concreto del cuadro.
+
+        Args:
+            eliminatoria (str): Nombre de la eliminatoria
+            posicion (int): Hueco dentro de la eliminatoria
+
+        Returns:
+            Partido: Objeto Partido si el hueco está ocupado, None en caso contrario
+        """
+        query = QSqlQuery()
+        query.prepare("SELECT id FROM partidos WHERE eliminatoria = ? AND posicion = ?")
+        query.addBindValue(eliminatoria)
+        query.addBindValue(posicion)
+
+        if query.exec() and query.next():
+            return Partido.obtener_por_id(query.value(0))
+        return None
+
+    @staticmethod
+    def siguiente_posicion_libre(eliminatoria):
+        """
+        Obtiene el primer hueco libre de una eliminatoria.
+
+        Args:
+            eliminatoria (str): Nombre de la eliminatoria
+
+        Returns:
+            int: Menor posición no ocupada, empezando en 0
+        """
+        query = QSqlQuery()
+        query.prepare(
+            """
+            SELECT posicion FROM partidos
+            WHERE eliminatoria = ? AND posicion IS NOT NULL
+            ORDER BY posicion
+        """
+        )
+        query.addBindValue(eliminatoria)
+
+        libre = 0
+        if query.exec():
+            while query.next():
+                if query.value(0) > libre:
+                    break
+                libre = query.value(0) + 1
+        return libre
+
+    @staticmethod
+    def buscar_conflictos(
+        fecha_hora,
+        equipo_local_id,
+        equipo_visitante_id,
+        arbitro_id=None,
+        excluir_id=None,
+        margen_minutos=None,
+    ):
+        """
+        Busca partidos que se solapan con un horario para los mismos equipos o árbitro.
+
+        Cada rama de la consulta es un rango sobre fecha_hora que resuelven los
+        índices (equipo_local_id, fecha_hora), (equipo_visitante_id, fecha_hora)
+        y (arbitro_id, fecha_hora), sin recorrer la tabla.
+
+        Args:
+            fecha_hora (str): Inicio del partido, formato "YYYY-MM-DD HH:MM:SS"
+            equipo_local_id (int): ID del equipo local
+            equipo_visitante_id (int): ID del equipo visitante
+            arbitro_id (int, optional): ID del árbitro asignado
+            excluir_id (int, optional): ID del propio partido al editarlo
+            margen_minutos (int, optional): Separación mínima entre inicios.
+                Por defecto la duración de un partido
+
+        Returns:
+            list: Tuplas (Partido, motivo) con motivo "equipo" o "arbitro".
+                Vacía si fecha_hora no es una fecha válida
+        """
+        inicio = None
+        for formato in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
+            try:
+                inicio = datetime.strptime(fecha_hora or "", formato)
+                break
+            except ValueError:
+                continue
+        if inicio is None:
+            return []
+
+        margen = timedelta(minutes=margen_minutos or Partido.DURACION_MINUTOS)
+        desde = (inicio - margen).strftime("%Y-%m-%d %H:%M:%S")
+        hasta = (inicio + margen).strftime("%Y-%m-%d %H:%M:%S")
+        excluir = excluir_id if excluir_id is not None else -1
+
+        ramas = []
+        valores = []
+        for columna in ("equipo_local_id", "equipo_visitante_id"):
+            ramas.append(
+                f"""
+                SELECT *, 'equipo' FROM partidos
+                WHERE {columna} IN (?, ?) AND fecha_hora > ? AND fecha_hora < ? AND id != ?
+            """
+            )
+            valores += [equipo_local_id, equipo_visitante_id, desde, hasta, excluir]
+        if arbitro_id:
+            ramas.append(
+                """
+                SELECT *, 'arbitro' FROM partidos
+                WHERE arbitro_id = ? AND fecha_hora > ? AND fecha_hora < ? AND id != ?
+            """
+            )
+            valores += [arbitro_id, desde, hasta, excluir]
+
+        query = QSqlQuery()
+        query.prepare(" UNION ".join(ramas))
+        for valor in valores:
+            query.addBindValue(valor)
+
+        conflictos = []
+        if query.exec():
+            while query.next():
+                partido = Partido(
+                    id=query.value(0),
+                    equipo_local_id=query.value(1),
+                    equipo_visitante_id=query.value(2),
+                    fecha_hora=query.value(3),
+                    arbitro_id=query.value(4),
+                    eliminatoria=query.value(5),
+                    goles_local=query.value(6),
+                    goles_visitante=query.value(7),
+                    jugado=bool(query.value(8)),
+                    ganador_id=query.value(9),
+                    prorroga=bool(query.value(10)),
+                    penales_local=query.value(11),
+                    penales_visitante=query.value(12),
+                    posicion=query.value(13),
+                )
+                conflictos.append((partido, query.value(14)))
+        else:
+            print(f"Error al buscar conflictos: {query.lastError().text()}")
+
+        return conflictos
+
     @staticmethod
     def obtener_partidos_jugados():
         """
@@ -309,6 +557,7 @@ class Partido:
                     prorroga=bool(query.value(10)),
                     penales_local=query.value(11),
                     penales_visitante=query.value(12),
+                    posicion=query.value(13),
                 )
             )
 
@@ -341,11 +590,35 @@ class Partido:
                     prorroga=bool(query.value(10)),
                     penales_local=query.value(11),
                     penales_visitante=query.value(12),
+                    posicion=query.value(13),
                 )
             )
 
         return partidos
 
+    @staticmethod
+    def obtener_primero_de_arbitro(arbitro_id):
+        """
+        Obtiene el primer partido, por fecha, asignado a un árbitro.
+
+        Lo resuelve el índice (arbitro_id, fecha_hora) leyendo una sola fila.
+
+        Args:
+            arbitro_id (int): ID del árbitro
+
+        Returns:
+            Partido: Objeto Partido, o None si no tiene partidos asignados
+        """
+        query = QSqlQuery()
+        query.prepare(
+            "SELECT id FROM partidos WHERE arbitro_id = ? ORDER BY fecha_hora LIMIT 1"
+        )
+        query.addBindValue(arbitro_id)
+
+        if query.exec() and query.next():
+            return Partido.obtener_por_id(query.value(0))
+        return None
+
     @staticmethod
     def obtener_partidos_sin_arbitro():
         """
@@ -375,6 +648,7 @@ class Partido:
                     prorroga=bool(query.value(10)),
                     penales_local=query.value(11),
                     penales_visitante=query.value(12),
+                    posicion=query.value(13),
                 )
             )
 
@@ -391,12 +665,35 @@ class Partido:
         Returns:
             list: Lista de objetos Partido de esa fecha
         """
+        siguiente = datetime.strptime(fecha, "%Y-%m-%d") + timedelta(days=1)
+        return Partido.obtener_entre_fechas(fecha, siguiente.strftime("%Y-%m-%d"))
+
+    @staticmethod
+    def obtener_entre_fechas(desde, hasta):
+        """
+        Obtiene los partidos que empiezan en un intervalo de fechas.
+
+        El filtro es un rango directo sobre fecha_hora para que lo resuelva
+        idx_partidos_fecha en lugar de aplicar DATE() a cada fila.
+
+        Args:
+            desde (str): Inicio incluido, formato YYYY-MM-DD
+            hasta (str): Fin excluido, formato YYYY-MM-DD
+
+        Returns:
+            list: Lista de objetos Partido ordenados por fecha
+        """
         partidos = []
         query = QSqlQuery()
         query.prepare(
-            "SELECT * FROM partidos WHERE DATE(fecha_hora) = ? ORDER BY fecha_hora"
+            """
+            SELECT * FROM partidos
+            WHERE fecha_hora >= ? AND fecha_hora < ?
+            ORDER BY fecha_hora
+        """
         )
-        query.addBindValue(fecha)
+        query.addBindValue(desde)
+        query.addBindValue(hasta)
 
         if query.exec():
             while query.next():
@@ -415,11 +712,204 @@ class Partido:
                         prorroga=bool(query.value(10)),
                         penales_local=query.value(11),
                         penales_visitante=query.value(12),
+                        posicion=query.value(13),
                     )
                 )
+        else:
+            print(f"Error al obtener partidos por fecha: {query.lastError().text()}")
 
         return partidos
 
+    @staticmethod
+    def obtener_por_mes(anio, mes):
+        """
+        Obtiene con una sola consulta los partidos de un mes agrupados por día.
+
+        Args:
+            anio (int): Año
+            mes (int): Mes (1-12)
+
+        Returns:
+            dict: {"YYYY-MM-DD": [Partido, ...]} solo con los días que tienen partidos
+        """
+        desde = f"{anio:04d}-{mes:02d}-01"
+        if mes == 12:
+            hasta = f"{anio + 1:04d}-01-01"
+        else:
+            hasta = f"{anio:04d}-{mes + 1:02d}-01"
+
+        por_dia = {}
+        for partido in Partido.obtener_entre_fechas(desde, hasta):
+            por_dia.setdefault(partido.fecha_hora[:10], []).append(partido)
+        return por_dia
+
+    @staticmethod
+    def obtener_acta(partido_id):
+        """
+        Obtiene las plantillas de los dos equipos con sus goles y tarjetas en el partido.
+
+        Una única consulta: los goles y tarjetas del partido se agrupan por
+        jugador y se unen a las plantillas de ambos equipos y a sus sanciones.
+
+        Args:
+            partido_id (int): ID del partido
+
+        Returns:
+            dict: {"local": [...], "visitante": [...]} con diccionarios de jugador
+                  (id, nombre, posicion, goles, t_amarillas, t_rojas y los del
+                  partido: goles_partido, amarillas_partido, rojas_partido).
+                  sancion son los partidos de sanción pendientes; es 0 si el
+                  partido ya se jugó o el jugador tiene goles o tarjetas en él
+        """
+        acta = {"local": [], "visitante": []}
+        query = QSqlQuery()
+        query.setForwardOnly(True)
+        query.prepare(
+            f"""
+            SELECT CASE WHEN je.equipo_id = p.equipo_local_id
+                        THEN 'local' ELSE 'visitante' END AS lado,
+                   j.id, j.nombre, j.posicion, j.goles, j.t_amarillas, j.t_rojas,
+                   COALESCE(g.cantidad, 0), COALESCE(t.amarillas, 0),
+                   COALESCE(t.rojas, 0),
+                   CASE WHEN p.jugado = 0 AND g.jugador_id IS NULL
+                             AND t.jugador_id IS NULL
+                        THEN {SQL_PENDIENTES} ELSE 0 END
+            FROM partidos p
+            JOIN jugadores_equipos je
+                ON je.equipo_id IN (p.equipo_local_id, p.equipo_visitante_id)
+            JOIN participantes j ON j.id = je.jugador_id
+            LEFT JOIN (
+                SELECT jugador_id, COUNT(*) AS cantidad
+                FROM goles WHERE partido_id = ?
+                GROUP BY jugador_id
+            ) g ON g.jugador_id = j.id
+            LEFT JOIN (
+                SELECT jugador_id,
+                       SUM(tipo = 'amarilla') AS amarillas,
+                       SUM(tipo = 'roja') AS rojas
+                FROM tarjetas WHERE partido_id = ?
+                GROUP BY jugador_id
+            ) t ON t.jugador_id = j.id
+            LEFT JOIN sanciones s ON s.jugador_id = j.id
+            WHERE p.id = ?
+            ORDER BY lado, j.nombre
+        """
+        )
+        query.addBindValue(partido_id)
+        query.addBindValue(partido_id)
+        query.addBindValue(partido_id)
+
+        if not query.exec():
+            print(f"Error al obtener acta del partido: {query.lastError().text()}")
+            return acta
+
+        while query.next():
+            acta[query.value(0)].append(
+                {
+                    "id": query.value(1),
+                    "nombre": query.value(2),
+                    "posicion": query.value(3),
+                    "goles": query.value(4),
+                    "t_amarillas": query.value(5),
+                    "t_rojas": query.value(6),
+                    "goles_partido": query.value(7),
+                    "amarillas_partido": query.value(8),
+                    "rojas_partido": query.value(9),
+                    "sancion": query.value(10),
+                }
+            )
+
+        return acta
+
+    @staticmethod
+    def obtener_cronologia(partido_id):
+        """
+        Obtiene los goles y tarjetas de un partido como eventos ordenados por minuto.
+
+        Cada rama de la consulta es un recorrido por rango del índice
+        (partido_id, minuto) de su tabla. Los eventos sin minuto van al final.
+
+        Args:
+            partido_id (int): ID del partido
+
+        Returns:
+            list: Diccionarios con minuto, tipo ('gol', 'amarilla' o 'roja'),
+                  id, jugador_id, jugador y equipo_id
+        """
+        cronologia = []
+        query = QSqlQuery()
+        query.setForwardOnly(True)
+        query.prepare(
+            """
+            SELECT e.minuto, e.tipo, e.id, e.jugador_id, j.nombre, je.equipo_id
+            FROM (
+                SELECT minuto, 'gol' AS tipo, id, jugador_id
+                FROM goles WHERE partido_id = ?
+                UNION ALL
+                SELECT minuto, tipo, id, jugador_id
+                FROM tarjetas WHERE partido_id = ?
+            ) e
+            JOIN participantes j ON j.id = e.jugador_id
+            JOIN partidos p ON p.id = ?
+            LEFT JOIN jugadores_equipos je
+                ON je.jugador_id = e.jugador_id
+               AND je.equipo_id IN (p.equipo_local_id, p.equipo_visitante_id)
+            ORDER BY e.minuto IS NULL, e.minuto, e.tipo = 'gol' DESC, e.id
+        """
+        )
+        query.addBindValue(partido_id)
+        query.addBindValue(partido_id)
+        query.addBindValue(partido_id)
+
+        if not query.exec():
+            print(f"Error al obtener cronología del partido: {query.lastError().text()}")
+            return cronologia
+
+        while query.next():
+            cronologia.append(
+                {
+                    "minuto": query.value(0),
+                    "tipo": query.value(1),
+                    "id": query.value(2),
+                    "jugador_id": query.value(3),
+                    "jugador": query.value(4),
+                    "equipo_id": query.value(5),
+                }
+            )
+
+        return cronologia
+
+    @staticmethod
+    def calcular_marcador(partido_id):
+        """
+        Cuenta los goles registrados de cada equipo en un partido.
+
+        Se usa al cerrar un partido anotado en directo: el resultado sale de
+        los goles ya guardados, sin reescribir ninguno.
+
+        Args:
+            partido_id (int): ID del partido
+
+        Returns:
+            tuple: (goles_local, goles_visitante)
+        """
+        query = QSqlQuery()
+        query.prepare(
+            """
+            SELECT COALESCE(SUM(je.equipo_id = p.equipo_local_id), 0),
+                   COALESCE(SUM(je.equipo_id = p.equipo_visitante_id), 0)
+            FROM partidos p
+            JOIN goles g ON g.partido_id = p.id
+            JOIN jugadores_equipos je ON je.jugador_id = g.jugador_id
+            WHERE p.id = ?
+        """
+        )
+        query.addBindValue(partido_id)
+
+        if query.exec() and query.next():
+            return query.value(0), query.value(1)
+        return 0, 0
+
     def obtener_nombres_equipos(self):
         """
         Obtiene los nombres de los equipos del partido.
@@ -452,19 +942,31 @@ class Partido:
             bool: True si se exportó correctamente, False en caso contrario
         """
         try:
-            partidos = Partido.obtener_todos()
-
-            # Organizar partidos por eliminatoria
-            partidos_por_fase = {
-                "Octavos": [],
-                "Cuartos": [],
-                "Semifinales": [],
-                "Final": [],
-            }
-
-            for partido in partidos:
-                if partido.eliminatoria in partidos_por_fase:
-                    partidos_por_fase[partido.eliminatoria].append(partido)
+            # Una sola consulta con los nombres ya resueltos, ordenada por fase
+            marcadores = ", ".join("?" for _ in Partido.ELIMINATORIAS)
+            orden = " ".join(
+                f"WHEN ? THEN {i}" for i in range(len(Partido.ELIMINATORIAS))
+            )
+            query = QSqlQuery()
+            query.setForwardOnly(True)
+            query.prepare(
+                f"""
+                SELECT p.eliminatoria, el.nombre, p.goles_local, ev.nombre,
+                       p.goles_visitante, g.nombre, p.jugado
+                FROM partidos p
+                LEFT JOIN equipos el ON el.id = p.equipo_local_id
+                LEFT JOIN equipos ev ON ev.id = p.equipo_visitante_id
+                LEFT JOIN equipos g ON g.id = p.ganador_id
+                WHERE p.eliminatoria IN ({marcadores})
+                ORDER BY CASE p.eliminatoria {orden} END, p.fecha_hora
+                """
+            )
+            for fase in Partido.ELIMINATORIAS:
+                query.addBindValue(fase)
+            for fase in Partido.ELIMINATORIAS:
+                query.addBindValue(fase)
+            if not query.exec():
+                raise Exception(query.lastError().text())
 
             with open(ruta_archivo, "w", newline="", encoding="utf-8") as archivo:
                 escritor = csv.writer(archivo)
@@ -480,44 +982,24 @@ class Partido:
                     ]
                 )
 
-                # Escribir partidos por fase en orden
-                for fase in ["Octavos", "Cuartos", "Semifinales", "Final"]:
-                    for partido in partidos_por_fase[fase]:
-                        # Obtener nombres de equipos
-                        query = QSqlQuery()
-                        query.prepare("SELECT nombre FROM equipos WHERE id = ?")
-
-                        query.addBindValue(partido.equipo_local_id)
-                        query.exec()
-                        nombre_local = query.value(0) if query.next() else "—"
-
-                        query.addBindValue(partido.equipo_visitante_id)
-                        query.exec()
-                        nombre_visitante = query.value(0) if query.next() else "—"
-
-                        # Determinar ganador
-                        if partido.ganador_id:
-                            query.prepare("SELECT nombre FROM equipos WHERE id = ?")
-                            query.addBindValue(partido.ganador_id)
-                            query.exec()
-                            nombre_ganador = query.value(0) if query.next() else ""
-                        else:
-                            nombre_ganador = "Empate" if partido.jugado else "Pendiente"
-
-                        # Determinar estado
-                        estado = "Jugado" if partido.jugado else "Pendiente"
-
-                        escritor.writerow(
-                            [
-                                fase,
-                                nombre_local,
-                                partido.goles_local if partido.jugado else "-",
-                                nombre_visitante,
-                                partido.goles_visitante if partido.jugado else "-",
-                                nombre_ganador,
-                                estado,
-                            ]
-                        )
+                while query.next():
+                    jugado = bool(query.value(6))
+                    if query.value(5):
+                        nombre_ganador = query.value(5)
+                    else:
+                        nombre_ganador = "Empate" if jugado else "Pendiente"
+
+                    escritor.writerow(
+                        [
+                            query.value(0),
+                            query.value(1) or "—",
+                            query.value(2) if jugado else "-",
+                            query.value(3) or "—",
+                            query.value(4) if jugado else "-",
+                            nombre_ganador,
+                            "Jugado" if jugado else "Pendiente",
+                        ]
+                    )
 
             return True
         except Exception as e:
@@ -536,7 +1018,24 @@ class Partido:
             bool: True si se exportó correctamente, False en caso contrario
         """
         try:
-            partidos = Partido.obtener_todos()
+            # Nombres resueltos con JOIN y cursor de solo avance: memoria constante
+            query = QSqlQuery()
+            query.setForwardOnly(True)
+            if not query.exec(
+                """
+                SELECT p.id, el.nombre, ev.nombre, p.fecha_hora, p.arbitro_id,
+                       a.nombre, p.eliminatoria, p.goles_local, p.goles_visitante,
+                       p.jugado, g.nombre, p.prorroga, p.penales_local,
+                       p.penales_visitante
+                FROM partidos p
+                LEFT JOIN equipos el ON el.id = p.equipo_local_id
+                LEFT JOIN equipos ev ON ev.id = p.equipo_visitante_id
+                LEFT JOIN equipos g ON g.id = p.ganador_id
+                LEFT JOIN participantes a ON a.id = p.arbitro_id
+                ORDER BY p.fecha_hora
+                """
+            ):
+                raise Exception(query.lastError().text())
 
             with open(ruta_archivo, "w", newline="", encoding="utf-8") as archivo:
                 escritor = csv.writer(archivo)
@@ -558,50 +1057,33 @@ class Partido:
                     ]
                 )
 
-                for partido in partidos:
-                    # Obtener nombres
-                    query = QSqlQuery()
-                    query.prepare("SELECT nombre FROM equipos WHERE id = ?")
-
-                    query.addBindValue(partido.equipo_local_id)
-                    query.exec()
-                    nombre_local = query.value(0) if query.next() else ""
-
-                    query.addBindValue(partido.equipo_visitante_id)
-                    query.exec()
-                    nombre_visitante = query.value(0) if query.next() else ""
-
-                    if partido.arbitro_id:
-                        query.prepare("SELECT nombre FROM participantes WHERE id = ?")
-                        query.addBindValue(partido.arbitro_id)
-                        query.exec()
-                        nombre_arbitro = query.value(0) if query.next() else ""
+                while query.next():
+                    jugado = bool(query.value(9))
+                    if query.value(4):
+                        nombre_arbitro = query.value(5) or ""
                     else:
                         nombre_arbitro = "Sin asignar"
 
-                    if partido.ganador_id:
-                        query.prepare("SELECT nombre FROM equipos WHERE id = ?")
-                        query.addBindValue(partido.ganador_id)
-                        query.exec()
-                        nombre_ganador = query.value(0) if query.next() else ""
+                    if query.value(10):
+                        nombre_ganador = query.value(10)
                     else:
-                        nombre_ganador = "Empate" if partido.jugado else "Pendiente"
+                        nombre_ganador = "Empate" if jugado else "Pendiente"
 
                     escritor.writerow(
                         [
-                            partido.id,
-                            nombre_local,
-                            nombre_visitante,
-                            partido.fecha_hora,
+                            query.value(0),
+                            query.value(1) or "",
+                            query.value(2) or "",
+                            query.value(3),
                             nombre_arbitro,
-                            partido.eliminatoria,
-                            partido.goles_local,
-                            partido.goles_visitante,
-                            "Sí" if partido.jugado else "No",
+                            query.value(6),
+                            query.value(7),
+                            query.value(8),
+                            "Sí" if jugado else "No",
                             nombre_ganador,
-                            "Sí" if partido.prorroga else "No",
-                            partido.penales_local or "",
-                            partido.penales_visitante or "",
+                            "Sí" if query.value(11) else "No",
+                            query.value(12) or "",
+                            query.value(13) or "",
                         ]
                     )
 
@@ -0,0 +1,117 @@
+"""
+Detección opcional de patrones N+1 en las consultas a la base de datos.
+
+Un patrón N+1 aparece cuando se lee una lista y después se lanza la misma
+consulta una vez por elemento (por ejemplo, obtener_por_id dentro de un
+bucle). Dentro de registrar() se cuentan las ejecuciones de cada sentencia
+y se señalan las que se repiten más veces que el umbral:
+
+    with perfil_consultas.registrar() as registro:
+        JugadoresEquipoDialog(equipo)
+    registro.comprobar()          # AssertionError si hay sentencias repetidas
+
+No está activo por defecto: mientras dura el bloque se sustituyen
+QSqlQuery.exec y QSqlQuery.execBatch por versiones que anotan la sentencia,
+así que solo debe usarse en pruebas o al depurar. Las consultas lanzadas
+en el propio constructor de QSqlQuery no pasan por exec y no se cuentan.
+"""
+
+import re
+from contextlib import contextmanager
+
+from PySide6.QtSql import QSqlQuery
+
+# Ejecuciones de una misma sentencia a partir de las que se considera N+1
+UMBRAL_REPETICIONES = 5
+
+
+class RegistroConsultas:
+    """
+    Clase que acumula las sentencias ejecutadas dentro de registrar().
+
+    Attributes:
+        ejecuciones (dict): Número de ejecuciones por sentencia normalizada
+    """
+
+    def __init__(self):
+        """
+        Inicializa un registro vacío.
+        """
+        self.ejecuciones = {}
+
+    def anotar(self, sql):
+        """
+        Cuenta una ejecución de la sentencia.
+
+        Args:
+            sql (str): Texto de la sentencia
+        """
+        sql = re.sub(r"\s+", " ", sql or "").strip()
+        self.ejecuciones[sql] = self.ejecuciones.get(sql, 0) + 1
+
+    @property
+    def total(self):
+        """int: Número total de ejecuciones registradas."""
+        return sum(self.ejecuciones.values())
+
+    def repetidas(self, umbral=UMBRAL_REPETICIONES):
+        """
+        Obtiene las sentencias ejecutadas al menos umbral veces.
+
+        Args:
+            umbral (int): Repeticiones mínimas
+
+        Returns:
+            list: Tuplas (sentencia, ejecuciones) de mayor a menor
+        """
+        return sorted(
+            ((sql, n) for sql, n in self.ejecuciones.items() if n >= umbral),
+            key=lambda x: x[1],
+            reverse=True,
+        )
+
+    def comprobar(self, umbral=UMBRAL_REPETICIONES):
+        """
+        Falla si alguna sentencia se ejecutó al menos umbral veces.
+
+        Args:
+            umbral (int): Repeticiones mínimas
+
+        Raises:
+            AssertionError: Con las sentencias sospechosas de N+1
+        """
+        repetidas = self.repetidas(umbral)
+        if repetidas:
+            detalle = "\n".join(f"  {n}x {sql}" for sql, n in repetidas)
+            raise AssertionError(f"Posible patrón N+1:\n{detalle}")
+
+
+@contextmanager
+def registrar():
+    """
+    Registra las sentencias ejecutadas con QSqlQuery dentro del bloque.
+
+    Yields:
+        RegistroConsultas: Registro con las ejecuciones de cada sentencia
+    """
+    registro = RegistroConsultas()
+    exec_original = QSqlQuery.exec
+    exec_batch_original = QSqlQuery.execBatch
+
+    def exec_registrado(self, *args):
+        resultado = exec_original(self, *args)
+        registro.anotar(args[0] if args else self.lastQuery())
+        return resultado
+
+    def exec_batch_registrado(self, *args):
+        resultado = exec_batch_original(self, *args)
+        registro.anotar(self.lastQuery())
+        return resultado
+
+    QSqlQuery.exec = exec_registrado
+    QSqlQuery.execBatch = exec_batch_registrado
+    try:
+        yield registro
+    finally:
+        QSqlQuery.exec = exec_original
+        QSqlQuery.execBatch = exec_batch_original
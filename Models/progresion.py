@@ -0,0 +1,137 @@
+"""
+Avance automático del cuadro de eliminatorias.
+
+Cada partido ocupa un hueco (posicion) dentro de su eliminatoria. Los
+ganadores de los huecos 2k y 2k+1 se enfrentan en el hueco k de la ronda
+siguiente: el del hueco par como local y el del impar como visitante.
+
+Al guardar un resultado solo se revisa el camino de ese partido: se crea el
+partido de la ronda siguiente cuando los dos anteriores tienen ganador, o se
+corrigen sus equipos si todavía no se ha jugado. Si al corregir un resultado
+uno de los dos anteriores se queda sin ganador (empate), el partido de la
+ronda siguiente sin jugar se borra, ya que no puede quedar con un solo equipo.
+"""
+
+from datetime import datetime, timedelta
+
+from .partido import Partido
+
+# Días entre un partido y la fecha provisional del de la ronda siguiente
+DIAS_ENTRE_RONDAS = 7
+
+FORMATO_FECHA = "%Y-%m-%d %H:%M:%S"
+
+
+def siguiente_eliminatoria(eliminatoria):
+    """
+    Obtiene la ronda que sigue a una eliminatoria.
+
+    Args:
+        eliminatoria (str): Nombre de la eliminatoria
+
+    Returns:
+        str: Nombre de la ronda siguiente, o None si es la Final o no existe
+    """
+    if eliminatoria not in Partido.ELIMINATORIAS:
+        return None
+    indice = Partido.ELIMINATORIAS.index(eliminatoria) + 1
+    if indice >= len(Partido.ELIMINATORIAS):
+        return None
+    return Partido.ELIMINATORIAS[indice]
+
+
+def avanzar(partido):
+    """
+    Lleva el ganador de un partido al hueco que le corresponde en la ronda siguiente.
+
+    Debe llamarse dentro de la misma transacción que guarda el resultado.
+
+    Args:
+        partido (Partido): Partido cuyo resultado se acaba de guardar
+
+    Returns:
+        Partido: Partido de la ronda siguiente creado, modificado o borrado,
+                 o None si no hubo cambios
+
+    Raises:
+        Exception: Si no se puede guardar el partido de la ronda siguiente
+    """
+    ronda = siguiente_eliminatoria(partido.eliminatoria)
+    if ronda is None or partido.posicion is None:
+        return None
+
+    hermano = Partido.obtener_por_posicion(partido.eliminatoria, partido.posicion ^ 1)
+    if partido.posicion % 2 == 0:
+        local_id, visitante_id = _ganador(partido), _ganador(hermano)
+    else:
+        local_id, visitante_id = _ganador(hermano), _ganador(partido)
+
+    posicion = partido.posicion // 2
+    siguiente = Partido.obtener_por_posicion(ronda, posicion)
+
+    if siguiente is None:
+        if not local_id or not visitante_id:
+            return None
+
+        siguiente = Partido(
+            equipo_local_id=local_id,
+            equipo_visitante_id=visitante_id,
+            fecha_hora=_fecha_provisional(partido, hermano),
+            eliminatoria=ronda,
+            posicion=posicion,
+        )
+        if not siguiente.crear():
+            raise Exception(f"No se pudo crear el partido de {ronda}")
+        return siguiente
+
+    if siguiente.jugado:
+        # Un partido ya jugado no se reescribe: el organizador decide
+        if local_id != siguiente.equipo_local_id or (
+            visitante_id != siguiente.equipo_visitante_id
+        ):
+            print(
+                f"El partido {siguiente.id} de {ronda} ya se jugó; "
+                "no se actualizan sus equipos"
+            )
+        return None
+
+    if not local_id or not visitante_id:
+        # Un anterior ya no tiene ganador: el cruce aún no se conoce
+        if not siguiente.eliminar():
+            raise Exception(f"No se pudo borrar el partido {siguiente.id} de {ronda}")
+        return siguiente
+
+    if (siguiente.equipo_local_id, siguiente.equipo_visitante_id) == (
+        local_id,
+        visitante_id,
+    ):
+        return None
+
+    siguiente.equipo_local_id = local_id
+    siguiente.equipo_visitante_id = visitante_id
+
+    if not siguiente.actualizar_campos("equipo_local_id", "equipo_visitante_id"):
+        raise Exception(f"No se pudo actualizar el partido {siguiente.id} de {ronda}")
+    return siguiente
+
+
+def _ganador(partido):
+    if partido is None or not partido.jugado:
+        return None
+    return partido.ganador_id
+
+
+def _fecha_provisional(*partidos):
+    fechas = []
+    for p in partidos:
+        if p is None or not p.fecha_hora:
+            continue
+        for formato in (FORMATO_FECHA, "%Y-%m-%d %H:%M"):
+            try:
+                fechas.append(datetime.strptime(p.fecha_hora, formato))
+                break
+            except ValueError:
+                continue
+
+    base = max(fechas) if fechas else datetime.now()
+    return (base + timedelta(days=DIAS_ENTRE_RONDAS)).strftime(FORMATO_FECHA)
@@ -0,0 +1,152 @@
+"""
+Modelo de datos de las sanciones por tarjetas.
+
+La tabla sanciones guarda por jugador las amarillas y rojas acumuladas y los
+partidos de sanción ya cumplidos. La mantienen triggers
+(database.crear_triggers_sanciones) al insertar o borrar tarjetas y al
+marcar un partido como jugado, así que saber si un jugador puede jugar es
+una lectura por clave en lugar de recontar su historial:
+
+- Cada roja supone un partido de sanción.
+- Cada vez que las amarillas llegan a un múltiplo del umbral configurado
+  (clave umbral_amarillas de configuracion) se suma otro partido.
+- Un partido de sanción se cumple cuando su equipo juega un partido en el
+  que el jugador no recibe tarjetas. Se anota en sanciones_cumplidas y se
+  devuelve si ese partido vuelve a no jugado o se borra.
+"""
+
+from PySide6.QtSql import QSqlQuery
+
+from . import eventos
+
+UMBRAL_AMARILLAS_POR_DEFECTO = 5
+
+# Umbral de amarillas vigente, con el valor por defecto si falta o no es válido
+SQL_UMBRAL = (
+    "COALESCE((SELECT MAX(1, CAST(valor AS INTEGER)) FROM configuracion "
+    f"WHERE clave = 'umbral_amarillas'), {UMBRAL_AMARILLAS_POR_DEFECTO})"
+)
+
+# Partidos de sanción pendientes de la fila s de sanciones
+SQL_PENDIENTES = (
+    f"MAX(0, COALESCE(s.amarillas, 0) / {SQL_UMBRAL} "
+    "+ COALESCE(s.rojas, 0) - COALESCE(s.cumplidos, 0))"
+)
+
+
+class Sancion:
+    """
+    Clase con las consultas de sanciones de los jugadores.
+    """
+
+    @staticmethod
+    def obtener_umbral_amarillas():
+        """
+        Obtiene cuántas amarillas acumuladas suponen un partido de sanción.
+
+        Returns:
+            int: Umbral de amarillas
+        """
+        query = QSqlQuery(f"SELECT {SQL_UMBRAL}")
+        if query.next():
+            return query.value(0)
+        return UMBRAL_AMARILLAS_POR_DEFECTO
+
+    @staticmethod
+    def establecer_umbral_amarillas(umbral):
+        """
+        Cambia el umbral de amarillas.
+
+        Las sanciones pendientes se recalculan solas: se derivan de las
+        amarillas acumuladas al leerlas.
+
+        Args:
+            umbral (int): Amarillas que suponen un partido de sanción (mínimo 1)
+
+        Returns:
+            bool: True si se guardó correctamente, False en caso contrario
+        """
+        if int(umbral) < 1:
+            return False
+
+        query = QSqlQuery()
+        query.prepare(
+            "INSERT OR REPLACE INTO configuracion (clave, valor) "
+            "VALUES ('umbral_amarillas', ?)"
+        )
+        query.addBindValue(str(int(umbral)))
+
+        if query.exec():
+            # Cambia quién puede jugar en las plantillas de los partidos
+            eventos.publicar("sanciones", None, eventos.ACTUALIZAR)
+            return True
+        else:
+            print(f"Error al guardar el umbral de amarillas: {query.lastError().text()}")
+            return False
+
+    @staticmethod
+    def partidos_pendientes(jugador_ids):
+        """
+        Obtiene los partidos de sanción pendientes de varios jugadores.
+
+        Args:
+            jugador_ids (list): IDs de los jugadores
+
+        Returns:
+            dict: ID de jugador -> partidos pendientes; solo los sancionados
+        """
+        jugador_ids = list(jugador_ids)
+        if not jugador_ids:
+            return {}
+
+        pendientes = {}
+        query = QSqlQuery()
+        query.setForwardOnly(True)
+        marcadores = ", ".join("?" for _ in jugador_ids)
+        query.prepare(
+            f"""
+            SELECT s.jugador_id, {SQL_PENDIENTES}
+            FROM sanciones s
+            WHERE s.jugador_id IN ({marcadores})
+        """
+        )
+        for jugador_id in jugador_ids:
+            query.addBindValue(jugador_id)
+
+        if not query.exec():
+            print(f"Error al obtener sanciones: {query.lastError().text()}")
+            return pendientes
+
+        while query.next():
+            if query.value(1) > 0:
+                pendientes[query.value(0)] = query.value(1)
+
+        return pendientes
+
+    @staticmethod
+    def obtener_sancionados():
+        """
+        Obtiene los jugadores con partidos de sanción pendientes.
+
+        Returns:
+            list: Tuplas (jugador_id, nombre, partidos pendientes) por nombre
+        """
+        sancionados = []
+        query = QSqlQuery()
+        query.setForwardOnly(True)
+        if not query.exec(
+            f"""
+            SELECT j.id, j.nombre, {SQL_PENDIENTES} AS pendientes
+            FROM sanciones s
+            JOIN participantes j ON j.id = s.jugador_id
+            WHERE pendientes > 0
+            ORDER BY j.nombre
+        """
+        ):
+            print(f"Error al obtener sancionados: {query.lastError().text()}")
+            return sancionados
+
+        while query.next():
+            sancionados.append((query.value(0), query.value(1), query.value(2)))
+
+        return sancionados
@@ -6,6 +6,8 @@ Este módulo gestiona el registro de tarjetas (amarillas y rojas) en los partido
 
 from PySide6.QtSql import QSqlQuery
 
+from . import eventos
+
 
 class Tarjeta:
     """
@@ -55,6 +57,9 @@ class Tarjeta:
 
         if query.exec():
             self.id = query.lastInsertId()
+            eventos.publicar("tarjetas", self.id, eventos.CREAR)
+            # El trigger actualiza el contador del jugador
+            eventos.publicar("participantes", self.jugador_id, eventos.ACTUALIZAR)
             return True
         else:
             print(f"Error al registrar tarjeta: {query.lastError().text()}")
@@ -75,6 +80,9 @@ class Tarjeta:
         query.addBindValue(self.id)
 
         if query.exec():
+            eventos.publicar("tarjetas", self.id, eventos.ELIMINAR)
+            if self.jugador_id:
+                eventos.publicar("participantes", self.jugador_id, eventos.ACTUALIZAR)
             return True
         else:
             print(f"Error al eliminar tarjeta: {query.lastError().text()}")
@@ -189,11 +197,23 @@ class Tarjeta:
         Returns:
             bool: True si se eliminaron correctamente, False en caso contrario
         """
+        # Jugadores cuyos contadores modificarán los triggers al borrar
+        jugadores_ids = []
+        query = QSqlQuery()
+        query.prepare("SELECT DISTINCT jugador_id FROM tarjetas WHERE partido_id = ?")
+        query.addBindValue(partido_id)
+        if query.exec():
+            while query.next():
+                jugadores_ids.append(query.value(0))
+
         query = QSqlQuery()
         query.prepare("DELETE FROM tarjetas WHERE partido_id = ?")
         query.addBindValue(partido_id)
 
         if query.exec():
+            eventos.publicar("tarjetas", None, eventos.ELIMINAR)
+            for jugador_id in jugadores_ids:
+                eventos.publicar("participantes", jugador_id, eventos.ACTUALIZAR)
             return True
         else:
             print(f"Error al eliminar tarjetas del partido: {query.lastError().text()}")
@@ -246,6 +266,69 @@ class Tarjeta:
 
         return exito
 
+    @staticmethod
+    def sincronizar_partido(partido_id, tarjetas_por_jugador, minuto=None):
+        """
+        Ajusta las tarjetas de un partido a las cantidades indicadas por jugador.
+
+        Igual que Gol.sincronizar_partido: solo se insertan las tarjetas
+        nuevas y se borran las que sobran, conservando el minuto del resto.
+
+        Args:
+            partido_id (int): ID del partido
+            tarjetas_por_jugador (dict): {jugador_id: (amarillas, rojas)}
+            minuto (int, optional): Minuto de juego de las tarjetas nuevas
+
+        Returns:
+            bool: True si todos los cambios se guardaron correctamente
+        """
+        actuales = {}
+        query = QSqlQuery()
+        query.setForwardOnly(True)
+        query.prepare(
+            """
+            SELECT id, jugador_id, tipo, minuto
+            FROM tarjetas
+            WHERE partido_id = ?
+            ORDER BY minuto IS NULL, minuto, id
+        """
+        )
+        query.addBindValue(partido_id)
+        if not query.exec():
+            print(f"Error al leer tarjetas del partido: {query.lastError().text()}")
+            return False
+        while query.next():
+            tarjeta = Tarjeta(
+                id=query.value(0),
+                partido_id=partido_id,
+                jugador_id=query.value(1),
+                tipo=query.value(2),
+                minuto=query.value(3),
+            )
+            actuales.setdefault((tarjeta.jugador_id, tarjeta.tipo), []).append(tarjeta)
+
+        objetivos = {}
+        for jugador_id, (amarillas, rojas) in tarjetas_por_jugador.items():
+            objetivos[(jugador_id, Tarjeta.TIPO_AMARILLA)] = amarillas
+            objetivos[(jugador_id, Tarjeta.TIPO_ROJA)] = rojas
+
+        exito = True
+        for clave in set(actuales) | set(objetivos):
+            jugador_id, tipo = clave
+            registradas = actuales.get(clave, [])
+            objetivo = objetivos.get(clave, 0)
+
+            for _ in range(objetivo - len(registradas)):
+                tarjeta = Tarjeta(
+                    partido_id=partido_id, jugador_id=jugador_id, tipo=tipo, minuto=minuto
+                )
+                exito = tarjeta.guardar() and exito
+
+            for tarjeta in registradas[objetivo:][::-1]:
+                exito = tarjeta.eliminar() and exito
+
+        return exito
+
     def __repr__(self):
         """
         Representación técnica de la tarjeta.
@@ -0,0 +1,192 @@
+"""
+Detección de escrituras hechas por otra instancia de la aplicación.
+
+Cuando dos equipos abren el mismo fichero de base de datos, cada uno solo se
+entera de sus propias escrituras a través de Models.eventos. Este módulo
+consulta periódicamente PRAGMA data_version, que solo cambia cuando otra
+conexión confirma una transacción, y en ese caso publica en el bus de eventos
+las filas anotadas en registro_cambios para que las vistas actualicen
+únicamente lo que cambió.
+
+Si una tabla acumula más de MAX_CAMBIOS_POR_FILA entradas pendientes (una
+importación masiva, por ejemplo), se publica un único cambio de tabla
+completa (id None) en lugar de una notificación por fila. Tras cada
+lectura se poda el registro para que no crezca sin límite.
+"""
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtSql import QSqlQuery
+
+from . import database, eventos
+
+# Entradas pendientes de una tabla a partir de las cuales se recarga entera
+MAX_CAMBIOS_POR_FILA = 200
+
+
+class VigilanteCambios(QObject):
+    """
+    Clase que vigila la base de datos en busca de cambios de otros procesos.
+
+    Attributes:
+        intervalo_ms (int): Milisegundos entre comprobaciones
+    """
+
+    def __init__(self, intervalo_ms=1000, parent=None):
+        """
+        Inicializa el vigilante sin arrancarlo.
+        """
+        super().__init__(parent)
+        self.intervalo_ms = intervalo_ms
+        self._data_version = None
+        self._ultimo_id = 0
+        # Hasta dónde se ha podado registro_cambios desde esta instancia
+        self._podado_hasta = 0
+        # Hay escrituras propias cuyo registro aún no se ha saltado
+        self._escrituras_propias = False
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.comprobar)
+
+    def iniciar(self):
+        """
+        Arranca la vigilancia tomando el estado actual como punto de partida.
+        """
+        self._data_version = self._leer_data_version()
+        self._ultimo_id = self._leer_ultimo_id() or 0
+        eventos.suscribir(self._marcar_escritura_propia)
+        self._timer.start(self.intervalo_ms)
+
+    def detener(self):
+        """
+        Detiene la vigilancia.
+        """
+        self._timer.stop()
+        eventos.desuscribir(self._marcar_escritura_propia)
+
+    def _marcar_escritura_propia(self, cambio):
+        self._escrituras_propias = True
+
+    def comprobar(self):
+        """
+        Publica los cambios confirmados por otros procesos desde la última vez.
+
+        Returns:
+            int: Número de cambios publicados
+        """
+        # El máximo del registro se lee antes que data_version: si esta no ha
+        # cambiado, todo lo anotado hasta ese máximo son escrituras propias
+        ultimo_id = self._leer_ultimo_id() if self._escrituras_propias else None
+
+        data_version = self._leer_data_version()
+        if data_version is None:
+            # Base bloqueada por otro equipo: se reintenta en el siguiente tick
+            return 0
+
+        if data_version == self._data_version:
+            if ultimo_id is not None:
+                self._ultimo_id = ultimo_id
+                self._escrituras_propias = False
+                self._podar()
+            return 0
+
+        self._data_version = data_version
+        return self._publicar_pendientes()
+
+    def _publicar_pendientes(self):
+        desde = self._ultimo_id
+        query = QSqlQuery()
+        query.setForwardOnly(True)
+        query.prepare(
+            """
+            SELECT tabla, COUNT(*), MIN(id), MAX(id)
+            FROM registro_cambios
+            WHERE id > ?
+            GROUP BY tabla
+        """
+        )
+        query.addBindValue(desde)
+
+        if not query.exec():
+            print(f"Error al leer registro de cambios: {query.lastError().text()}")
+            return 0
+
+        pendientes = {}
+        primer_id = None
+        hasta = desde
+        while query.next():
+            pendientes[query.value(0)] = query.value(1)
+            if primer_id is None or query.value(2) < primer_id:
+                primer_id = query.value(2)
+            hasta = max(hasta, query.value(3))
+
+        if not pendientes:
+            return 0
+
+        if primer_id > desde + 1:
+            # Otra instancia podó entradas que no llegamos a leer: se notifica
+            # cada tabla completa para que las vistas recarguen
+            completas = set(database.TABLAS_VERSIONADAS)
+        else:
+            completas = {
+                tabla
+                for tabla, total in pendientes.items()
+                if total > MAX_CAMBIOS_POR_FILA
+            }
+
+        cambios = [(tabla, None, eventos.ACTUALIZAR) for tabla in sorted(completas)]
+        por_fila = [tabla for tabla in pendientes if tabla not in completas]
+        if por_fila:
+            marcadores = ", ".join("?" for _ in por_fila)
+            query.prepare(
+                f"""
+                SELECT tabla, fila_id, operacion
+                FROM registro_cambios
+                WHERE id > ? AND id <= ? AND tabla IN ({marcadores})
+                ORDER BY id
+            """
+            )
+            query.addBindValue(desde)
+            query.addBindValue(hasta)
+            for tabla in por_fila:
+                query.addBindValue(tabla)
+            if not query.exec():
+                print(f"Error al leer registro de cambios: {query.lastError().text()}")
+                return 0
+            while query.next():
+                cambios.append((query.value(0), query.value(1), query.value(2)))
+        query.finish()
+
+        self._ultimo_id = hasta
+        self._podar()
+
+        # Las notificaciones publicadas aquí no son escrituras propias
+        eventos.desuscribir(self._marcar_escritura_propia)
+        try:
+            for tabla, fila_id, operacion in cambios:
+                eventos.publicar(tabla, fila_id, operacion)
+        finally:
+            eventos.suscribir(self._marcar_escritura_propia)
+
+        return len(cambios)
+
+    def _podar(self):
+        """Poda el registro solo cuando ha crecido más allá de lo que se conserva."""
+        limite = self._ultimo_id - database.MAX_REGISTRO_CAMBIOS
+        if limite > self._podado_hasta and database.podar_registro_cambios(
+            self._ultimo_id
+        ):
+            self._podado_hasta = limite
+
+    def _leer_data_version(self):
+        query = QSqlQuery()
+        if query.exec("PRAGMA data_version") and query.next():
+            return query.value(0)
+        return None
+
+    def _leer_ultimo_id(self):
+        query = QSqlQuery()
+        if query.exec("SELECT COALESCE(MAX(id), 0) FROM registro_cambios") and (
+            query.next()
+        ):
+            return query.value(0)
+        return None
@@ -4,18 +4,25 @@ Cada pantalla de sección comparte:
 - Título
 - Botón volver a principal
 - Contenedor de contenido
+- Recarga solo cuando cambiaron las tablas que muestra
 
 """
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtWidgets import QLabel, QPushButton, QVBoxLayout, QWidget, QHBoxLayout
 
+from Models import database, eventos
+
 
 class BasePage(QWidget):
     volver_a_principal = Signal()
 
+    # Tablas de las que depende lo que muestra la página. Si ninguna cambió
+    # desde que se pintó, mostrarla de nuevo no recarga nada.
+    TABLAS: tuple = ()
+
     def __init__(self, titulo: str, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
@@ -51,6 +58,62 @@ class BasePage(QWidget):
         self._contenido_layout.setContentsMargins(14, 14, 14, 14)
         self._contenido_layout.setSpacing(14)
 
+        # Cambios del modelo pendientes de aplicar, agrupados por (entidad, id)
+        self._cambios_pendientes: dict = {}
+        # Versiones de TABLAS con las que se pintó la página por última vez
+        self._versiones_mostradas: dict | None = None
+
     @property
     def contenido_layout(self) -> QVBoxLayout:
         return self._contenido_layout
+
+    def on_show(self) -> None:
+        """Recarga el contenido de la página. Las páginas lo sobrescriben."""
+
+    def refrescar_si_cambio(self) -> bool:
+        """Llama a on_show() solo si cambió alguna de las TABLAS de la página.
+
+        Returns:
+            bool: True si la página se recargó
+        """
+        versiones = database.obtener_versiones(self.TABLAS)
+        if self.TABLAS and versiones == self._versiones_mostradas:
+            return False
+
+        self.on_show()
+        self._versiones_mostradas = versiones
+        return True
+
+    def escuchar_cambios(self, *entidades: str) -> None:
+        """Suscribe la página a los cambios de las entidades indicadas.
+
+        Sin argumentos se suscribe a sus TABLAS. Los cambios se acumulan y se
+        aplican juntos en la siguiente vuelta del bucle de eventos, de modo que
+        guardar un resultado con varios goles produce una única actualización
+        por fila.
+        """
+        eventos.suscribir(self._encolar_cambio, entidades or self.TABLAS)
+
+    def _encolar_cambio(self, cambio: eventos.Cambio) -> None:
+        if not self._cambios_pendientes:
+            QTimer.singleShot(0, self._aplicar_cambios_pendientes)
+        self._cambios_pendientes[(cambio.entidad, cambio.id)] = cambio
+
+    def _aplicar_cambios_pendientes(self) -> None:
+        cambios = list(self._cambios_pendientes.values())
+        self._cambios_pendientes.clear()
+        for cambio in cambios:
+            try:
+                self.aplicar_cambio(cambio)
+            except Exception as e:
+                print(f"Error al aplicar {cambio}: {e}")
+                # Sin garantía de estar al día: recargar al volver a mostrarse
+                self._versiones_mostradas = None
+                return
+
+        # Las filas ya reflejan el cambio; no hace falta recargar al mostrarse
+        if self._versiones_mostradas is not None:
+            self._versiones_mostradas = database.obtener_versiones(self.TABLAS)
+
+    def aplicar_cambio(self, cambio: eventos.Cambio) -> None:
+        """Actualiza solo lo afectado por un cambio. Las páginas lo sobrescriben."""
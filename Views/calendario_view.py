@@ -4,19 +4,23 @@ Diseño hecho en ui con QTDesigner en resources/ui y mejorado con Python
 para hacerlo más escalable, mantenible y mejorable. Menos estático.
 
 - Dos paneles translúcidos.
-- Izquierda: QCalendarWidget; click abre diálogo de alta/edición de partido.
-- Derecha: lista scrollable con "Escudo nombre VS Escudo nombre" + papelera.
+- Izquierda: QCalendarWidget con los días con partido resaltados; click filtra
+  la lista por ese día y doble click abre el alta de partido con esa fecha.
+- Derecha: lista scrollable con "Escudo nombre VS Escudo nombre" + papelera,
+  con los partidos del mes visible cargados en una sola consulta.
 - Click en partido abre diálogo para editar.
+- Botón para programar fechas y árbitros de todos los pendientes.
+- Botón para repartir árbitros entre los partidos que no tienen.
 """
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QDate
+from PySide6.QtGui import QColor, QFont, QTextCharFormat
 from PySide6.QtSvgWidgets import QSvgWidget
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QCalendarWidget,
-    QDialog,
     QFrame,
     QHBoxLayout,
     QLabel,
@@ -30,11 +34,12 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from Models import eventos
 from Models.equipo import Equipo
 from Models.participante import Participante
 from Models.partido import Partido
 from Views.base_page import BasePage
-from Views.dialogs import PartidoDialog
+from Views.dialogs import PartidoDialog, PlanificadorDialog
 from Views.utils import obtener_ruta_recurso
 
 
@@ -172,6 +177,8 @@ class _PartidoItem(QWidget):
 
 
 class CalendarioPage(BasePage):
+    TABLAS = ("partidos", "equipos", "participantes")
+
     def __init__(self, parent=None):
         super().__init__("Calendario", parent)
 
@@ -204,8 +211,60 @@ class CalendarioPage(BasePage):
 
         self.calendar = QCalendarWidget()
         self.calendar.clicked.connect(self._click_dia)
+        self.calendar.activated.connect(self._crear_en_dia)
+        self.calendar.currentPageChanged.connect(self._cargar_mes)
         izq.addWidget(self.calendar, 1)
 
+        # Programación automática de fechas y árbitros de los pendientes
+        self.btn_planificar = QPushButton("🗓 Planificar partidos pendientes")
+        self.btn_planificar.setStyleSheet(
+            """
+            QPushButton {
+                background-color: #27ae60;
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 10px 20px;
+                font-size: 10pt;
+                font-weight: bold;
+                min-height: 35px;
+            }
+            QPushButton:hover {
+                background-color: #229954;
+            }
+            QPushButton:pressed {
+                background-color: #1e8449;
+            }
+        """
+        )
+        self.btn_planificar.clicked.connect(self._planificar)
+        izq.addWidget(self.btn_planificar)
+
+        # Reparto equilibrado de árbitros entre los partidos que no tienen
+        self.btn_arbitros = QPushButton("🧑‍⚖️ Asignar árbitros")
+        self.btn_arbitros.setStyleSheet(
+            """
+            QPushButton {
+                background-color: #3498db;
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 10px 20px;
+                font-size: 10pt;
+                font-weight: bold;
+                min-height: 35px;
+            }
+            QPushButton:hover {
+                background-color: #2980b9;
+            }
+            QPushButton:pressed {
+                background-color: #21618c;
+            }
+        """
+        )
+        self.btn_arbitros.clicked.connect(self._asignar_arbitros)
+        izq.addWidget(self.btn_arbitros)
+
         self.panel_der = QFrame()
         self.panel_der.setObjectName("panel_derecho")
         self.panel_der.setStyleSheet(
@@ -228,9 +287,9 @@ class CalendarioPage(BasePage):
         der.setContentsMargins(15, 15, 15, 15)
         der.setSpacing(10)
 
-        titulo = QLabel("Partidos")
-        titulo.setStyleSheet("font-size: 14pt; font-weight: 800; color: #2c3e50;")
-        der.addWidget(titulo)
+        self.titulo = QLabel("Partidos")
+        self.titulo.setStyleSheet("font-size: 14pt; font-weight: 800; color: #2c3e50;")
+        der.addWidget(self.titulo)
 
         self.lista = QListWidget()
         self.lista.setSelectionMode(QAbstractItemView.SingleSelection)
@@ -281,26 +340,157 @@ class CalendarioPage(BasePage):
         splitter.setStretchFactor(0, 1)
         splitter.setStretchFactor(1, 1)
 
-        self._refrescar_lista()
+        # Partidos del mes visible por día ("YYYY-MM-DD") y día filtrado
+        self._partidos_mes = {}
+        self._dia = None
+        self._cargar_mes(self.calendar.yearShown(), self.calendar.monthShown())
+
+        self.escuchar_cambios()
 
     def on_show(self):
+        self._cargar_mes(self.calendar.yearShown(), self.calendar.monthShown())
+
+    def _cargar_mes(self, anio, mes):
+        self._partidos_mes = Partido.obtener_por_mes(anio, mes)
+        if self._dia and not self._dia.startswith(f"{anio:04d}-{mes:02d}"):
+            self._dia = None
+        self._resaltar_dias()
         self._refrescar_lista()
 
+    def _resaltar_dias(self):
+        # Una fecha nula limpia el formato de todos los días
+        self.calendar.setDateTextFormat(QDate(), QTextCharFormat())
+
+        formato = QTextCharFormat()
+        formato.setFontWeight(QFont.Bold)
+        formato.setBackground(QColor(52, 152, 219, 90))
+        for dia in self._partidos_mes:
+            self.calendar.setDateTextFormat(
+                QDate.fromString(dia, "yyyy-MM-dd"), formato
+            )
+
     def _click_dia(self, qdate):
-        # Crear partido (la fecha del diálogo ya es editable)
-        dlg = PartidoDialog(self)
-        if dlg.exec() == QDialog.Accepted:
-            self._refrescar_lista()
+        # Filtrar por el día pulsado; pulsarlo otra vez vuelve al mes completo
+        dia = qdate.toString("yyyy-MM-dd")
+        self._dia = None if dia == self._dia else dia
+        self._refrescar_lista()
+
+    def _crear_en_dia(self, qdate):
+        dlg = PartidoDialog(self, fecha=qdate.toPython())
+        dlg.exec()
+
+    def _planificar(self):
+        # Las filas se actualizan con los eventos de cada partido guardado
+        dlg = PlanificadorDialog(self)
+        dlg.exec()
+
+    def _asignar_arbitros(self):
+        from Controllers import arbitros_controller
+
+        resultado = arbitros_controller.asignar_arbitros()
+        if resultado is None:
+            QMessageBox.critical(self, "Error", "No se pudieron asignar los árbitros.")
+            return
+
+        asignados, sin_arbitro = resultado
+        mensaje = f"{asignados} partido(s) con árbitro asignado."
+        if sin_arbitro:
+            mensaje += (
+                f"\n{sin_arbitro} partido(s) siguen sin árbitro: no hay ninguno "
+                "libre a esa hora que no sea del curso de los equipos."
+            )
+        QMessageBox.information(self, "Árbitros", mensaje)
+
+    def _partidos_visibles(self):
+        if self._dia:
+            return self._partidos_mes.get(self._dia, [])
+        return [p for dia in sorted(self._partidos_mes) for p in self._partidos_mes[dia]]
 
     def _refrescar_lista(self):
-        partidos = Partido.obtener_todos()
+        if self._dia:
+            self.titulo.setText(
+                "Partidos del "
+                + QDate.fromString(self._dia, "yyyy-MM-dd").toString("dd/MM/yyyy")
+            )
+        else:
+            self.titulo.setText("Partidos del mes")
+
         self.lista.clear()
-        for p in partidos:
-            item = QListWidgetItem()
-            item.setData(Qt.UserRole, p.id)
-            item.setSizeHint(QSize(100, 80))
-            self.lista.addItem(item)
-            self.lista.setItemWidget(item, _PartidoItem(p, self._eliminar_partido))
+        for p in self._partidos_visibles():
+            self._insertar_item(self.lista.count(), p)
+
+    def _insertar_item(self, fila: int, partido: Partido):
+        item = QListWidgetItem()
+        item.setData(Qt.UserRole, partido.id)
+        item.setSizeHint(QSize(100, 80))
+        self.lista.insertItem(fila, item)
+        self.lista.setItemWidget(item, _PartidoItem(partido, self._eliminar_partido))
+
+    def aplicar_cambio(self, cambio):
+        """Actualiza solo las filas de los partidos afectados."""
+        if cambio.entidad == "partidos" and cambio.id is not None:
+            self._actualizar_mes(cambio.id)
+            self._actualizar_item(cambio.id)
+            return
+
+        if cambio.entidad in ("equipos", "participantes") and (
+            cambio.operacion == eventos.ACTUALIZAR
+        ):
+            # Nombre, escudo o árbitro mostrado en las filas de esos partidos
+            for fila in range(self.lista.count()):
+                p = self.lista.itemWidget(self.lista.item(fila)).partido
+                if cambio.entidad == "equipos":
+                    afectado = cambio.id in (p.equipo_local_id, p.equipo_visitante_id)
+                else:
+                    afectado = cambio.id == p.arbitro_id
+                if afectado:
+                    self._actualizar_item(p.id)
+            return
+
+        # Los borrados en cascada pueden afectar a varios partidos
+        self._cargar_mes(self.calendar.yearShown(), self.calendar.monthShown())
+
+    def _actualizar_mes(self, partido_id):
+        """Lleva un partido modificado al día que le toca dentro del mes cargado."""
+        for dia, partidos in list(self._partidos_mes.items()):
+            restantes = [p for p in partidos if p.id != partido_id]
+            if len(restantes) != len(partidos):
+                if restantes:
+                    self._partidos_mes[dia] = restantes
+                else:
+                    del self._partidos_mes[dia]
+
+        partido = Partido.obtener_por_id(partido_id)
+        mes = f"{self.calendar.yearShown():04d}-{self.calendar.monthShown():02d}"
+        if partido and partido.fecha_hora.startswith(mes):
+            dia = self._partidos_mes.setdefault(partido.fecha_hora[:10], [])
+            dia.append(partido)
+            dia.sort(key=lambda p: p.fecha_hora)
+
+        self._resaltar_dias()
+
+    def _actualizar_item(self, partido_id):
+        """Sustituye, inserta o quita la fila de un único partido."""
+        for fila in range(self.lista.count()):
+            if self.lista.item(fila).data(Qt.UserRole) == partido_id:
+                self.lista.takeItem(fila)
+                break
+
+        # La fila solo se vuelve a poner si el partido sigue en el filtro
+        partido = next(
+            (p for p in self._partidos_visibles() if p.id == partido_id), None
+        )
+        if partido is None:
+            return
+
+        # Mantener el orden por fecha
+        fila = self.lista.count()
+        for i in range(self.lista.count()):
+            existente = self.lista.itemWidget(self.lista.item(i)).partido
+            if existente.fecha_hora > partido.fecha_hora:
+                fila = i
+                break
+        self._insertar_item(fila, partido)
 
     def _editar_seleccionado(self, item: QListWidgetItem):
         partido_id = item.data(Qt.UserRole)
@@ -308,8 +498,7 @@ class CalendarioPage(BasePage):
         if not p:
             return
         dlg = PartidoDialog(self, partido=p)
-        if dlg.exec() == QDialog.Accepted:
-            self._refrescar_lista()
+        dlg.exec()
 
     def _eliminar_partido(self, partido: Partido):
         msg = QMessageBox(self)
@@ -325,4 +514,3 @@ class CalendarioPage(BasePage):
         if not partido.eliminar():
             QMessageBox.critical(self, "Error", "No se pudo eliminar el partido.")
             return
-        self._refrescar_lista()
@@ -0,0 +1,120 @@
+"""Catálogo de escudos compartido por los selectores de escudo.
+
+Se carga una sola vez y se mantiene al día en memoria:
+- Los archivos .svg de Resources/img/escudos, releídos solo cuando un
+  QFileSystemWatcher avisa de que la carpeta ha cambiado.
+- El escudo de cada equipo, actualizado con los cambios de "equipos" del bus
+  de eventos: un alta o edición relee solo ese equipo.
+- Los QIcon ya creados, para no reconstruirlos cada vez que se abre el diálogo.
+  Se guardan junto a la fecha de modificación del archivo: si un .svg se
+  edita en su sitio (la carpeta no cambia), el icono se vuelve a crear.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import Counter
+
+from PySide6.QtCore import QFileSystemWatcher, QObject
+from PySide6.QtGui import QIcon
+
+from Models import eventos
+from Models.equipo import Equipo
+from Views.utils import obtener_ruta_recurso
+
+_catalogo = None
+
+
+def obtener_catalogo() -> "CatalogoEscudos":
+    """Devuelve el catálogo de escudos, creándolo la primera vez."""
+    global _catalogo
+    if _catalogo is None:
+        _catalogo = CatalogoEscudos(obtener_ruta_recurso("Resources/img/escudos"))
+    return _catalogo
+
+
+class CatalogoEscudos(QObject):
+    """Escudos de la carpeta de recursos y cuáles están asignados a equipos."""
+
+    def __init__(self, ruta_escudos: str, parent=None):
+        super().__init__(parent)
+        self._ruta = ruta_escudos
+        self._archivos: set[str] = set()
+        # Nombre del escudo -> (fecha de modificación del archivo, icono)
+        self._iconos: dict[str, tuple[float, QIcon]] = {}
+        # ID de equipo -> escudo, y cuántos equipos usan cada escudo
+        self._escudo_equipo: dict[int, str] = {}
+        self._usos: Counter = Counter()
+
+        self._vigilante = QFileSystemWatcher(self)
+        if os.path.isdir(self._ruta):
+            self._vigilante.addPath(self._ruta)
+        self._vigilante.directoryChanged.connect(self._leer_carpeta)
+
+        self._leer_carpeta()
+        self._cargar_en_uso()
+        eventos.suscribir(self._aplicar_cambio, ("equipos",))
+
+    # ── Consultas ───────────────────────────────────────────────────────────
+
+    def disponibles(self) -> list[str]:
+        """Escudos de la carpeta que no usa ningún equipo, por nombre."""
+        return sorted(self._archivos - self._usos.keys())
+
+    def icono(self, nombre_svg: str) -> QIcon:
+        """QIcon de un escudo, creado de nuevo solo si el archivo ha cambiado."""
+        ruta = os.path.join(self._ruta, nombre_svg)
+        try:
+            modificado = os.path.getmtime(ruta)
+        except OSError:
+            modificado = None
+
+        guardado = self._iconos.get(nombre_svg)
+        if guardado is not None and guardado[0] == modificado:
+            return guardado[1]
+
+        icono = QIcon(ruta)
+        self._iconos[nombre_svg] = (modificado, icono)
+        return icono
+
+    # ── Carpeta de escudos ──────────────────────────────────────────────────
+
+    def _leer_carpeta(self, _ruta=None):
+        try:
+            archivos = {f for f in os.listdir(self._ruta) if f.endswith(".svg")}
+        except FileNotFoundError:
+            print(f"No se encontró la carpeta de escudos: {self._ruta}")
+            archivos = set()
+
+        # Los iconos de archivos borrados o renombrados ya no sirven
+        for nombre in self._archivos - archivos:
+            self._iconos.pop(nombre, None)
+        self._archivos = archivos
+
+        # Algunos sistemas dejan de vigilar la carpeta si se borra y se recrea
+        if os.path.isdir(self._ruta) and self._ruta not in self._vigilante.directories():
+            self._vigilante.addPath(self._ruta)
+
+    # ── Escudos en uso ──────────────────────────────────────────────────────
+
+    def _cargar_en_uso(self):
+        self._escudo_equipo = Equipo.obtener_escudos_en_uso()
+        self._usos = Counter(self._escudo_equipo.values())
+
+    def _aplicar_cambio(self, cambio):
+        if cambio.id is None:
+            self._cargar_en_uso()
+            return
+
+        anterior = self._escudo_equipo.pop(cambio.id, None)
+        if anterior is not None:
+            self._usos[anterior] -= 1
+            if self._usos[anterior] <= 0:
+                del self._usos[anterior]
+
+        equipo = None
+        if cambio.operacion != eventos.ELIMINAR:
+            equipo = Equipo.obtener_por_id(cambio.id)
+        if equipo is not None and equipo.escudo:
+            self._escudo_equipo[cambio.id] = equipo.escudo
+            self._usos[equipo.escudo] += 1
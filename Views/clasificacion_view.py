@@ -4,580 +4,488 @@ Diseño hecho en ui con QTDesigner en resources/ui y mejorado con Python
 para hacerlo más escalable, mantenible y mejorable. Menos estático.
 
 Bracket de eliminatorias real:
-- Octavos de final (8 partidos)
-- Cuartos de final (4 partidos)
-- Semifinales (2 partidos)
-- Final (1 partido) en el centro
+- Tantas rondas como pida la primera eliminatoria con partidos
+  (de Sesentaicuatroavos a Final, según Partido.ELIMINATORIAS)
+- Cuadro simétrico con la Final en el centro; cada partido en el hueco de
+  su posición, de modo que los huecos 2k y 2k+1 alimentan el k siguiente
 - Líneas conectando las fases
 - Resultados mostrados: ganador en verde, perdedor en rojo
+- Zoom con la rueda, desplazamiento arrastrando y doble clic para encajar
+- Al alejarse se ocultan escudos y marcadores para que dibujar sea barato
 """
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, QRectF, QPointF, QSize
-from PySide6.QtGui import QColor, QPainter, QPen, QFont, QBrush, QPixmap
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QColor, QPainter, QPen, QFont, QPixmap, QPainterPath
 from PySide6.QtWidgets import (
     QFrame,
     QVBoxLayout,
-    QWidget,
-    QScrollArea,
     QPushButton,
     QFileDialog,
     QMessageBox,
+    QGraphicsItem,
+    QGraphicsPathItem,
+    QGraphicsScene,
+    QGraphicsSimpleTextItem,
+    QGraphicsView,
+    QStyleOptionGraphicsItem,
 )
 from PySide6.QtSvg import QSvgRenderer
 import os
 
+from Models import eventos
 from Models.equipo import Equipo
 from Models.partido import Partido
 from Views.base_page import BasePage
+from Views.utils import obtener_ruta_recurso
+
+
+# Dimensiones de cada caja y separación entre cajas y columnas
+CAJA_ANCHO = 126
+CAJA_ALTO = 70
+SEPARACION_Y = 30
+SEPARACION_COLUMNAS = 160
+
+# Niveles de detalle (escala efectiva) a partir de los que se dibuja cada cosa
+DETALLE_NOMBRES = 0.45
+DETALLE_ESCUDOS = 0.8
+
+# Tamaño en píxeles al que se rasterizan los escudos (cubre zoom hasta 2x)
+ESCUDO_MAX = 20
+ESCUDO_RESOLUCION = 2
+
+ZOOM_MIN = 0.05
+ZOOM_MAX = 4.0
+
+_escudos_cache: dict[str, QPixmap | None] = {}
+
+
+def _pixmap_escudo(nombre_archivo: str) -> QPixmap | None:
+    """Devuelve el escudo rasterizado una sola vez, o None si no existe."""
+    if nombre_archivo in _escudos_cache:
+        return _escudos_cache[nombre_archivo]
+
+    pixmap = None
+    ruta = obtener_ruta_recurso(os.path.join("Resources", "img", "escudos", nombre_archivo))
+    lado = ESCUDO_MAX * ESCUDO_RESOLUCION
+    if os.path.exists(ruta):
+        if nombre_archivo.endswith(".svg"):
+            renderer = QSvgRenderer(ruta)
+            if renderer.isValid():
+                svg_size = renderer.defaultSize()
+                escala = min(lado / svg_size.width(), lado / svg_size.height())
+                pixmap = QPixmap(
+                    max(1, int(svg_size.width() * escala)),
+                    max(1, int(svg_size.height() * escala)),
+                )
+                pixmap.fill(Qt.transparent)
+                p = QPainter(pixmap)
+                renderer.render(p)
+                p.end()
+        else:
+            original = QPixmap(ruta)
+            if not original.isNull():
+                pixmap = original.scaled(
+                    lado, lado, Qt.KeepAspectRatio, Qt.SmoothTransformation
+                )
 
+    _escudos_cache[nombre_archivo] = pixmap
+    return pixmap
 
-class BracketWidget(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        # Tamaño fijo para que todo el bracket quepa sin márgenes
-        self.setFixedSize(1050, 700)
-        self._partidos = {
-            "Octavos": [],
-            "Cuartos": [],
-            "Semifinales": [],
-            "Final": None,
-        }
-
-    def set_data(self, partidos_dict):
-        self._partidos = partidos_dict
-        self.update()
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
 
-        w = self.width()
-        h = self.height()
+def rondas_del_cuadro(partidos) -> list[str]:
+    """Eliminatorias que forman el cuadro, desde la más temprana con partidos.
 
-        # Dimensiones
-        box_w = 126  # 30% más estrecho
-        box_h = 70
-        gap_y = 30
-        col_spacing = 200
+    Sin partidos se muestra un cuadro vacío desde Octavos.
+    """
+    indices = [
+        Partido.ELIMINATORIAS.index(p.eliminatoria)
+        for p in partidos
+        if p.eliminatoria in Partido.ELIMINATORIAS
+    ]
+    inicio = min(indices) if indices else Partido.ELIMINATORIAS.index("Octavos")
+    return Partido.ELIMINATORIAS[inicio:]
 
-        # Función para dibujar un partido con resultados
-        def draw_match(x, y, partido, fase=""):
-            rect = QRectF(x, y, box_w, box_h)
 
-            # Fondo de la caja
-            painter.setPen(QPen(QColor(52, 152, 219), 2))
-            painter.setBrush(QColor(255, 255, 255, 230))
-            painter.drawRoundedRect(rect, 8, 8)
+class PartidoCuadroItem(QGraphicsItem):
+    """Caja de un partido en el cuadro.
 
-            if not partido:
-                # Placeholder
-                painter.setPen(QColor(150, 150, 150))
-                font = QFont()
-                font.setPointSize(9)
-                painter.setFont(font)
-                painter.drawText(rect, Qt.AlignCenter, "TBD")
-                return rect
-
-            # Obtener equipos y resultados
-            e1 = Equipo.obtener_por_id(partido.equipo_local_id)
-            e2 = Equipo.obtener_por_id(partido.equipo_visitante_id)
-
-            nombre_local = e1.nombre if e1 else "—"
-            nombre_vis = e2.nombre if e2 else "—"
-
-            # Altura para cada equipo
-            equipo_h = box_h / 2
-
-            # Determinar ganador/perdedor si el partido está jugado
-            ganador_local = False
-            ganador_vis = False
-            if partido.jugado:
-                if partido.goles_local > partido.goles_visitante:
-                    ganador_local = True
-                elif partido.goles_visitante > partido.goles_local:
-                    ganador_vis = True
-
-            # Dibujar equipo local (mitad superior)
-            rect_local = QRectF(x, y, box_w, equipo_h)
-            if ganador_local:
-                painter.setBrush(QColor(46, 204, 113, 180))  # Verde
-            elif partido.jugado and ganador_vis:
-                painter.setBrush(QColor(231, 76, 60, 180))  # Rojo
-            else:
-                painter.setBrush(QColor(255, 255, 255, 230))
-
-            painter.setPen(QPen(QColor(52, 152, 219), 1))
-            painter.drawRect(rect_local)
-
-            # Escudo del equipo local
-            escudo_max = 20
-            escudo_x = x + 3
-            escudo_y_base = y + equipo_h / 2
-
-            if e1 and e1.escudo:
-                ruta_escudo = os.path.join("Resources", "img", "escudos", e1.escudo)
-                if os.path.exists(ruta_escudo):
-                    if e1.escudo.endswith(".svg"):
-                        renderer = QSvgRenderer(ruta_escudo)
-                        svg_size = renderer.defaultSize()
-
-                        # Calcular escala para que quepa en 20x20, limitando ambas dimensiones
-                        scale_w = escudo_max / svg_size.width()
-                        scale_h = escudo_max / svg_size.height()
-                        scale = min(scale_w, scale_h)  # Usar la escala más restrictiva
-
-                        # Calcular dimensiones finales
-                        final_w = svg_size.width() * scale
-                        final_h = svg_size.height() * scale
-
-                        # Centrar en el espacio disponible
-                        offset_x = (escudo_max - final_w) / 2
-                        offset_y = -final_h / 2
-
-                        renderer.render(
-                            painter,
-                            QRectF(
-                                escudo_x + offset_x,
-                                escudo_y_base + offset_y,
-                                final_w,
-                                final_h,
-                            ),
-                        )
-                    else:
-                        pixmap = QPixmap(ruta_escudo)
-                        if not pixmap.isNull():
-                            pixmap_scaled = pixmap.scaled(
-                                escudo_max,
-                                escudo_max,
-                                Qt.KeepAspectRatio,
-                                Qt.SmoothTransformation,
-                            )
-                            # Centrar el pixmap
-                            offset_x = (escudo_max - pixmap_scaled.width()) / 2
-                            offset_y = -pixmap_scaled.height() / 2
-                            painter.drawPixmap(
-                                int(escudo_x + offset_x),
-                                int(escudo_y_base + offset_y),
-                                pixmap_scaled,
-                            )
-
-            # Nombre del equipo local
-            font = QFont()
-            font.setPointSize(9)
-            font.setBold(ganador_local)
-            painter.setFont(font)
-            painter.setPen(QColor(44, 62, 80))
+    Se cachea en coordenadas de dispositivo: solo se vuelve a pintar al
+    cambiar el partido, un equipo o el zoom.
+    """
 
-            text_rect_local = rect_local.adjusted(26, 0, -35, 0)
-            painter.drawText(
-                text_rect_local, Qt.AlignVCenter | Qt.AlignLeft, nombre_local
-            )
+    def __init__(self, equipos: dict, partido=None):
+        super().__init__()
+        self._equipos = equipos
+        self.partido = partido
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
-            # Goles del equipo local
-            if partido.jugado:
-                goles_rect_local = QRectF(x + box_w - 32, y + 2, 28, equipo_h - 4)
-                painter.setBrush(QColor(52, 152, 219, 200))
-                painter.drawRoundedRect(goles_rect_local, 4, 4)
+    def boundingRect(self) -> QRectF:
+        return QRectF(-1, -1, CAJA_ANCHO + 2, CAJA_ALTO + 2)
 
-                font.setPointSize(14)
-                font.setBold(True)
-                painter.setFont(font)
-                painter.setPen(QColor(255, 255, 255))
-                painter.drawText(
-                    goles_rect_local, Qt.AlignCenter, str(partido.goles_local)
-                )
+    def set_partido(self, partido):
+        self.partido = partido
+        self.update()
 
-            # Dibujar equipo visitante (mitad inferior)
-            rect_vis = QRectF(x, y + equipo_h, box_w, equipo_h)
-            if ganador_vis:
-                painter.setBrush(QColor(46, 204, 113, 180))  # Verde
-            elif partido.jugado and ganador_local:
-                painter.setBrush(QColor(231, 76, 60, 180))  # Rojo
-            else:
-                painter.setBrush(QColor(255, 255, 255, 230))
-
-            painter.setPen(QPen(QColor(52, 152, 219), 1))
-            painter.drawRect(rect_vis)
-
-            # Escudo del equipo visitante
-            escudo_max = 20
-            escudo_x = x + 3
-            escudo_y_base = y + equipo_h + equipo_h / 2
-
-            if e2 and e2.escudo:
-                ruta_escudo = os.path.join("Resources", "img", "escudos", e2.escudo)
-                if os.path.exists(ruta_escudo):
-                    if e2.escudo.endswith(".svg"):
-                        renderer = QSvgRenderer(ruta_escudo)
-                        svg_size = renderer.defaultSize()
-
-                        # Calcular escala para que quepa en 20x20, limitando ambas dimensiones
-                        scale_w = escudo_max / svg_size.width()
-                        scale_h = escudo_max / svg_size.height()
-                        scale = min(scale_w, scale_h)  # Usar la escala más restrictiva
-
-                        # Calcular dimensiones finales
-                        final_w = svg_size.width() * scale
-                        final_h = svg_size.height() * scale
-
-                        # Centrar en el espacio disponible
-                        offset_x = (escudo_max - final_w) / 2
-                        offset_y = -final_h / 2
-
-                        renderer.render(
-                            painter,
-                            QRectF(
-                                escudo_x + offset_x,
-                                escudo_y_base + offset_y,
-                                final_w,
-                                final_h,
-                            ),
-                        )
-                    else:
-                        pixmap = QPixmap(ruta_escudo)
-                        if not pixmap.isNull():
-                            pixmap_scaled = pixmap.scaled(
-                                escudo_max,
-                                escudo_max,
-                                Qt.KeepAspectRatio,
-                                Qt.SmoothTransformation,
-                            )
-                            # Centrar el pixmap
-                            offset_x = (escudo_max - pixmap_scaled.width()) / 2
-                            offset_y = -pixmap_scaled.height() / 2
-                            painter.drawPixmap(
-                                int(escudo_x + offset_x),
-                                int(escudo_y_base + offset_y),
-                                pixmap_scaled,
-                            )
-
-            # Nombre del equipo visitante
-            font.setPointSize(9)
-            font.setBold(ganador_vis)
-            painter.setFont(font)
-            painter.setPen(QColor(44, 62, 80))
+    def contiene_equipo(self, equipo_id) -> bool:
+        return bool(self.partido) and equipo_id in (
+            self.partido.equipo_local_id,
+            self.partido.equipo_visitante_id,
+        )
 
-            text_rect_vis = rect_vis.adjusted(26, 0, -35, 0)
-            painter.drawText(text_rect_vis, Qt.AlignVCenter | Qt.AlignLeft, nombre_vis)
+    def paint(self, painter, option, widget=None):
+        detalle = QStyleOptionGraphicsItem.levelOfDetailFromTransform(
+            painter.worldTransform()
+        )
+        rect = QRectF(0, 0, CAJA_ANCHO, CAJA_ALTO)
 
-            # Goles del equipo visitante
-            if partido.jugado:
-                goles_rect_vis = QRectF(
-                    x + box_w - 32, y + equipo_h + 2, 28, equipo_h - 4
-                )
-                painter.setBrush(QColor(52, 152, 219, 200))
-                painter.drawRoundedRect(goles_rect_vis, 4, 4)
+        # Fondo de la caja
+        painter.setPen(QPen(QColor(52, 152, 219), 2))
+        painter.setBrush(QColor(255, 255, 255, 230))
+        painter.drawRoundedRect(rect, 8, 8)
 
-                font.setPointSize(14)
-                font.setBold(True)
+        partido = self.partido
+        if not partido:
+            if detalle >= DETALLE_NOMBRES:
+                # Placeholder
+                painter.setPen(QColor(150, 150, 150))
+                font = QFont()
+                font.setPointSize(9)
                 painter.setFont(font)
-                painter.setPen(QColor(255, 255, 255))
-                painter.drawText(
-                    goles_rect_vis, Qt.AlignCenter, str(partido.goles_visitante)
+                painter.drawText(rect, Qt.AlignCenter, "TBD")
+            return
+
+        # Determinar ganador/perdedor si el partido está jugado
+        ganador_local = False
+        ganador_vis = False
+        if partido.jugado:
+            if partido.goles_local > partido.goles_visitante:
+                ganador_local = True
+            elif partido.goles_visitante > partido.goles_local:
+                ganador_vis = True
+
+        equipo_h = CAJA_ALTO / 2
+        self._pintar_equipo(
+            painter,
+            QRectF(0, 0, CAJA_ANCHO, equipo_h),
+            self._equipos.get(partido.equipo_local_id),
+            partido.goles_local if partido.jugado else None,
+            ganador_local,
+            ganador_vis,
+            detalle,
+        )
+        self._pintar_equipo(
+            painter,
+            QRectF(0, equipo_h, CAJA_ANCHO, equipo_h),
+            self._equipos.get(partido.equipo_visitante_id),
+            partido.goles_visitante if partido.jugado else None,
+            ganador_vis,
+            ganador_local,
+            detalle,
+        )
+
+    def _pintar_equipo(self, painter, rect, equipo, goles, gana, pierde, detalle):
+        """Dibuja la mitad de la caja de un equipo según el nivel de detalle."""
+        if gana:
+            painter.setBrush(QColor(46, 204, 113, 180))  # Verde
+        elif pierde:
+            painter.setBrush(QColor(231, 76, 60, 180))  # Rojo
+        else:
+            painter.setBrush(QColor(255, 255, 255, 230))
+        painter.setPen(QPen(QColor(52, 152, 219), 1))
+        painter.drawRect(rect)
+
+        if detalle < DETALLE_NOMBRES:
+            return
+
+        con_extras = detalle >= DETALLE_ESCUDOS
+
+        # Escudo del equipo
+        if con_extras and equipo and equipo.escudo:
+            pixmap = _pixmap_escudo(equipo.escudo)
+            if pixmap:
+                w = pixmap.width() / ESCUDO_RESOLUCION
+                h = pixmap.height() / ESCUDO_RESOLUCION
+                destino = QRectF(
+                    rect.x() + 3 + (ESCUDO_MAX - w) / 2,
+                    rect.center().y() - h / 2,
+                    w,
+                    h,
                 )
+                painter.drawPixmap(destino, pixmap, QRectF(pixmap.rect()))
 
-            return rect
-
-        # Calcular posiciones
-        octavos = self._partidos.get("Octavos", [])
-        cuartos = self._partidos.get("Cuartos", [])
-        semis = self._partidos.get("Semifinales", [])
-        final = self._partidos.get("Final", None)
-
-        # Usar ancho fijo del widget
-        w = 1050
-        h = 700
-
-        # Posiciones X para cada columna (bracket simétrico)
-        col_spacing = 150  # Espaciado entre octavos-cuartos y cuartos-semifinales
-        col_spacing_final = 10  # Separación mínima entre semifinales-final
-
-        # Calcular desde el centro hacia afuera (final primero, luego semifinales simétricas)
-        x_final = w // 2 - box_w // 2
-        x_semis_izq = (
-            x_final - box_w - col_spacing_final
-        )  # Pegada a la izquierda de la final
-        x_semis_der = (
-            x_final + box_w + col_spacing_final
-        )  # Pegada a la derecha de la final
-
-        # Calcular el resto hacia los lados
-        x_cuartos_izq = x_semis_izq - col_spacing
-        x_octavos_izq = x_cuartos_izq - col_spacing
-        x_cuartos_der = x_semis_der + col_spacing
-        x_octavos_der = x_cuartos_der + col_spacing
-
-        # OCTAVOS DE FINAL IZQUIERDA (4 partidos)
-        y_start = 50
-        rects_octavos_izq = []
-        for i in range(4):
-            p = octavos[i] if i < len(octavos) else None
-            y = y_start + i * (box_h + gap_y)
-            rect = draw_match(x_octavos_izq, y, p, "Octavos")
-            rects_octavos_izq.append(rect)
-
-        # OCTAVOS DE FINAL DERECHA (4 partidos)
-        rects_octavos_der = []
-        for i in range(4):
-            p = octavos[i + 4] if (i + 4) < len(octavos) else None
-            y = y_start + i * (box_h + gap_y)
-            rect = draw_match(x_octavos_der, y, p, "Octavos")
-            rects_octavos_der.append(rect)
-
-        # CUARTOS DE FINAL IZQUIERDA (2 partidos)
-        rects_cuartos_izq = []
-
-        # Cuarto 1 izq (conecta octavos 0-1)
-        y_cuarto_1_izq = (
-            rects_octavos_izq[0].center().y()
-            + (rects_octavos_izq[1].center().y() - rects_octavos_izq[0].center().y())
-            / 2
-            - box_h / 2
-        )
-        p_cuarto_1_izq = cuartos[0] if len(cuartos) > 0 else None
-        rect_cuarto_1_izq = draw_match(
-            x_cuartos_izq, y_cuarto_1_izq, p_cuarto_1_izq, "Cuartos"
-        )
-        rects_cuartos_izq.append(rect_cuarto_1_izq)
-
-        # Cuarto 2 izq (conecta octavos 2-3)
-        y_cuarto_2_izq = (
-            rects_octavos_izq[2].center().y()
-            + (rects_octavos_izq[3].center().y() - rects_octavos_izq[2].center().y())
-            / 2
-            - box_h / 2
-        )
-        p_cuarto_2_izq = cuartos[1] if len(cuartos) > 1 else None
-        rect_cuarto_2_izq = draw_match(
-            x_cuartos_izq, y_cuarto_2_izq, p_cuarto_2_izq, "Cuartos"
+        # Nombre del equipo
+        font = QFont()
+        font.setPointSize(9)
+        font.setBold(gana)
+        painter.setFont(font)
+        painter.setPen(QColor(44, 62, 80))
+        if con_extras:
+            text_rect = rect.adjusted(26, 0, -35, 0)
+        else:
+            text_rect = rect.adjusted(6, 0, -6, 0)
+        painter.drawText(
+            text_rect, Qt.AlignVCenter | Qt.AlignLeft, equipo.nombre if equipo else "—"
         )
-        rects_cuartos_izq.append(rect_cuarto_2_izq)
 
-        # CUARTOS DE FINAL DERECHA (2 partidos)
-        rects_cuartos_der = []
+        # Goles del equipo
+        if con_extras and goles is not None:
+            goles_rect = QRectF(
+                rect.right() - 32, rect.y() + 2, 28, rect.height() - 4
+            )
+            painter.setBrush(QColor(52, 152, 219, 200))
+            painter.drawRoundedRect(goles_rect, 4, 4)
 
-        # Cuarto 1 der (conecta octavos 4-5)
-        y_cuarto_1_der = (
-            rects_octavos_der[0].center().y()
-            + (rects_octavos_der[1].center().y() - rects_octavos_der[0].center().y())
-            / 2
-            - box_h / 2
-        )
-        p_cuarto_1_der = cuartos[2] if len(cuartos) > 2 else None
-        rect_cuarto_1_der = draw_match(
-            x_cuartos_der, y_cuarto_1_der, p_cuarto_1_der, "Cuartos"
-        )
-        rects_cuartos_der.append(rect_cuarto_1_der)
-
-        # Cuarto 2 der (conecta octavos 6-7)
-        y_cuarto_2_der = (
-            rects_octavos_der[2].center().y()
-            + (rects_octavos_der[3].center().y() - rects_octavos_der[2].center().y())
-            / 2
-            - box_h / 2
-        )
-        p_cuarto_2_der = cuartos[3] if len(cuartos) > 3 else None
-        rect_cuarto_2_der = draw_match(
-            x_cuartos_der, y_cuarto_2_der, p_cuarto_2_der, "Cuartos"
-        )
-        rects_cuartos_der.append(rect_cuarto_2_der)
+            font.setPointSize(14)
+            font.setBold(True)
+            painter.setFont(font)
+            painter.setPen(QColor(255, 255, 255))
+            painter.drawText(goles_rect, Qt.AlignCenter, str(goles))
 
-        # SEMIFINAL IZQUIERDA (conecta cuartos izq 0-1)
-        y_semi_izq = (
-            rect_cuarto_1_izq.center().y()
-            + (rect_cuarto_2_izq.center().y() - rect_cuarto_1_izq.center().y()) / 2
-            - box_h / 2
-        )
-        p_semi_izq = semis[0] if len(semis) > 0 else None
-        rect_semi_izq = draw_match(x_semis_izq, y_semi_izq, p_semi_izq, "Semifinal")
-
-        # SEMIFINAL DERECHA (conecta cuartos der 0-1)
-        y_semi_der = (
-            rect_cuarto_1_der.center().y()
-            + (rect_cuarto_2_der.center().y() - rect_cuarto_1_der.center().y()) / 2
-            - box_h / 2
-        )
-        p_semi_der = semis[1] if len(semis) > 1 else None
-        rect_semi_der = draw_match(x_semis_der, y_semi_der, p_semi_der, "Semifinal")
-
-        # FINAL (centro, conecta ambas semifinales)
-        y_final = (
-            rect_semi_izq.center().y()
-            + (rect_semi_der.center().y() - rect_semi_izq.center().y()) / 2
-            - box_h / 2
-        )
-        rect_final = draw_match(x_final, y_final, final, "FINAL")
-
-        # ====== LÍNEAS DE CONEXIÓN ======
-        painter.setPen(QPen(QColor(52, 152, 219, 200), 2))
-
-        # ===== LADO IZQUIERDO =====
-        # Octavos izq -> Cuartos izq
-        mid_x_oct_cuart_izq = (
-            rects_octavos_izq[0].right() + rect_cuarto_1_izq.left()
-        ) / 2
-
-        # Octavos 0-1 -> Cuarto 1 izq
-        for i in range(2):
-            rect_oct = rects_octavos_izq[i]
-            painter.drawLine(
-                QPointF(rect_oct.right(), rect_oct.center().y()),
-                QPointF(mid_x_oct_cuart_izq, rect_oct.center().y()),
-            )
-        painter.drawLine(
-            QPointF(mid_x_oct_cuart_izq, rects_octavos_izq[0].center().y()),
-            QPointF(mid_x_oct_cuart_izq, rects_octavos_izq[1].center().y()),
-        )
-        painter.drawLine(
-            QPointF(mid_x_oct_cuart_izq, rect_cuarto_1_izq.center().y()),
-            QPointF(rect_cuarto_1_izq.left(), rect_cuarto_1_izq.center().y()),
-        )
 
-        # Octavos 2-3 -> Cuarto 2 izq
-        for i in range(2, 4):
-            rect_oct = rects_octavos_izq[i]
-            painter.drawLine(
-                QPointF(rect_oct.right(), rect_oct.center().y()),
-                QPointF(mid_x_oct_cuart_izq, rect_oct.center().y()),
-            )
-        painter.drawLine(
-            QPointF(mid_x_oct_cuart_izq, rects_octavos_izq[2].center().y()),
-            QPointF(mid_x_oct_cuart_izq, rects_octavos_izq[3].center().y()),
-        )
-        painter.drawLine(
-            QPointF(mid_x_oct_cuart_izq, rect_cuarto_2_izq.center().y()),
-            QPointF(rect_cuarto_2_izq.left(), rect_cuarto_2_izq.center().y()),
-        )
+class BracketWidget(QGraphicsView):
+    """Cuadro de eliminatorias sobre una QGraphicsScene.
 
-        # Cuartos izq -> Semi izq
-        mid_x_cuart_semi_izq = (rect_cuarto_1_izq.right() + rect_semi_izq.left()) / 2
+    La escena solo se reconstruye cuando cambia el número de rondas; el
+    resto de cambios sustituye el partido de las cajas existentes.
+    """
 
-        for rect_cuart in rects_cuartos_izq:
-            painter.drawLine(
-                QPointF(rect_cuart.right(), rect_cuart.center().y()),
-                QPointF(mid_x_cuart_semi_izq, rect_cuart.center().y()),
-            )
-        painter.drawLine(
-            QPointF(mid_x_cuart_semi_izq, rect_cuarto_1_izq.center().y()),
-            QPointF(mid_x_cuart_semi_izq, rect_cuarto_2_izq.center().y()),
-        )
-        painter.drawLine(
-            QPointF(mid_x_cuart_semi_izq, rect_semi_izq.center().y()),
-            QPointF(rect_semi_izq.left(), rect_semi_izq.center().y()),
-        )
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setScene(QGraphicsScene(self))
+        self.setRenderHint(QPainter.Antialiasing)
+        self.setDragMode(QGraphicsView.ScrollHandDrag)
+        self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setStyleSheet("background: transparent;")
+
+        self._equipos = {}
+        self._rondas = []
+        # Cajas por ronda, en orden de posición dentro de la ronda
+        self._cajas = {}
+        # Caja que ocupa cada partido, para repintar solo esa
+        self._cajas_por_partido = {}
+        # Mientras el usuario no haga zoom, el cuadro se encaja en la vista
+        self._zoom_manual = False
+
+    def set_data(self, partidos, equipos: dict):
+        """Coloca los partidos en el cuadro.
+
+        Args:
+            partidos (list): Partidos del torneo
+            equipos (dict): Equipos indexados por ID
+        """
+        self._equipos.clear()
+        self._equipos.update(equipos)
 
-        # Semi izq -> Final
-        mid_x_semi_final_izq = (rect_semi_izq.right() + rect_final.left()) / 2
-        painter.drawLine(
-            QPointF(rect_semi_izq.right(), rect_semi_izq.center().y()),
-            QPointF(mid_x_semi_final_izq, rect_semi_izq.center().y()),
-        )
-        painter.drawLine(
-            QPointF(mid_x_semi_final_izq, rect_semi_izq.center().y()),
-            QPointF(mid_x_semi_final_izq, rect_final.center().y()),
-        )
-        painter.drawLine(
-            QPointF(mid_x_semi_final_izq, rect_final.center().y()),
-            QPointF(rect_final.left(), rect_final.center().y()),
-        )
+        rondas = rondas_del_cuadro(partidos)
+        if rondas != self._rondas:
+            self._construir(rondas)
 
-        # ===== LADO DERECHO =====
-        # Octavos der -> Cuartos der
-        mid_x_oct_cuart_der = (
-            rects_octavos_der[0].left() + rect_cuarto_1_der.right()
-        ) / 2
-
-        # Octavos 4-5 -> Cuarto 1 der
-        for i in range(2):
-            rect_oct = rects_octavos_der[i]
-            painter.drawLine(
-                QPointF(rect_oct.left(), rect_oct.center().y()),
-                QPointF(mid_x_oct_cuart_der, rect_oct.center().y()),
-            )
-        painter.drawLine(
-            QPointF(mid_x_oct_cuart_der, rects_octavos_der[0].center().y()),
-            QPointF(mid_x_oct_cuart_der, rects_octavos_der[1].center().y()),
-        )
-        painter.drawLine(
-            QPointF(mid_x_oct_cuart_der, rect_cuarto_1_der.center().y()),
-            QPointF(rect_cuarto_1_der.right(), rect_cuarto_1_der.center().y()),
-        )
+        # Cada partido va al hueco de su posición; los que no la tienen o
+        # quedan fuera del cuadro ocupan los huecos libres por orden
+        por_ronda = {r: [None] * len(self._cajas[r]) for r in rondas}
+        sin_hueco = {r: [] for r in rondas}
+        for p in partidos:
+            huecos = por_ronda.get(p.eliminatoria)
+            if huecos is None:
+                continue
+            if p.posicion is not None and 0 <= p.posicion < len(huecos) and (
+                huecos[p.posicion] is None
+            ):
+                huecos[p.posicion] = p
+            else:
+                sin_hueco[p.eliminatoria].append(p)
+
+        for ronda, pendientes in sin_hueco.items():
+            huecos = por_ronda[ronda]
+            for i in range(len(huecos)):
+                if not pendientes:
+                    break
+                if huecos[i] is None:
+                    huecos[i] = pendientes.pop(0)
+
+        self._cajas_por_partido = {}
+        for ronda, cajas in self._cajas.items():
+            for caja, p in zip(cajas, por_ronda[ronda]):
+                if p:
+                    self._cajas_por_partido[p.id] = caja
+                caja.set_partido(p)
+
+    def actualizar_partido(self, partido) -> bool:
+        """Sustituye un partido ya dibujado y repinta solo su caja.
+
+        Returns:
+            bool: False si el partido no ocupa ya una caja de su eliminatoria
+        """
+        caja = self._cajas_por_partido.get(partido.id)
+        if caja is None or (caja.partido.eliminatoria, caja.partido.posicion) != (
+            partido.eliminatoria,
+            partido.posicion,
+        ):
+            return False
+        caja.set_partido(partido)
+        return True
+
+    def actualizar_equipo(self, equipo):
+        """Repinta las cajas en las que juega un equipo modificado."""
+        self._equipos[equipo.id] = equipo
+        for caja in self._cajas_por_partido.values():
+            if caja.contiene_equipo(equipo.id):
+                caja.update()
+
+    def _construir(self, rondas):
+        """Crea las cajas, conectores y títulos para el número de rondas dado."""
+        escena = self.scene()
+        escena.clear()
+        self._rondas = list(rondas)
+        self._cajas = {}
+        self._cajas_por_partido = {}
+
+        num_rondas = len(rondas)
+        x_final = (num_rondas - 1) * SEPARACION_COLUMNAS
+        y_inicio = 40
+        conectores = QPainterPath()
+
+        # Centros verticales de las cajas de la ronda anterior, por lado
+        anteriores = {"izq": [], "der": []}
+
+        for k, ronda in enumerate(rondas):
+            num_partidos = 2 ** (num_rondas - 1 - k)
+            cajas = []
+
+            if num_partidos == 1:
+                # Final en el centro, a la altura de las semifinales
+                centros = anteriores["izq"] or [y_inicio + CAJA_ALTO / 2]
+                caja = self._crear_caja(x_final, centros[0] - CAJA_ALTO / 2)
+                cajas.append(caja)
+                for lado in ("izq", "der"):
+                    for y in anteriores[lado]:
+                        if lado == "izq":
+                            x0 = x_final - SEPARACION_COLUMNAS + CAJA_ANCHO
+                            x1 = x_final
+                        else:
+                            x0 = x_final + SEPARACION_COLUMNAS
+                            x1 = x_final + CAJA_ANCHO
+                        conectores.moveTo(x0, y)
+                        conectores.lineTo(x1, centros[0])
+                self._crear_titulo(ronda, x_final, y_inicio)
+                self._cajas[ronda] = cajas
+                break
+
+            # La mitad de la ronda a la izquierda y la otra mitad a la derecha
+            mitad = num_partidos // 2
+            for lado, x in (
+                ("izq", k * SEPARACION_COLUMNAS),
+                ("der", 2 * x_final - k * SEPARACION_COLUMNAS),
+            ):
+                if anteriores[lado]:
+                    centros = [
+                        (anteriores[lado][2 * i] + anteriores[lado][2 * i + 1]) / 2
+                        for i in range(mitad)
+                    ]
+                else:
+                    centros = [
+                        y_inicio + 30 + i * (CAJA_ALTO + SEPARACION_Y) + CAJA_ALTO / 2
+                        for i in range(mitad)
+                    ]
+
+                for i, centro in enumerate(centros):
+                    cajas.append(self._crear_caja(x, centro - CAJA_ALTO / 2))
+                    if anteriores[lado]:
+                        self._conectar(
+                            conectores,
+                            lado,
+                            x,
+                            anteriores[lado][2 * i],
+                            anteriores[lado][2 * i + 1],
+                            centro,
+                        )
 
-        # Octavos 6-7 -> Cuarto 2 der
-        for i in range(2, 4):
-            rect_oct = rects_octavos_der[i]
-            painter.drawLine(
-                QPointF(rect_oct.left(), rect_oct.center().y()),
-                QPointF(mid_x_oct_cuart_der, rect_oct.center().y()),
-            )
-        painter.drawLine(
-            QPointF(mid_x_oct_cuart_der, rects_octavos_der[2].center().y()),
-            QPointF(mid_x_oct_cuart_der, rects_octavos_der[3].center().y()),
-        )
-        painter.drawLine(
-            QPointF(mid_x_oct_cuart_der, rect_cuarto_2_der.center().y()),
-            QPointF(rect_cuarto_2_der.right(), rect_cuarto_2_der.center().y()),
-        )
+                self._crear_titulo(ronda, x, y_inicio)
+                anteriores[lado] = centros
 
-        # Cuartos der -> Semi der
-        mid_x_cuart_semi_der = (rect_cuarto_1_der.left() + rect_semi_der.right()) / 2
+            self._cajas[ronda] = cajas
 
-        for rect_cuart in rects_cuartos_der:
-            painter.drawLine(
-                QPointF(rect_cuart.left(), rect_cuart.center().y()),
-                QPointF(mid_x_cuart_semi_der, rect_cuart.center().y()),
-            )
-        painter.drawLine(
-            QPointF(mid_x_cuart_semi_der, rect_cuarto_1_der.center().y()),
-            QPointF(mid_x_cuart_semi_der, rect_cuarto_2_der.center().y()),
-        )
-        painter.drawLine(
-            QPointF(mid_x_cuart_semi_der, rect_semi_der.center().y()),
-            QPointF(rect_semi_der.right(), rect_semi_der.center().y()),
-        )
+        lineas = QGraphicsPathItem(conectores)
+        lineas.setPen(QPen(QColor(52, 152, 219), 2))
+        lineas.setZValue(-1)
+        escena.addItem(lineas)
 
-        # Semi der -> Final
-        mid_x_semi_final_der = (rect_semi_der.left() + rect_final.right()) / 2
-        painter.drawLine(
-            QPointF(rect_semi_der.left(), rect_semi_der.center().y()),
-            QPointF(mid_x_semi_final_der, rect_semi_der.center().y()),
-        )
-        painter.drawLine(
-            QPointF(mid_x_semi_final_der, rect_semi_der.center().y()),
-            QPointF(mid_x_semi_final_der, rect_final.center().y()),
-        )
-        painter.drawLine(
-            QPointF(mid_x_semi_final_der, rect_final.center().y()),
-            QPointF(rect_final.right(), rect_final.center().y()),
-        )
+        escena.setSceneRect(escena.itemsBoundingRect().adjusted(-20, -20, 20, 20))
+        self._zoom_manual = False
+        self._encajar()
 
-        # Etiquetas de fase
-        font = QFont()
-        font.setPointSize(11)
-        font.setBold(True)
-        painter.setFont(font)
-        painter.setPen(QColor(52, 152, 219))
+    def _crear_caja(self, x, y) -> PartidoCuadroItem:
+        caja = PartidoCuadroItem(self._equipos)
+        caja.setPos(x, y)
+        self.scene().addItem(caja)
+        return caja
 
-        painter.drawText(QRectF(x_octavos_izq, 5, box_w, 20), Qt.AlignCenter, "OCTAVOS")
-        painter.drawText(QRectF(x_cuartos_izq, 5, box_w, 20), Qt.AlignCenter, "CUARTOS")
-        painter.drawText(
-            QRectF(x_semis_izq, 5, box_w, 20), Qt.AlignCenter, "SEMIFINALES"
-        )
-        painter.drawText(
-            QRectF(x_final - 20, 5, box_w + 40, 20),
-            Qt.AlignCenter,
-            "★ FINAL ★",
+    def _crear_titulo(self, ronda, x, y):
+        titulo = QGraphicsSimpleTextItem(
+            "★ FINAL ★" if ronda == "Final" else ronda.upper()
         )
-        painter.drawText(
-            QRectF(x_semis_der, 5, box_w, 20), Qt.AlignCenter, "SEMIFINALES"
-        )
-        painter.drawText(QRectF(x_cuartos_der, 5, box_w, 20), Qt.AlignCenter, "CUARTOS")
-        painter.drawText(QRectF(x_octavos_der, 5, box_w, 20), Qt.AlignCenter, "OCTAVOS")
+        font = QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        titulo.setFont(font)
+        titulo.setBrush(QColor(44, 62, 80))
+        ancho = titulo.boundingRect().width()
+        titulo.setPos(x + (CAJA_ANCHO - ancho) / 2, y - 25)
+        self.scene().addItem(titulo)
+
+    def _conectar(self, path, lado, x, y_a, y_b, y_destino):
+        """Añade el conector en horquilla de dos partidos al siguiente."""
+        if lado == "izq":
+            x_origen = x - SEPARACION_COLUMNAS + CAJA_ANCHO
+            x_destino = x
+        else:
+            x_origen = x + SEPARACION_COLUMNAS
+            x_destino = x + CAJA_ANCHO
+        x_medio = (x_origen + x_destino) / 2
+
+        for y in (y_a, y_b):
+            path.moveTo(x_origen, y)
+            path.lineTo(x_medio, y)
+        path.moveTo(x_medio, y_a)
+        path.lineTo(x_medio, y_b)
+        path.moveTo(x_medio, y_destino)
+        path.lineTo(x_destino, y_destino)
+
+    def _encajar(self):
+        if not self.scene().items():
+            return
+        self.fitInView(self.sceneRect(), Qt.KeepAspectRatio)
+        # No ampliar un cuadro pequeño por encima de su tamaño natural
+        if self.transform().m11() > 1.0:
+            self.resetTransform()
+
+    def wheelEvent(self, event):
+        factor = 1.15 ** (event.angleDelta().y() / 120)
+        escala = self.transform().m11() * factor
+        if ZOOM_MIN <= escala <= ZOOM_MAX:
+            self._zoom_manual = True
+            self.scale(factor, factor)
+        event.accept()
+
+    def mouseDoubleClickEvent(self, event):
+        self._zoom_manual = False
+        self._encajar()
+        super().mouseDoubleClickEvent(event)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if not self._zoom_manual:
+            self._encajar()
 
 
 class ClasificacionPage(BasePage):
+    TABLAS = ("partidos", "equipos")
+
     def __init__(self, parent=None):
         super().__init__("Clasificación", parent)
 
@@ -622,13 +530,15 @@ class ClasificacionPage(BasePage):
         self.btn_exportar.clicked.connect(self._exportar_csv)
         lay.addWidget(self.btn_exportar)
 
-        # Bracket sin scroll (ya cabe todo en la ventana)
+        # Cuadro con zoom y desplazamiento para torneos de cualquier tamaño
         self.bracket = BracketWidget()
         lay.addWidget(self.bracket, 1)
 
         self.contenido_layout.addWidget(cont, 1)
         self._refrescar()
 
+        self.escuchar_cambios()
+
     def _exportar_csv(self):
         """Exporta la clasificación a un archivo CSV."""
         ruta_archivo, _ = QFileDialog.getSaveFileName(
@@ -703,28 +613,23 @@ class ClasificacionPage(BasePage):
     def on_show(self):
         self._refrescar()
 
-    def _refrescar(self):
-        # Obtener todos los partidos y organizarlos por eliminatoria
-        partidos = Partido.obtener_todos()
-
-        partidos_dict = {"Octavos": [], "Cuartos": [], "Semifinales": [], "Final": None}
+    def aplicar_cambio(self, cambio):
+        """Repinta solo la caja del partido cambiado cuando es posible."""
+        if cambio.entidad == "partidos" and cambio.operacion == eventos.ACTUALIZAR:
+            partido = Partido.obtener_por_id(cambio.id)
+            if partido and self.bracket.actualizar_partido(partido):
+                return
+        elif cambio.entidad == "equipos" and cambio.operacion == eventos.ACTUALIZAR:
+            # Nombre o escudo: se repintan sus cajas sin volver a leer los partidos
+            equipo = Equipo.obtener_por_id(cambio.id) if cambio.id else None
+            if equipo:
+                self.bracket.actualizar_equipo(equipo)
+                return
+
+        # Altas, bajas o cambios de eliminatoria reorganizan el cuadro
+        self._refrescar()
 
-        for p in partidos:
-            if p.eliminatoria == "Octavos":
-                partidos_dict["Octavos"].append(p)
-            elif p.eliminatoria == "Cuartos":
-                partidos_dict["Cuartos"].append(p)
-            elif p.eliminatoria == "Semifinales":
-                partidos_dict["Semifinales"].append(p)
-            elif p.eliminatoria == "Final":
-                partidos_dict["Final"] = p
-
-        # Asegurar que hay suficientes espacios (rellenar con None si es necesario)
-        while len(partidos_dict["Octavos"]) < 8:
-            partidos_dict["Octavos"].append(None)
-        while len(partidos_dict["Cuartos"]) < 4:
-            partidos_dict["Cuartos"].append(None)
-        while len(partidos_dict["Semifinales"]) < 2:
-            partidos_dict["Semifinales"].append(None)
-
-        self.bracket.set_data(partidos_dict)
+    def _refrescar(self):
+        # Los equipos se leen una vez para todo el cuadro
+        equipos = {e.id: e for e in Equipo.iterar()}
+        self.bracket.set_data(Partido.obtener_todos(), equipos)
@@ -1,24 +1,27 @@
-"""Diálogos reutilizables (selector de escudo, alta/edición de partido)."""
+"""Diálogos reutilizables (selector de escudo, alta/edición de partido, planificador)."""
 
 from __future__ import annotations
 
 from datetime import datetime
 
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import Qt, QSize, QDate
 from PySide6.QtSvgWidgets import QSvgWidget
 from PySide6.QtWidgets import (
+    QCheckBox,
     QComboBox,
+    QDateEdit,
     QDateTimeEdit,
     QDialog,
     QDialogButtonBox,
     QGridLayout,
     QHBoxLayout,
     QLabel,
+    QLineEdit,
     QMessageBox,
     QPushButton,
     QScrollArea,
     QSizePolicy,
+    QSpinBox,
     QVBoxLayout,
     QWidget,
     QListWidget,
@@ -29,7 +32,7 @@ from PySide6.QtWidgets import (
 from Models.equipo import Equipo
 from Models.participante import Participante
 from Models.partido import Partido
-from Views.utils import obtener_ruta_recurso
+from Views.catalogo_escudos import obtener_catalogo
 
 
 class EscudoSelectorDialog(QDialog):
@@ -153,8 +156,9 @@ class EscudoSelectorDialog(QDialog):
         return self._seleccion
 
     def _cargar_escudos(self):
-        ruta_escudos = obtener_ruta_recurso("Resources/img/escudos")
-        escudos = Equipo.obtener_escudos_disponibles(ruta_escudos)
+        # Carpeta y escudos en uso ya están en memoria: no se consulta nada
+        catalogo = obtener_catalogo()
+        escudos = catalogo.disponibles()
 
         self.list_widget.clear()
 
@@ -173,9 +177,8 @@ class EscudoSelectorDialog(QDialog):
             clean_name = nombre_svg.replace(".svg", "").replace(".png", "")
             item = QListWidgetItem(clean_name)
 
-            # Icono
-            ruta_completa = obtener_ruta_recurso(f"Resources/img/escudos/{nombre_svg}")
-            item.setIcon(QIcon(ruta_completa))
+            # Icono (reutilizado entre aperturas del diálogo)
+            item.setIcon(catalogo.icono(nombre_svg))
 
             # Guardamos el nombre real del archivo en data
             item.setData(Qt.UserRole, nombre_svg)
@@ -198,7 +201,10 @@ class EscudoSelectorDialog(QDialog):
 class PartidoDialog(QDialog):
     """Diálogo para crear o editar un partido."""
 
-    def __init__(self, parent=None, partido: Partido | None = None):
+    # Hora propuesta al crear un partido desde un día del calendario
+    HORA_POR_DEFECTO = 16
+
+    def __init__(self, parent=None, partido: Partido | None = None, fecha=None):
         super().__init__(parent)
         self.setWindowTitle("Partido")
         self.setModal(True)
@@ -371,6 +377,7 @@ class PartidoDialog(QDialog):
         self.combo_arbitro = QComboBox()
         self.combo_eliminatoria = QComboBox()
         self.combo_eliminatoria.addItems(Partido.ELIMINATORIAS)
+        self.combo_eliminatoria.setCurrentText("Octavos")
 
         self.dt = QDateTimeEdit()
         self.dt.setCalendarPopup(True)
@@ -444,7 +451,11 @@ class PartidoDialog(QDialog):
         for a in self._arbitros:
             self.combo_arbitro.addItem(a.nombre, a.id)
 
-        if partido is None:
+        if partido is None and fecha is not None:
+            self.dt.setDateTime(
+                datetime(fecha.year, fecha.month, fecha.day, self.HORA_POR_DEFECTO)
+            )
+        elif partido is None:
             self.dt.setDateTime(datetime.now())
         else:
             self._cargar_partido(partido)
@@ -491,6 +502,29 @@ class PartidoDialog(QDialog):
         arbitro_id = self.combo_arbitro.currentData()
         eliminatoria = self.combo_eliminatoria.currentText()
 
+        conflictos = Partido.buscar_conflictos(
+            fecha_hora,
+            local_id,
+            visitante_id,
+            arbitro_id,
+            excluir_id=self.partido.id if self.partido else None,
+        )
+        if conflictos:
+            nombres = {e.id: e.nombre for e in self._equipos}
+            lineas = []
+            for p, motivo in conflictos:
+                quien = "Árbitro ocupado" if motivo == "arbitro" else "Equipo ocupado"
+                lineas.append(
+                    f"• {quien}: {nombres.get(p.equipo_local_id, '—')} vs "
+                    f"{nombres.get(p.equipo_visitante_id, '—')} ({p.fecha_hora})"
+                )
+            QMessageBox.warning(
+                self,
+                "Conflicto de horario",
+                "El partido se solapa con:\n" + "\n".join(lineas),
+            )
+            return
+
         if self.partido is None:
             self.partido = Partido(
                 equipo_local_id=local_id,
@@ -504,6 +538,9 @@ class PartidoDialog(QDialog):
             self.partido.equipo_visitante_id = visitante_id
             self.partido.fecha_hora = fecha_hora
             self.partido.arbitro_id = arbitro_id
+            if self.partido.eliminatoria != eliminatoria:
+                # Al cambiar de ronda ocupa el primer hueco libre de la nueva
+                self.partido.posicion = None
             self.partido.eliminatoria = eliminatoria
 
         if not self.partido.guardar():
@@ -513,6 +550,188 @@ class PartidoDialog(QDialog):
         self.accept()
 
 
+class PlanificadorDialog(QDialog):
+    """Diálogo para programar automáticamente los partidos pendientes."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Planificar calendario")
+        self.setModal(True)
+        self.setMinimumSize(480, 380)
+
+        self.setStyleSheet(
+            """
+            QDialog {
+                background-color: white;
+            }
+            QLabel, QCheckBox {
+                color: #2c3e50;
+                font-weight: 600;
+            }
+            QDateEdit, QLineEdit, QSpinBox {
+                background-color: white;
+                color: #2c3e50;
+                border: 2px solid #bdc3c7;
+                border-radius: 6px;
+                padding: 6px 8px;
+                font-size: 10pt;
+                min-height: 24px;
+            }
+            QDateEdit:focus, QLineEdit:focus, QSpinBox:focus {
+                border-color: #3498db;
+            }
+            """
+        )
+
+        self._planificacion = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(16, 16, 16, 16)
+        layout.setSpacing(12)
+
+        form = QGridLayout()
+        form.setHorizontalSpacing(10)
+        form.setVerticalSpacing(10)
+
+        self.fecha_desde = QDateEdit(QDate.currentDate())
+        self.fecha_desde.setCalendarPopup(True)
+        self.fecha_desde.setDisplayFormat("yyyy-MM-dd")
+        self.fecha_hasta = QDateEdit(QDate.currentDate().addMonths(1))
+        self.fecha_hasta.setCalendarPopup(True)
+        self.fecha_hasta.setDisplayFormat("yyyy-MM-dd")
+
+        self.txt_horas = QLineEdit("16:00, 17:30")
+        self.txt_horas.setToolTip("Horas de inicio de cada día, separadas por comas")
+
+        self.spin_pistas = QSpinBox()
+        self.spin_pistas.setRange(1, 20)
+
+        self.spin_descanso = QSpinBox()
+        self.spin_descanso.setRange(0, 24 * 14)
+        self.spin_descanso.setValue(24)
+        self.spin_descanso.setSuffix(" h")
+
+        self.chk_laborables = QCheckBox("Solo de lunes a viernes")
+        self.chk_laborables.setChecked(True)
+
+        form.addWidget(QLabel("Desde"), 0, 0)
+        form.addWidget(self.fecha_desde, 0, 1)
+        form.addWidget(QLabel("Hasta"), 1, 0)
+        form.addWidget(self.fecha_hasta, 1, 1)
+        form.addWidget(QLabel("Horas de inicio"), 2, 0)
+        form.addWidget(self.txt_horas, 2, 1)
+        form.addWidget(QLabel("Pistas"), 3, 0)
+        form.addWidget(self.spin_pistas, 3, 1)
+        form.addWidget(QLabel("Descanso entre partidos"), 4, 0)
+        form.addWidget(self.spin_descanso, 4, 1)
+        form.addWidget(self.chk_laborables, 5, 1)
+        layout.addLayout(form)
+
+        self.lbl_resumen = QLabel(
+            "Se programarán todos los partidos pendientes de jugar."
+        )
+        self.lbl_resumen.setWordWrap(True)
+        layout.addWidget(self.lbl_resumen)
+
+        botones = QDialogButtonBox()
+        btn_calcular = QPushButton("Calcular")
+        self.btn_aplicar = QPushButton("Aplicar")
+        self.btn_aplicar.setEnabled(False)
+        btn_cancelar = QPushButton("Cancelar")
+        for boton, color, hover in (
+            (btn_calcular, "#3498db", "#2980b9"),
+            (self.btn_aplicar, "#27ae60", "#229954"),
+            (btn_cancelar, "#95a5a6", "#7f8c8d"),
+        ):
+            boton.setStyleSheet(
+                f"""
+                QPushButton {{
+                    background-color: {color};
+                    color: white;
+                    border: none;
+                    border-radius: 8px;
+                    padding: 8px 20px;
+                    font-weight: 600;
+                    font-size: 11pt;
+                }}
+                QPushButton:hover {{
+                    background-color: {hover};
+                }}
+                QPushButton:disabled {{
+                    background-color: #d5dbdb;
+                }}
+                """
+            )
+        btn_calcular.clicked.connect(self._calcular)
+        self.btn_aplicar.clicked.connect(self._aplicar)
+        btn_cancelar.clicked.connect(self.reject)
+        botones.addButton(btn_calcular, QDialogButtonBox.ActionRole)
+        botones.addButton(self.btn_aplicar, QDialogButtonBox.AcceptRole)
+        botones.addButton(btn_cancelar, QDialogButtonBox.RejectRole)
+        layout.addWidget(botones)
+
+    def _leer_horas(self):
+        horas = []
+        for texto in self.txt_horas.text().split(","):
+            texto = texto.strip()
+            if not texto:
+                continue
+            horas.append(datetime.strptime(texto, "%H:%M").time())
+        return sorted(set(horas))
+
+    def _calcular(self):
+        from Controllers import calendario_controller
+
+        try:
+            horas = self._leer_horas()
+        except ValueError:
+            QMessageBox.warning(self, "Datos", "Las horas deben tener formato HH:MM.")
+            return
+        if not horas:
+            QMessageBox.warning(self, "Datos", "Indica al menos una hora de inicio.")
+            return
+
+        desde = self.fecha_desde.date().toPython()
+        hasta = self.fecha_hasta.date().toPython()
+        if hasta < desde:
+            QMessageBox.warning(self, "Datos", "La fecha final es anterior a la inicial.")
+            return
+
+        franjas = calendario_controller.generar_franjas(
+            desde,
+            hasta,
+            horas,
+            pistas=self.spin_pistas.value(),
+            dias_semana=range(5) if self.chk_laborables.isChecked() else None,
+        )
+        self._planificacion = calendario_controller.planificar_pendientes(
+            franjas, descanso_minutos=self.spin_descanso.value() * 60
+        )
+        self.lbl_resumen.setText(self._planificacion.resumen())
+        self.btn_aplicar.setEnabled(bool(self._planificacion.asignaciones))
+
+    def _aplicar(self):
+        from Controllers import calendario_controller
+
+        if not self._planificacion:
+            return
+        if not calendario_controller.aplicar(self._planificacion):
+            QMessageBox.critical(self, "Error", "No se pudo guardar la planificación.")
+            return
+        if self._planificacion.solapes:
+            detalle = "\n".join(
+                f"Partido {p.id} con partido {otro.id}"
+                for p, otro in self._planificacion.solapes
+            )
+            QMessageBox.warning(
+                self,
+                "Solapes pendientes",
+                "La planificación se guardó, pero algunos partidos sin franja "
+                f"conservan una fecha que se solapa:\n\n{detalle}",
+            )
+        self.accept()
+
+
 class CreditosDialog(QDialog):
     """Diálogo scrollable para mostrar los créditos del programa."""
 
@@ -0,0 +1,598 @@
+"""Pantalla de Directo - Anotación de un partido mientras se juega.
+
+Arriba: partido pendiente, minuto del cronómetro y marcador.
+Centro: plantillas de los dos equipos con un botón por gol y por tarjeta.
+Derecha: cronología del partido, con la opción de deshacer el último evento.
+
+Cada gol o tarjeta se guarda en el momento como una única fila con el minuto
+del cronómetro. La segunda amarilla de un jugador se anota como roja y lo
+expulsa: así el acta tiene como mucho una amarilla y una roja por jugador,
+que es lo que puede representar el editor de Resultados. Al finalizar, el marcador se obtiene contando los goles ya
+guardados (Partido.calcular_marcador) en lugar de reescribirlos todos.
+"""
+
+from __future__ import annotations
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QComboBox,
+    QFrame,
+    QHBoxLayout,
+    QLabel,
+    QListWidget,
+    QMessageBox,
+    QPushButton,
+    QScrollArea,
+    QVBoxLayout,
+    QWidget,
+)
+
+from Models import database, progresion
+from Models.gol import Gol
+from Models.partido import Partido
+from Models.tarjeta import Tarjeta
+from Views.base_page import BasePage
+
+ICONOS = {"gol": "⚽", "amarilla": "🟨", "roja": "🟥"}
+
+ESTILO_PANEL = """
+    QFrame {
+        background-color: rgba(236, 240, 241, 0.95);
+        border-radius: 8px;
+    }
+"""
+
+ESTILO_BOTON = """
+    QPushButton {
+        background-color: %s;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 8px 16px;
+        font-size: 10pt;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: %s;
+    }
+    QPushButton:disabled {
+        background-color: #95a5a6;
+    }
+"""
+
+
+class DirectoPage(BasePage):
+    # Goles y tarjetas cambian con cada anotación propia: basta con recargar
+    # al volver a la página; en vivo solo se sigue la lista de partidos.
+    TABLAS = ("partidos", "goles", "tarjetas")
+
+    def __init__(self, parent=None):
+        super().__init__("Partido en Directo", parent)
+
+        self.partido = None
+        # Jugador -> lado ("local" o "visitante") del partido seleccionado
+        self._lados = {}
+        self._nombres = {}
+        self._botones_jugadores = {}
+        # Jugador -> [amarillas, rojas] recibidas en el partido
+        self._tarjetas = {}
+        self._cronologia = []
+        self._marcador = [0, 0]
+        self._nombres_equipos = {"local": "Local", "visitante": "Visitante"}
+        # Reloj del que se toma el minuto; lo asigna la ventana principal
+        self._reloj = None
+
+        panel_principal = QFrame()
+        panel_principal.setStyleSheet(
+            """
+            QFrame {
+                background-color: rgba(255, 255, 255, 0.92);
+                border-radius: 12px;
+            }
+        """
+        )
+        layout_principal = QVBoxLayout(panel_principal)
+        layout_principal.setContentsMargins(15, 15, 15, 15)
+        layout_principal.setSpacing(10)
+
+        layout_principal.addWidget(self._crear_cabecera())
+
+        cuerpo = QHBoxLayout()
+        cuerpo.setSpacing(10)
+
+        self.scroll_equipos = QScrollArea()
+        self.scroll_equipos.setWidgetResizable(True)
+        self.scroll_equipos.setStyleSheet(
+            "QScrollArea { border: none; background-color: transparent; }"
+        )
+        self.widget_equipos = QWidget()
+        self.layout_equipos = QHBoxLayout(self.widget_equipos)
+        self.layout_equipos.setSpacing(15)
+        self.scroll_equipos.setWidget(self.widget_equipos)
+        cuerpo.addWidget(self.scroll_equipos, 2)
+
+        cuerpo.addWidget(self._crear_panel_cronologia(), 1)
+        layout_principal.addLayout(cuerpo, 1)
+
+        self.btn_finalizar = QPushButton("🏁 Finalizar Partido")
+        self.btn_finalizar.setStyleSheet(ESTILO_BOTON % ("#27ae60", "#229954"))
+        self.btn_finalizar.setMinimumHeight(45)
+        self.btn_finalizar.clicked.connect(self._finalizar_partido)
+        layout_principal.addWidget(self.btn_finalizar)
+
+        self.contenido_layout.addWidget(panel_principal)
+
+        self._mostrar_partido(None)
+        self.escuchar_cambios("partidos")
+
+    # ── Construcción de la interfaz ─────────────────────────────────────────
+
+    def _crear_cabecera(self):
+        cabecera = QFrame()
+        cabecera.setStyleSheet(ESTILO_PANEL)
+        layout = QHBoxLayout(cabecera)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(10)
+
+        self.combo_partidos = QComboBox()
+        self.combo_partidos.setMinimumWidth(280)
+        self.combo_partidos.setStyleSheet(
+            """
+            QComboBox {
+                background-color: white;
+                color: #2c3e50;
+                border: 1px solid #bdc3c7;
+                border-radius: 6px;
+                padding: 6px;
+                font-size: 10pt;
+            }
+        """
+        )
+        self.combo_partidos.currentIndexChanged.connect(self._seleccionar_partido)
+        layout.addWidget(self.combo_partidos, 2)
+
+        self.lbl_minuto = QLabel("--'")
+        self.lbl_minuto.setAlignment(Qt.AlignCenter)
+        self.lbl_minuto.setMinimumWidth(90)
+        self.lbl_minuto.setStyleSheet(
+            """
+            QLabel {
+                background-color: rgba(0, 0, 0, 120);
+                color: white;
+                font-size: 20pt;
+                font-weight: 800;
+                padding: 4px 10px;
+                border-radius: 10px;
+            }
+        """
+        )
+        layout.addWidget(self.lbl_minuto)
+
+        self.btn_cronometro = QPushButton("▶ Iniciar")
+        self.btn_cronometro.setStyleSheet(ESTILO_BOTON % ("#3498db", "#2980b9"))
+        self.btn_cronometro.clicked.connect(self._alternar_cronometro)
+        layout.addWidget(self.btn_cronometro)
+
+        self.lbl_marcador = QLabel()
+        self.lbl_marcador.setAlignment(Qt.AlignCenter)
+        self.lbl_marcador.setStyleSheet(
+            """
+            QLabel {
+                font-size: 16pt;
+                font-weight: bold;
+                color: white;
+                padding: 6px 14px;
+                background-color: #34495e;
+                border-radius: 6px;
+            }
+        """
+        )
+        layout.addWidget(self.lbl_marcador, 3)
+
+        return cabecera
+
+    def _crear_panel_cronologia(self):
+        panel = QFrame()
+        panel.setStyleSheet(ESTILO_PANEL)
+        layout = QVBoxLayout(panel)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(8)
+
+        lbl_titulo = QLabel("Cronología")
+        lbl_titulo.setAlignment(Qt.AlignCenter)
+        lbl_titulo.setStyleSheet(
+            """
+            QLabel {
+                font-size: 12pt;
+                font-weight: bold;
+                color: white;
+                padding: 6px;
+                background-color: #34495e;
+                border-radius: 6px;
+            }
+        """
+        )
+        layout.addWidget(lbl_titulo)
+
+        self.lista_cronologia = QListWidget()
+        self.lista_cronologia.setStyleSheet(
+            """
+            QListWidget {
+                background-color: white;
+                color: #2c3e50;
+                border: 1px solid #bdc3c7;
+                border-radius: 6px;
+                font-size: 10pt;
+            }
+            QListWidget::item {
+                padding: 4px;
+                border-bottom: 1px solid #ecf0f1;
+            }
+        """
+        )
+        layout.addWidget(self.lista_cronologia, 1)
+
+        self.btn_deshacer = QPushButton("↩ Deshacer último")
+        self.btn_deshacer.setStyleSheet(ESTILO_BOTON % ("#e67e22", "#d35400"))
+        self.btn_deshacer.clicked.connect(self._deshacer_ultimo)
+        layout.addWidget(self.btn_deshacer)
+
+        return panel
+
+    def _crear_panel_equipo(self, nombre, jugadores, lado):
+        panel = QFrame()
+        panel.setStyleSheet(ESTILO_PANEL)
+        layout = QVBoxLayout(panel)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(6)
+
+        lbl_nombre = QLabel(nombre)
+        lbl_nombre.setAlignment(Qt.AlignCenter)
+        lbl_nombre.setStyleSheet(
+            """
+            QLabel {
+                font-size: 13pt;
+                font-weight: bold;
+                color: #2c3e50;
+                padding: 6px;
+            }
+        """
+        )
+        layout.addWidget(lbl_nombre)
+
+        if not jugadores:
+            lbl_vacio = QLabel("Sin jugadores asignados")
+            lbl_vacio.setAlignment(Qt.AlignCenter)
+            lbl_vacio.setStyleSheet("color: #7f8c8d; font-style: italic;")
+            layout.addWidget(lbl_vacio)
+
+        for jugador in jugadores:
+            self._lados[jugador["id"]] = lado
+            self._nombres[jugador["id"]] = jugador["nombre"]
+            layout.addWidget(self._crear_fila_jugador(jugador))
+
+        layout.addStretch()
+        return panel
+
+    def _crear_fila_jugador(self, jugador):
+        fila = QWidget()
+        fila.setStyleSheet(
+            """
+            QWidget {
+                background-color: white;
+                border-radius: 6px;
+            }
+        """
+        )
+        layout = QHBoxLayout(fila)
+        layout.setContentsMargins(8, 4, 8, 4)
+        layout.setSpacing(6)
+
+        lbl_nombre = QLabel(jugador["nombre"])
+        lbl_nombre.setStyleSheet("color: #2c3e50; font-size: 10pt;")
+        layout.addWidget(lbl_nombre, 1)
+
+        if jugador["sancion"]:
+            lbl_nombre.setText(f"⛔ {jugador['nombre']}")
+            lbl_nombre.setStyleSheet("color: #95a5a6; font-size: 10pt;")
+            fila.setToolTip(
+                f"Sancionado: {jugador['sancion']} partido(s) pendiente(s)"
+            )
+
+        botones = {}
+        for tipo, icono in ICONOS.items():
+            boton = QPushButton(icono)
+            boton.setFixedSize(36, 30)
+            boton.setToolTip(f"Registrar {tipo} de {jugador['nombre']}")
+            boton.setStyleSheet(
+                """
+                QPushButton {
+                    background-color: #ecf0f1;
+                    border: 1px solid #bdc3c7;
+                    border-radius: 6px;
+                    font-size: 12pt;
+                }
+                QPushButton:hover {
+                    background-color: #d5dbdb;
+                }
+                QPushButton:disabled {
+                    background-color: #f8f9f9;
+                }
+            """
+            )
+            boton.clicked.connect(
+                lambda _=False, j=jugador["id"], t=tipo: self._registrar_evento(j, t)
+            )
+            layout.addWidget(boton)
+            botones[tipo] = boton
+
+        self._botones_jugadores[jugador["id"]] = botones
+        if jugador["rojas_partido"] or jugador["sancion"]:
+            self._expulsar(jugador["id"])
+
+        return fila
+
+    # ── Cronómetro ──────────────────────────────────────────────────────────
+
+    @property
+    def reloj(self):
+        """RelojDigital: Reloj del que se toma el minuto de juego."""
+        return self._reloj
+
+    @reloj.setter
+    def reloj(self, reloj):
+        if self._reloj is not None:
+            self._reloj.stopwatchUpdated.disconnect(self._actualizar_minuto)
+        self._reloj = reloj
+        if reloj is not None:
+            reloj.stopwatchUpdated.connect(self._actualizar_minuto)
+        self._actualizar_minuto()
+
+    def _alternar_cronometro(self):
+        from reloj_digital import Mode
+
+        if self._reloj is None:
+            return
+
+        if self._reloj.mode != Mode.STOPWATCH:
+            self._reloj.mode = Mode.STOPWATCH
+
+        if self._reloj.stopwatch_active:
+            self._reloj.pause_stopwatch()
+        else:
+            self._reloj.start_stopwatch()
+        self._actualizar_minuto()
+
+    def _actualizar_minuto(self, *_):
+        minuto = self._reloj.minuto_partido() if self._reloj is not None else None
+        self.lbl_minuto.setText(f"{minuto}'" if minuto is not None else "--'")
+
+        en_marcha = self._reloj is not None and self._reloj.stopwatch_active
+        self.btn_cronometro.setText("⏸ Pausar" if en_marcha else "▶ Iniciar")
+
+    # ── Partido seleccionado ────────────────────────────────────────────────
+
+    def on_show(self):
+        """Llamado cuando se muestra la página."""
+        self.cargar_partidos()
+        self._actualizar_minuto()
+
+    def cargar_partidos(self):
+        """Carga los partidos pendientes conservando el seleccionado."""
+        seleccionado = self.partido.id if self.partido else None
+
+        self.combo_partidos.blockSignals(True)
+        self.combo_partidos.clear()
+        self.combo_partidos.addItem("Selecciona un partido pendiente", None)
+        for partido in Partido.obtener_partidos_pendientes():
+            # Los cruces cuyos equipos aún no se conocen no se pueden jugar
+            if not partido.equipo_local_id or not partido.equipo_visitante_id:
+                continue
+            nombres = partido.obtener_nombres_equipos()
+            self.combo_partidos.addItem(
+                f"{partido.eliminatoria}: {nombres['local']} vs {nombres['visitante']}",
+                partido.id,
+            )
+        indice = self.combo_partidos.findData(seleccionado)
+        self.combo_partidos.setCurrentIndex(max(indice, 0))
+        self.combo_partidos.blockSignals(False)
+
+        self._seleccionar_partido()
+
+    def aplicar_cambio(self, cambio):
+        """Recarga los partidos pendientes si se jugó o cambió alguno."""
+        self.cargar_partidos()
+
+    def _seleccionar_partido(self, *_):
+        partido_id = self.combo_partidos.currentData()
+        partido = Partido.obtener_por_id(partido_id) if partido_id else None
+        self._mostrar_partido(partido)
+
+    def _mostrar_partido(self, partido):
+        """Pinta las plantillas y la cronología del partido, o la deja vacía."""
+        self.partido = partido
+        self._lados.clear()
+        self._nombres.clear()
+        self._botones_jugadores.clear()
+        self._tarjetas.clear()
+
+        while self.layout_equipos.count():
+            item = self.layout_equipos.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+
+        self.btn_finalizar.setEnabled(partido is not None)
+        self.btn_deshacer.setEnabled(False)
+        self.lista_cronologia.clear()
+        self._cronologia = []
+        self._marcador = [0, 0]
+
+        if partido is None:
+            self._nombres_equipos = {"local": "Local", "visitante": "Visitante"}
+            self._actualizar_marcador()
+            return
+
+        self._nombres_equipos = partido.obtener_nombres_equipos()
+        acta = Partido.obtener_acta(partido.id)
+        for lado in ("local", "visitante"):
+            self.layout_equipos.addWidget(
+                self._crear_panel_equipo(self._nombres_equipos[lado], acta[lado], lado)
+            )
+
+        for evento in Partido.obtener_cronologia(partido.id):
+            self._anadir_evento(evento)
+        self._actualizar_marcador()
+
+    def _actualizar_marcador(self):
+        self.lbl_marcador.setText(
+            f"{self._nombres_equipos['local']}  {self._marcador[0]} - "
+            f"{self._marcador[1]}  {self._nombres_equipos['visitante']}"
+        )
+
+    def _anadir_evento(self, evento):
+        """Añade un evento a la cronología y lo cuenta en el marcador."""
+        self._cronologia.append(evento)
+        minuto = f"{evento['minuto']}'" if evento["minuto"] is not None else "--"
+        self.lista_cronologia.addItem(
+            f"{minuto}  {ICONOS[evento['tipo']]}  {evento['jugador']}"
+        )
+        self.lista_cronologia.scrollToBottom()
+        self.btn_deshacer.setEnabled(True)
+
+        if evento["tipo"] == "gol":
+            self._contar_gol(evento["jugador_id"], 1)
+        else:
+            self._contar_tarjeta(evento["jugador_id"], evento["tipo"], 1)
+
+    def _contar_gol(self, jugador_id, cantidad):
+        lado = self._lados.get(jugador_id)
+        if lado is not None:
+            self._marcador[0 if lado == "local" else 1] += cantidad
+
+    def _contar_tarjeta(self, jugador_id, tipo, cantidad):
+        tarjetas = self._tarjetas.setdefault(jugador_id, [0, 0])
+        tarjetas[0 if tipo == "amarilla" else 1] += cantidad
+        # Roja directa, o dos amarillas en actas anteriores a esta regla
+        self._expulsar(jugador_id, tarjetas[1] > 0 or tarjetas[0] >= 2)
+
+    def _expulsar(self, jugador_id, expulsado=True):
+        """Un jugador expulsado no puede marcar ni recibir más tarjetas."""
+        for boton in self._botones_jugadores.get(jugador_id, {}).values():
+            boton.setEnabled(not expulsado)
+
+    # ── Anotación ───────────────────────────────────────────────────────────
+
+    def _registrar_evento(self, jugador_id, tipo):
+        """Guarda al momento un gol o una tarjeta con el minuto del cronómetro."""
+        if not self.partido:
+            return
+
+        minuto = self._reloj.minuto_partido() if self._reloj is not None else None
+        if minuto is None:
+            QMessageBox.warning(
+                self,
+                "Cronómetro parado",
+                "Inicia el cronómetro para registrar el minuto del evento.",
+            )
+            return
+
+        if tipo == "amarilla" and self._tarjetas.get(jugador_id, [0, 0])[0] > 0:
+            # Segunda amarilla: se anota la roja que supone
+            tipo = "roja"
+
+        if tipo == "gol":
+            registro = Gol(
+                partido_id=self.partido.id, jugador_id=jugador_id, minuto=minuto
+            )
+        else:
+            registro = Tarjeta(
+                partido_id=self.partido.id,
+                jugador_id=jugador_id,
+                tipo=tipo,
+                minuto=minuto,
+            )
+
+        if not registro.guardar():
+            QMessageBox.critical(self, "Error", f"No se pudo registrar el {tipo}.")
+            return
+
+        self._anadir_evento(
+            {
+                "minuto": minuto,
+                "tipo": tipo,
+                "id": registro.id,
+                "jugador_id": jugador_id,
+                "jugador": self._nombres.get(jugador_id, ""),
+            }
+        )
+        self._actualizar_marcador()
+
+    def _deshacer_ultimo(self):
+        """Elimina el último gol o tarjeta registrado."""
+        if not self._cronologia:
+            return
+
+        evento = self._cronologia[-1]
+        clase = Gol if evento["tipo"] == "gol" else Tarjeta
+        if not clase(id=evento["id"], jugador_id=evento["jugador_id"]).eliminar():
+            QMessageBox.critical(self, "Error", "No se pudo deshacer el evento.")
+            return
+
+        self._cronologia.pop()
+        self.lista_cronologia.takeItem(self.lista_cronologia.count() - 1)
+        self.btn_deshacer.setEnabled(bool(self._cronologia))
+
+        if evento["tipo"] == "gol":
+            self._contar_gol(evento["jugador_id"], -1)
+        else:
+            self._contar_tarjeta(evento["jugador_id"], evento["tipo"], -1)
+        self._actualizar_marcador()
+
+    def _finalizar_partido(self):
+        """Cierra el partido con el marcador de los goles ya registrados."""
+        if not self.partido:
+            return
+
+        respuesta = QMessageBox.question(
+            self,
+            "Finalizar partido",
+            f"¿Dar por terminado el partido?\n\n{self.lbl_marcador.text()}",
+            QMessageBox.Yes | QMessageBox.No,
+        )
+        if respuesta != QMessageBox.Yes:
+            return
+
+        partido = self.partido
+        try:
+            with database.transaccion():
+                goles_local, goles_visitante = Partido.calcular_marcador(partido.id)
+                partido.goles_local = goles_local
+                partido.goles_visitante = goles_visitante
+                partido.jugado = True
+
+                if goles_local > goles_visitante:
+                    partido.ganador_id = partido.equipo_local_id
+                elif goles_visitante > goles_local:
+                    partido.ganador_id = partido.equipo_visitante_id
+                else:
+                    partido.ganador_id = None  # Empate
+
+                if not partido.actualizar_campos(
+                    "goles_local", "goles_visitante", "jugado", "ganador_id"
+                ):
+                    raise Exception("No se pudo actualizar el partido")
+
+                progresion.avanzar(partido)
+        except Exception as e:
+            QMessageBox.critical(
+                self, "Error", f"No se pudo finalizar el partido:\n{str(e)}"
+            )
+            return
+
+        if self._reloj is not None and self._reloj.stopwatch_active:
+            from reloj_digital import Mode
+
+            self._reloj.mode = Mode.STOPWATCH
+            self._reloj.pause_stopwatch()
+        self._actualizar_minuto()
+        self.cargar_partidos()
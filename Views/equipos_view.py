@@ -10,7 +10,7 @@ para hacerlo más escalable, mantenible y mejorable. Menos estático.
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, QSize
 from PySide6.QtGui import QColor
 from PySide6.QtSvgWidgets import QSvgWidget
 from PySide6.QtWidgets import (
@@ -22,6 +22,7 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QMessageBox,
@@ -33,9 +34,8 @@ from PySide6.QtWidgets import (
     QColorDialog,
 )
 
+from Models import importacion
 from Models.equipo import Equipo
-from Models.jugador_equipo import JugadorEquipo
-from Models.participante import Participante
 from Views.base_page import BasePage
 from Views.dialogs import EscudoSelectorDialog
 from Views.utils import obtener_ruta_recurso
@@ -152,6 +152,8 @@ class _EquipoListItem(QWidget):
 
 
 class EquiposPage(BasePage):
+    TABLAS = ("equipos",)
+
     def __init__(self, parent=None):
         super().__init__("Equipos", parent)
 
@@ -490,15 +492,71 @@ class EquiposPage(BasePage):
         self.btn_exportar.clicked.connect(self._exportar_csv)
         der.addWidget(self.btn_exportar)
 
+        # Importación CSV de equipos, participantes o plantillas
+        self.btn_importar = QPushButton("📥 Importar desde CSV")
+        self.btn_importar.setStyleSheet(
+            """
+            QPushButton {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                            stop:0 #0984e3, stop:1 #0773c5);
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 8px 16px;
+                font-weight: 700;
+                font-size: 10pt;
+            }
+            QPushButton:hover {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                            stop:0 #0773c5, stop:1 #0662a8);
+            }
+            QPushButton:pressed { background: #0662a8; }
+        """
+        )
+        self.btn_importar.setMinimumHeight(36)
+        self.btn_importar.setToolTip(
+            "Importa equipos, participantes o plantillas (Jugador, Equipo).\n"
+            "El tipo se deduce de la cabecera del archivo."
+        )
+        self.btn_importar.clicked.connect(self._importar_csv)
+        der.addWidget(self.btn_importar)
+
         splitter.setStretchFactor(0, 1)
         splitter.setStretchFactor(1, 2)
 
         self._refrescar_lista()
         self._actualizar_labels()
 
+        self.escuchar_cambios()
+
     def on_show(self):
         self._refrescar_lista()
 
+    def aplicar_cambio(self, cambio):
+        """Actualiza solo la fila del equipo afectado."""
+        if cambio.id is None or self.txt_filtro.text().strip():
+            # Con filtro activo el equipo puede entrar o salir de la lista
+            self._refrescar_lista()
+            return
+
+        for fila in range(self.lista.count()):
+            if self.lista.item(fila).data(Qt.UserRole) == cambio.id:
+                self.lista.takeItem(fila)
+                break
+
+        equipo = Equipo.obtener_por_id(cambio.id)
+        if equipo is None:
+            return
+
+        # Mantener el orden por nombre de obtener_todos()
+        fila = self.lista.count()
+        for i in range(self.lista.count()):
+            existente = self.lista.itemWidget(self.lista.item(i)).equipo
+            if existente.nombre > equipo.nombre:
+                fila = i
+                break
+        self._insertar_item(fila, equipo)
+
     def _actualizar_labels(self):
         # Actualizar el fondo del botón de color
         self.btn_color.setStyleSheet(
@@ -655,7 +713,6 @@ class EquiposPage(BasePage):
         self._color_actual = "#3498db"
         self._escudo_actual = None
         self._actualizar_labels()
-        self._refrescar_lista()
 
     def _exportar_csv(self):
         """Exporta todos los equipos a un archivo CSV."""
@@ -679,20 +736,54 @@ class EquiposPage(BasePage):
                 msg.setText("No se pudo exportar los equipos. Intente nuevamente.")
                 msg.exec()
 
+    def _importar_csv(self):
+        """Importa equipos, participantes o plantillas desde un archivo CSV."""
+        ruta_archivo, _ = QFileDialog.getOpenFileName(
+            self,
+            "Importar desde CSV",
+            "",
+            "Archivos CSV (*.csv)",
+        )
+        if not ruta_archivo:
+            return
+
+        msg = QMessageBox(self)
+        try:
+            tipo = importacion.detectar_tipo(ruta_archivo)
+            if tipo is None:
+                raise importacion.ErrorImportacion(
+                    "No se reconoce la cabecera del archivo"
+                )
+            resultado = importacion.importar(tipo, ruta_archivo)
+        except Exception as e:
+            msg.setIcon(QMessageBox.Warning)
+            msg.setWindowTitle("Error de importación")
+            msg.setText(f"No se pudo importar el archivo:\n{e}")
+            msg.exec()
+            return
+
+        msg.setIcon(QMessageBox.Warning if resultado.errores else QMessageBox.Information)
+        msg.setWindowTitle("Importación terminada")
+        msg.setText(resultado.resumen())
+        msg.exec()
+
     def _refrescar_lista(self):
         texto = self.txt_filtro.text().strip()
         equipos = Equipo.buscar(texto) if texto else Equipo.obtener_todos()
 
         self.lista.clear()
         for e in equipos:
-            item = QListWidgetItem()
-            item.setData(Qt.UserRole, e.id)
-            # Altura suficiente para mostrar todo sin cortes (escudo 50px + márgenes 20px + borde)
-            item.setSizeHint(QSize(100, 90))
+            self._insertar_item(self.lista.count(), e)
+
+    def _insertar_item(self, fila: int, equipo: Equipo):
+        item = QListWidgetItem()
+        item.setData(Qt.UserRole, equipo.id)
+        # Altura suficiente para mostrar todo sin cortes (escudo 50px + márgenes 20px + borde)
+        item.setSizeHint(QSize(100, 90))
 
-            widget = _EquipoListItem(e, self._eliminar_equipo, self._editar_equipo)
-            self.lista.addItem(item)
-            self.lista.setItemWidget(item, widget)
+        widget = _EquipoListItem(equipo, self._eliminar_equipo, self._editar_equipo)
+        self.lista.insertItem(fila, item)
+        self.lista.setItemWidget(item, widget)
 
     def _mostrar_jugadores(self, item):
         """Muestra un diálogo con los jugadores del equipo seleccionado."""
@@ -758,7 +849,34 @@ class EquiposPage(BasePage):
             QMessageBox.critical(self, "Error", "No se pudo eliminar el equipo.")
             return
 
-        self._refrescar_lista()
+
+class _PlantillaModel(QAbstractListModel):
+    """Modelo de lista con la plantilla de un equipo (una fila por jugador)."""
+
+    def __init__(self, jugadores: list, parent=None):
+        super().__init__(parent)
+        self._jugadores = jugadores
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._jugadores)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        jugador = self._jugadores[index.row()]
+
+        if role == Qt.DisplayRole:
+            texto = f"{jugador['nombre']} - {jugador['posicion']}"
+            if jugador["goles"] > 0:
+                texto += f" | Goles: {jugador['goles']}"
+            if jugador["t_amarillas"] > 0:
+                texto += f" | T.Amarillas: {jugador['t_amarillas']}"
+            if jugador["t_rojas"] > 0:
+                texto += f" | T.Rojas: {jugador['t_rojas']}"
+            return texto
+        if role == Qt.UserRole:
+            return jugador["id"]
+        return None
 
 
 class JugadoresEquipoDialog(QDialog):
@@ -780,10 +898,10 @@ class JugadoresEquipoDialog(QDialog):
         titulo.setStyleSheet("font-size: 14pt; font-weight: 800; color: #2c3e50;")
         layout.addWidget(titulo)
 
-        # Obtener jugadores del equipo
-        jugadores_ids = JugadorEquipo.obtener_jugadores_de_equipo(equipo.id)
+        # Plantilla con estadísticas en una sola consulta
+        jugadores = Equipo.obtener_jugadores(equipo.id)
 
-        if not jugadores_ids:
+        if not jugadores:
             msg = QLabel("Este equipo no tiene jugadores asignados.")
             msg.setStyleSheet(
                 "color: #7f8c8d; font-size: 10pt; font-style: italic; padding: 20px;"
@@ -792,38 +910,26 @@ class JugadoresEquipoDialog(QDialog):
             layout.addWidget(msg)
         else:
             # Lista de jugadores
-            lista = QListWidget()
+            lista = QListView()
+            lista.setEditTriggers(QAbstractItemView.NoEditTriggers)
             lista.setStyleSheet(
                 """
-                QListWidget {
+                QListView {
                     background-color: white;
                     border: 2px solid #bdc3c7;
                     border-radius: 8px;
                     padding: 5px;
                 }
-                QListWidget::item {
+                QListView::item {
                     padding: 10px;
                     border-bottom: 1px solid #ecf0f1;
                 }
-                QListWidget::item:hover {
+                QListView::item:hover {
                     background-color: #ecf0f1;
                 }
                 """
             )
-
-            for jugador_id in jugadores_ids:
-                participante = Participante.obtener_por_id(jugador_id)
-                if participante:
-                    texto = f"{participante.nombre} - {participante.posicion}"
-                    if participante.goles > 0:
-                        texto += f" | Goles: {participante.goles}"
-                    if participante.t_amarillas > 0:
-                        texto += f" | T.Amarillas: {participante.t_amarillas}"
-                    if participante.t_rojas > 0:
-                        texto += f" | T.Rojas: {participante.t_rojas}"
-
-                    item = QListWidgetItem(texto)
-                    lista.addItem(item)
+            lista.setModel(_PlantillaModel(jugadores, lista))
 
             layout.addWidget(lista)
 
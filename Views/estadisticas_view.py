@@ -0,0 +1,300 @@
+"""Pantalla de Estadísticas - Goleadores, disciplina y goles por eliminatoria.
+
+Tres tablas calculadas con consultas agregadas (Models.estadisticas):
+- Máximos goleadores del torneo
+- Tarjetas amarillas y rojas de cada equipo
+- Partidos jugados y goles de cada eliminatoria
+
+Los resultados se guardan en memoria y cada cambio recalcula solo la fila
+afectada: un gol nuevo relee su jugador y el equipo de ese jugador, y un
+resultado guardado relee su eliminatoria.
+"""
+
+from __future__ import annotations
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QFrame,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from Models.estadisticas import MAX_GOLEADORES, Estadisticas
+from Models.partido import Partido
+from Views.base_page import BasePage
+
+
+def _clave_goleador(jugador):
+    """Mismo orden que la consulta: más goles primero y, a igualdad, menor id."""
+    return (-jugador["goles"], jugador["id"])
+
+
+class EstadisticasPage(BasePage):
+    TABLAS = ("participantes", "jugadores_equipos", "equipos", "partidos")
+
+    def __init__(self, parent=None):
+        super().__init__("Estadísticas del Torneo", parent)
+
+        # Resultados en memoria de cada tabla
+        self._goleadores = []
+        # Quedan goleadores fuera de la tabla: al salir uno hay que releer
+        self._hay_mas_goleadores = False
+        self._equipos = {}
+        self._rondas = {}
+
+        panel_principal = QFrame()
+        panel_principal.setStyleSheet(
+            """
+            QFrame {
+                background-color: rgba(255, 255, 255, 0.92);
+                border-radius: 12px;
+            }
+        """
+        )
+        layout_principal = QHBoxLayout(panel_principal)
+        layout_principal.setContentsMargins(15, 15, 15, 15)
+        layout_principal.setSpacing(10)
+
+        self.tabla_goleadores = self._crear_tabla(["#", "Jugador", "Equipo", "⚽"])
+        layout_principal.addWidget(
+            self._crear_panel("⚽ Máximos Goleadores", self.tabla_goleadores), 3
+        )
+
+        self.tabla_equipos = self._crear_tabla(["Equipo", "🟨", "🟥"])
+        layout_principal.addWidget(
+            self._crear_panel("🟨 Disciplina por Equipo", self.tabla_equipos), 2
+        )
+
+        self.tabla_rondas = self._crear_tabla(
+            ["Eliminatoria", "Jugados", "Goles", "Media"]
+        )
+        layout_principal.addWidget(
+            self._crear_panel("🏆 Goles por Eliminatoria", self.tabla_rondas), 2
+        )
+
+        self.contenido_layout.addWidget(panel_principal)
+
+        self.escuchar_cambios()
+
+    def _crear_panel(self, titulo, tabla):
+        panel = QFrame()
+        panel.setStyleSheet(
+            """
+            QFrame {
+                background-color: rgba(236, 240, 241, 0.95);
+                border-radius: 8px;
+            }
+        """
+        )
+        layout = QVBoxLayout(panel)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(8)
+
+        lbl_titulo = QLabel(titulo)
+        lbl_titulo.setAlignment(Qt.AlignCenter)
+        lbl_titulo.setStyleSheet(
+            """
+            QLabel {
+                font-size: 13pt;
+                font-weight: bold;
+                color: white;
+                padding: 8px;
+                background-color: #34495e;
+                border-radius: 6px;
+            }
+        """
+        )
+        layout.addWidget(lbl_titulo)
+        layout.addWidget(tabla, 1)
+
+        return panel
+
+    def _crear_tabla(self, columnas):
+        tabla = QTableWidget(0, len(columnas))
+        tabla.setHorizontalHeaderLabels(columnas)
+        tabla.verticalHeader().setVisible(False)
+        tabla.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        tabla.setSelectionMode(QAbstractItemView.NoSelection)
+        tabla.setAlternatingRowColors(True)
+        tabla.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        tabla.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        if columnas[0] == "#":
+            tabla.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+            tabla.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        tabla.setStyleSheet(
+            """
+            QTableWidget {
+                background-color: white;
+                alternate-background-color: #f4f6f7;
+                color: #2c3e50;
+                border: 1px solid #bdc3c7;
+                border-radius: 6px;
+                font-size: 10pt;
+                gridline-color: #ecf0f1;
+            }
+            QHeaderView::section {
+                background-color: #ecf0f1;
+                color: #2c3e50;
+                font-weight: bold;
+                border: none;
+                padding: 6px;
+            }
+        """
+        )
+        return tabla
+
+    @staticmethod
+    def _rellenar(tabla, filas):
+        """Sustituye el contenido de una tabla por las filas indicadas."""
+        tabla.setUpdatesEnabled(False)
+        tabla.setRowCount(len(filas))
+        for fila, valores in enumerate(filas):
+            for columna, valor in enumerate(valores):
+                item = QTableWidgetItem(str(valor))
+                # Los nombres a la izquierda, las cifras centradas
+                if not isinstance(valor, str):
+                    item.setTextAlignment(Qt.AlignCenter)
+                tabla.setItem(fila, columna, item)
+        tabla.setUpdatesEnabled(True)
+
+    # ── Carga completa ──────────────────────────────────────────────────────
+
+    def on_show(self):
+        """Llamado cuando se muestra la página."""
+        self._cargar_goleadores()
+        self._cargar_equipos()
+        self._cargar_rondas()
+
+    def _cargar_goleadores(self):
+        self._goleadores = Estadisticas.goleadores(MAX_GOLEADORES)
+        self._hay_mas_goleadores = len(self._goleadores) == MAX_GOLEADORES
+        self._pintar_goleadores()
+
+    def _cargar_equipos(self):
+        self._equipos = {e["id"]: e for e in Estadisticas.tarjetas_por_equipo()}
+        self._pintar_equipos()
+
+    def _cargar_rondas(self):
+        self._rondas = {
+            r["eliminatoria"]: r for r in Estadisticas.goles_por_eliminatoria()
+        }
+        self._pintar_rondas()
+
+    # ── Actualización incremental ───────────────────────────────────────────
+
+    def aplicar_cambio(self, cambio):
+        """Recalcula solo las filas afectadas por el cambio."""
+        if cambio.entidad == "participantes":
+            if cambio.id is None:
+                self._cargar_goleadores()
+                self._cargar_equipos()
+            else:
+                self._actualizar_jugador(cambio.id)
+        elif cambio.entidad == "partidos":
+            if cambio.id is None:
+                self._cargar_rondas()
+            else:
+                self._actualizar_partido(cambio.id)
+        elif cambio.entidad == "equipos" and cambio.id is not None:
+            self._actualizar_equipo(cambio.id)
+            if any(j["equipo_id"] == cambio.id for j in self._goleadores):
+                self._cargar_goleadores()
+        else:
+            # Cambios de plantilla: mueven jugadores y tarjetas entre equipos
+            self._cargar_equipos()
+            self._cargar_goleadores()
+
+    def _actualizar_jugador(self, jugador_id):
+        """Recoloca un jugador en la tabla de goleadores y relee su equipo."""
+        jugador = Estadisticas.obtener_jugador(jugador_id)
+
+        if jugador is None:
+            # Eliminado: no se sabe de qué equipo era
+            self._cargar_equipos()
+        elif jugador["equipo_id"] is not None:
+            self._actualizar_equipo(jugador["equipo_id"])
+
+        estaba = any(j["id"] == jugador_id for j in self._goleadores)
+        self._goleadores = [j for j in self._goleadores if j["id"] != jugador_id]
+
+        ultimo = self._goleadores[-1] if self._goleadores else None
+        if (
+            jugador is not None
+            and jugador["goles"] > 0
+            and (
+                (ultimo is not None and _clave_goleador(jugador) < _clave_goleador(ultimo))
+                or (
+                    len(self._goleadores) < MAX_GOLEADORES
+                    and not self._hay_mas_goleadores
+                )
+            )
+        ):
+            self._goleadores.append(jugador)
+            self._goleadores.sort(key=_clave_goleador)
+            if len(self._goleadores) > MAX_GOLEADORES:
+                del self._goleadores[MAX_GOLEADORES:]
+                self._hay_mas_goleadores = True
+            self._pintar_goleadores()
+        elif estaba:
+            if self._hay_mas_goleadores:
+                # Ha bajado o salido de la tabla y el siguiente no está en memoria
+                self._cargar_goleadores()
+            else:
+                self._pintar_goleadores()
+
+    def _actualizar_equipo(self, equipo_id):
+        filas = Estadisticas.tarjetas_por_equipo(equipo_id)
+        if filas:
+            self._equipos[equipo_id] = filas[0]
+        else:
+            self._equipos.pop(equipo_id, None)
+        self._pintar_equipos()
+
+    def _actualizar_partido(self, partido_id):
+        partido = Partido.obtener_por_id(partido_id)
+        if partido is None or not partido.eliminatoria:
+            # Eliminado: no se sabe de qué eliminatoria era
+            self._cargar_rondas()
+            return
+
+        filas = Estadisticas.goles_por_eliminatoria(partido.eliminatoria)
+        if filas:
+            self._rondas[partido.eliminatoria] = filas[0]
+        else:
+            self._rondas.pop(partido.eliminatoria, None)
+        self._pintar_rondas()
+
+    # ── Pintado ─────────────────────────────────────────────────────────────
+
+    def _pintar_goleadores(self):
+        self._rellenar(
+            self.tabla_goleadores,
+            [
+                (i, j["nombre"], j["equipo"], j["goles"])
+                for i, j in enumerate(self._goleadores, start=1)
+            ],
+        )
+
+    def _pintar_equipos(self):
+        equipos = sorted(
+            self._equipos.values(),
+            key=lambda e: (-e["rojas"], -e["amarillas"], e["nombre"]),
+        )
+        self._rellenar(
+            self.tabla_equipos,
+            [(e["nombre"], e["amarillas"], e["rojas"]) for e in equipos],
+        )
+
+    def _pintar_rondas(self):
+        filas = []
+        for fase in Partido.ELIMINATORIAS:
+            ronda = self._rondas.get(fase)
+            if ronda:
+                media = round(ronda["goles"] / ronda["jugados"], 2)
+                filas.append((fase, ronda["jugados"], ronda["goles"], media))
+        self._rellenar(self.tabla_rondas, filas)
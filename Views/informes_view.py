@@ -65,6 +65,16 @@ def _ruta_reports_vista():
 class InformesPage(BasePage):
     """Página de generación de informes PDF del torneo."""
 
+    # Los informes leen todo el torneo
+    TABLAS = (
+        "equipos",
+        "participantes",
+        "jugadores_equipos",
+        "partidos",
+        "goles",
+        "tarjetas",
+    )
+
     INFORMES = [
         (
             "Equipos y Jugadores",
@@ -483,7 +493,7 @@ class InformesPage(BasePage):
                 <p>Informe completo con:</p>
                 <ul>
                     <li><b>Tabla de clasificación:</b> PJ, V, E, D, GF, GC, Diferencia</li>
-                    <li><b>Cuadro de eliminatorias:</b> Octavos → Cuartos → Semifinales → Final</li>
+                    <li><b>Cuadro de eliminatorias:</b> de Sesentaicuatroavos (o la primera ronda con partidos) a la Final</li>
                     <li><b>Estadísticas globales:</b> Goles y tarjetas por eliminatoria</li>
                     <li><b>Comparativa:</b> Más victorias, más goles, menos goles recibidos</li>
                 </ul>
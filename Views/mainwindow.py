@@ -193,6 +193,8 @@ class MainWindow(QMainWindow):
         from Views.resultados_view import ResultadosPage
         from Views.clasificacion_view import ClasificacionPage
         from Views.informes_view import InformesPage
+        from Views.directo_view import DirectoPage
+        from Views.estadisticas_view import EstadisticasPage
         from reloj_digital import RelojDigital
 
         self.paginas = {
@@ -202,6 +204,8 @@ class MainWindow(QMainWindow):
             "resultados": ResultadosPage(),
             "clasificacion": ClasificacionPage(),
             "informes": InformesPage(),
+            "directo": DirectoPage(),
+            "estadisticas": EstadisticasPage(),
             "reloj": self._crear_pagina_reloj(),
         }
 
@@ -212,6 +216,10 @@ class MainWindow(QMainWindow):
                 pagina.volver_a_principal.connect(self.volver_a_principal)
             self.stacked_widget.addWidget(pagina)
 
+        # El editor de resultados toma el minuto de juego del cronómetro
+        self.paginas["resultados"].reloj = self.reloj_digital
+        self.paginas["directo"].reloj = self.reloj_digital
+
         # Crear menú
         self.crear_menu()
 
@@ -398,6 +406,27 @@ class MainWindow(QMainWindow):
         accion_ayuda.triggered.connect(self.mostrar_ayuda)
         menu_opciones.addAction(accion_ayuda)
 
+        # Amarillas acumuladas que suponen un partido de sanción
+        accion_umbral = QAction("Umbral de amarillas...", self)
+        accion_umbral.triggered.connect(self._configurar_umbral_amarillas)
+        menu_opciones.addAction(accion_umbral)
+
+        menu_opciones.addSeparator()
+
+        # API JSON para marcadores y pantallas externas
+        self._servidor_api = None
+        self.accion_api = QAction("Servidor de marcadores (API JSON)", self)
+        self.accion_api.setCheckable(True)
+        self.accion_api.toggled.connect(self._alternar_api)
+        menu_opciones.addAction(self.accion_api)
+
+        # Directo de resultados por Server-Sent Events
+        self._emisor_directo = None
+        self.accion_directo = QAction("Directo de resultados (SSE)", self)
+        self.accion_directo.setCheckable(True)
+        self.accion_directo.toggled.connect(self._alternar_directo)
+        menu_opciones.addAction(self.accion_directo)
+
         menu_opciones.addSeparator()
 
         # Acción Salir
@@ -441,6 +470,16 @@ class MainWindow(QMainWindow):
         )
         menubar.addAction(accion_clasificacion)
 
+        accion_directo = QAction("Directo", self)
+        accion_directo.triggered.connect(lambda: self.navegar_a_seccion("directo"))
+        menubar.addAction(accion_directo)
+
+        accion_estadisticas = QAction("Estadísticas", self)
+        accion_estadisticas.triggered.connect(
+            lambda: self.navegar_a_seccion("estadisticas")
+        )
+        menubar.addAction(accion_estadisticas)
+
         accion_informes = QAction("Informes", self)
         accion_informes.triggered.connect(lambda: self.navegar_a_seccion("informes"))
         menubar.addAction(accion_informes)
@@ -476,7 +515,15 @@ class MainWindow(QMainWindow):
                 "Error de Navegación",
                 f"No se pudo cargar la sección '{seccion}'.\nError: {str(e)}",
             )
-        if hasattr(pagina, "on_show"):
+        from Views.base_page import BasePage
+
+        # Solo se recarga si cambiaron las tablas que muestra la página
+        if isinstance(pagina, BasePage):
+            try:
+                pagina.refrescar_si_cambio()
+            except Exception:
+                pass
+        elif hasattr(pagina, "on_show"):
             try:
                 pagina.on_show()
             except Exception:
@@ -499,6 +546,7 @@ class MainWindow(QMainWindow):
             if partidos_sin_arbitro:
                 mensajes.append(
                     f"⚠️ {len(partidos_sin_arbitro)} partido(s) sin árbitro asignado"
+                    " (Calendario → Asignar árbitros)"
                 )
 
             if partidos_pendientes:
@@ -542,6 +590,112 @@ class MainWindow(QMainWindow):
         dialog = AyudaDialog(self)
         dialog.exec()
 
+    def _configurar_umbral_amarillas(self):
+        """
+        Pide el número de amarillas acumuladas que supone un partido de sanción.
+        """
+        from PySide6.QtWidgets import QInputDialog
+        from Models.sancion import Sancion
+
+        umbral, aceptado = QInputDialog.getInt(
+            self,
+            "Sanciones",
+            "Amarillas acumuladas para un partido de sanción:",
+            Sancion.obtener_umbral_amarillas(),
+            1,
+            20,
+        )
+        if aceptado and not Sancion.establecer_umbral_amarillas(umbral):
+            QMessageBox.critical(
+                self, "Sanciones", "No se pudo guardar el umbral de amarillas."
+            )
+
+    def _alternar_api(self, activar):
+        """
+        Arranca o detiene el servidor de la API JSON de solo lectura.
+
+        Args:
+            activar (bool): True para arrancarlo, False para detenerlo
+        """
+        from Controllers.api_controller import HOST_POR_DEFECTO, ServidorApi
+
+        if not activar:
+            if self._servidor_api is not None:
+                self._servidor_api.detener()
+                self._servidor_api = None
+            return
+
+        servidor = ServidorApi(host=self._preguntar_host(HOST_POR_DEFECTO))
+        if not self._iniciar_servidor(servidor, self.accion_api):
+            return
+
+        self._servidor_api = servidor
+        QMessageBox.information(
+            self,
+            "Servidor de marcadores",
+            f"API disponible en:\n{servidor.url}\n\n"
+            "Recursos: /equipos, /partidos, /resultados, /cuadro y /goleadores",
+        )
+
+    def _alternar_directo(self, activar):
+        """
+        Arranca o detiene el directo de resultados por Server-Sent Events.
+
+        Args:
+            activar (bool): True para arrancarlo, False para detenerlo
+        """
+        from Controllers.directo_controller import HOST_POR_DEFECTO, EmisorDirecto
+
+        if not activar:
+            if self._emisor_directo is not None:
+                self._emisor_directo.detener()
+                self._emisor_directo = None
+            return
+
+        emisor = EmisorDirecto(host=self._preguntar_host(HOST_POR_DEFECTO))
+        if not self._iniciar_servidor(emisor, self.accion_directo):
+            return
+
+        self._emisor_directo = emisor
+        QMessageBox.information(
+            self,
+            "Directo de resultados",
+            f"Flujo de eventos disponible en:\n{emisor.url}\n\n"
+            "Cada resultado guardado se envía al instante a las pantallas conectadas.",
+        )
+
+    def _preguntar_host(self, host_local):
+        """
+        Pregunta si un servidor debe aceptar conexiones de la red local.
+
+        Returns:
+            str: "0.0.0.0" para la red local, o host_local para este equipo
+        """
+        respuesta = QMessageBox.question(
+            self,
+            "Acceso desde la red",
+            "¿Permitir que otros equipos de la red local se conecten?\n\n"
+            "Si responde No, solo será accesible desde este equipo.",
+        )
+        return "0.0.0.0" if respuesta == QMessageBox.Yes else host_local
+
+    def _iniciar_servidor(self, servidor, accion):
+        """
+        Arranca un servidor y desmarca su acción del menú si falla.
+
+        Returns:
+            bool: True si el servidor arrancó
+        """
+        try:
+            servidor.iniciar()
+        except Exception as e:
+            QMessageBox.warning(self, accion.text(), f"No se pudo iniciar el servidor:\n{e}")
+            accion.blockSignals(True)
+            accion.setChecked(False)
+            accion.blockSignals(False)
+            return False
+        return True
+
     def closeEvent(self, event):
         """
         Maneja el evento de cierre de la ventana.
@@ -556,6 +710,10 @@ class MainWindow(QMainWindow):
         msg.exec()
 
         if msg.clickedButton() == btn_si:
+            if self._servidor_api is not None:
+                self._servidor_api.detener()
+            if self._emisor_directo is not None:
+                self._emisor_directo.detener()
             event.accept()
         else:
             event.ignore()
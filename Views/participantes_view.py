@@ -100,12 +100,7 @@ class _ParticipanteListItem(QWidget):
 
         # Si es árbitro, buscar partido asignado
         if participante.es_arbitro:
-            partidos = Partido.obtener_todos()
-            partido_asignado = None
-            for partido in partidos:
-                if partido.arbitro_id == participante.id:
-                    partido_asignado = partido
-                    break
+            partido_asignado = Partido.obtener_primero_de_arbitro(participante.id)
 
             if partido_asignado:
                 equipo_local = Equipo.obtener_por_id(partido_asignado.equipo_local_id)
@@ -222,6 +217,8 @@ class _ParticipanteListItem(QWidget):
 
 
 class ParticipantesPage(BasePage):
+    TABLAS = ("participantes", "jugadores_equipos", "partidos", "equipos")
+
     def __init__(self, parent=None):
         super().__init__("Participantes", parent)
 
@@ -576,6 +573,8 @@ class ParticipantesPage(BasePage):
         self._cargar_equipos_y_partidos()
         self._refrescar_lista_participantes()
 
+        self.escuchar_cambios()
+
     def _aplicar_estilo_combo(self, combo: QComboBox):
         """Aplica el estilo consistente a un QComboBox."""
         combo.setStyleSheet(
@@ -668,49 +667,101 @@ class ParticipantesPage(BasePage):
         # Cargar equipos
         self.combo_equipo.clear()
         self.combo_equipo.addItem("-- Sin asignar --", None)
-        equipos = Equipo.obtener_todos()
-        for equipo in equipos:
+        nombres = {}
+        for equipo in Equipo.iterar():
+            nombres[equipo.id] = equipo.nombre
             self.combo_equipo.addItem(equipo.nombre, equipo.id)
 
         # Cargar partidos
         self.combo_partido.clear()
         self.combo_partido.addItem("-- Sin asignar --", None)
-        partidos = Partido.obtener_todos()
-        for partido in partidos:
-            equipo_local = Equipo.obtener_por_id(partido.equipo_local_id)
-            equipo_visitante = Equipo.obtener_por_id(partido.equipo_visitante_id)
-            if equipo_local and equipo_visitante:
-                texto = f"{equipo_local.nombre} vs {equipo_visitante.nombre} - {partido.fecha_hora[:10]}"
+        for partido in Partido.iterar():
+            local = nombres.get(partido.equipo_local_id)
+            visitante = nombres.get(partido.equipo_visitante_id)
+            if local and visitante:
+                texto = f"{local} vs {visitante} - {partido.fecha_hora[:10]}"
                 self.combo_partido.addItem(texto, partido.id)
 
     def _refrescar_lista_participantes(self):
         """Refresca la lista de participantes aplicando el filtro actual."""
         self.lista_participantes.clear()
 
+        for participante in Participante.iterar():
+            # Aplicar filtro
+            if not self._coincide_filtro(participante):
+                continue
+
+            self._insertar_item(self.lista_participantes.count(), participante)
+
+    def _coincide_filtro(self, participante: Participante) -> bool:
+        """Indica si el participante pasa el filtro de texto actual."""
         filtro = self.txt_filtro.text().strip().lower()
-        participantes = Participante.obtener_todos()
+        if not filtro:
+            return True
+        return (
+            filtro in participante.nombre.lower()
+            or filtro in participante.curso.lower()
+        )
 
-        for participante in participantes:
-            # Aplicar filtro
-            if filtro:
-                if (
-                    filtro not in participante.nombre.lower()
-                    and filtro not in participante.curso.lower()
-                ):
-                    continue
+    def _insertar_item(self, fila: int, participante: Participante):
+        """Inserta la fila de un participante en la posición indicada."""
+        # Crear widget personalizado
+        item_widget = _ParticipanteListItem(
+            participante,
+            on_delete=self._eliminar_participante,
+            on_edit=self._editar_participante,
+        )
 
-            # Crear widget personalizado
-            item_widget = _ParticipanteListItem(
-                participante,
-                on_delete=self._eliminar_participante,
-                on_edit=self._editar_participante,
-            )
+        # Agregar a la lista
+        item = QListWidgetItem()
+        item.setData(Qt.UserRole, participante.id)
+        item.setSizeHint(item_widget.sizeHint())
+        self.lista_participantes.insertItem(fila, item)
+        self.lista_participantes.setItemWidget(item, item_widget)
+
+    def aplicar_cambio(self, cambio):
+        """Actualiza solo las filas de los participantes afectados."""
+        if cambio.entidad == "equipos" or cambio.id is None:
+            # Nombres de equipo en varias filas y en los combos
+            self._cargar_equipos_y_partidos()
+            self._refrescar_lista_participantes()
+            return
+
+        if cambio.entidad == "partidos":
+            # Solo cambia la fila del árbitro asignado y el combo de partidos
+            self._cargar_equipos_y_partidos()
+            partido = Partido.obtener_por_id(cambio.id)
+            if partido is None:
+                self._refrescar_lista_participantes()
+            elif partido.arbitro_id:
+                self._actualizar_item(partido.arbitro_id)
+            return
+
+        # participantes y jugadores_equipos publican el id del participante
+        self._actualizar_item(cambio.id)
 
-            # Agregar a la lista
-            item = QListWidgetItem()
-            item.setSizeHint(item_widget.sizeHint())
-            self.lista_participantes.addItem(item)
-            self.lista_participantes.setItemWidget(item, item_widget)
+    def _actualizar_item(self, participante_id):
+        """Sustituye, inserta o quita la fila de un único participante."""
+        for fila in range(self.lista_participantes.count()):
+            item = self.lista_participantes.item(fila)
+            if item.data(Qt.UserRole) == participante_id:
+                self.lista_participantes.takeItem(fila)
+                break
+
+        participante = Participante.obtener_por_id(participante_id)
+        if participante is None or not self._coincide_filtro(participante):
+            return
+
+        # Mantener el orden por nombre de obtener_todos()
+        fila = self.lista_participantes.count()
+        for i in range(self.lista_participantes.count()):
+            widget = self.lista_participantes.itemWidget(
+                self.lista_participantes.item(i)
+            )
+            if widget.participante.nombre > participante.nombre:
+                fila = i
+                break
+        self._insertar_item(fila, participante)
 
     def _filtrar_participantes(self):
         """Filtra la lista de participantes según el texto ingresado."""
@@ -809,7 +860,6 @@ class ParticipantesPage(BasePage):
 
         if msg.exec() == QMessageBox.Yes:
             if participante.eliminar():
-                self._refrescar_lista_participantes()
                 # Si estaba editando este participante, limpiar formulario
                 if (
                     self._participante_actual
@@ -924,7 +974,6 @@ class ParticipantesPage(BasePage):
         )
 
         self._limpiar_campos()
-        self._refrescar_lista_participantes()
 
     def _mostrar_mensaje(self, titulo: str, texto: str, icono):
         """Muestra un mensaje con estilo consistente."""
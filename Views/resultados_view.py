@@ -28,6 +28,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QPixmap
 
+from Models import database, progresion
 from Models.equipo import Equipo
 from Models.gol import Gol
 from Models.partido import Partido
@@ -37,6 +38,8 @@ from Views.utils import obtener_ruta_recurso
 
 
 class ResultadosPage(BasePage):
+    TABLAS = ("partidos", "equipos")
+
     def __init__(self, parent=None):
         super().__init__("Actualización de Resultados", parent)
 
@@ -77,6 +80,14 @@ class ResultadosPage(BasePage):
         self.contenido_layout.addWidget(panel_principal)
 
         self.partido_seleccionado = None
+        # Acta y equipos del partido seleccionado, leídos una sola vez
+        self._acta = {"local": [], "visitante": []}
+        self._equipos_seleccionados = (None, None)
+        # Reloj del que se toma el minuto de los goles y tarjetas nuevos
+        self.reloj = None
+
+        # Solo se actualiza la fila del partido que cambia
+        self.escuchar_cambios()
 
     def _crear_panel_izquierdo(self):
         panel = QFrame()
@@ -244,17 +255,82 @@ class ResultadosPage(BasePage):
             return
 
         for partido in partidos:
-            e_local = Equipo.obtener_por_id(partido.equipo_local_id)
-            e_vis = Equipo.obtener_por_id(partido.equipo_visitante_id)
+            self._insertar_item_partido(self.lista_partidos.count(), partido)
 
-            # Crear widget personalizado con escudos
-            item_widget = self._crear_item_partido(partido, e_local, e_vis)
+    def _insertar_item_partido(self, fila: int, partido: Partido):
+        """Inserta en la lista la fila de un partido con sus escudos."""
+        e_local = Equipo.obtener_por_id(partido.equipo_local_id)
+        e_vis = Equipo.obtener_por_id(partido.equipo_visitante_id)
 
-            item = QListWidgetItem()
-            item.setData(Qt.UserRole, partido)
-            item.setSizeHint(QSize(item_widget.sizeHint().width(), 50))
-            self.lista_partidos.addItem(item)
-            self.lista_partidos.setItemWidget(item, item_widget)
+        # Crear widget personalizado con escudos
+        item_widget = self._crear_item_partido(partido, e_local, e_vis)
+
+        item = QListWidgetItem()
+        item.setData(Qt.UserRole, partido)
+        item.setSizeHint(QSize(item_widget.sizeHint().width(), 50))
+        self.lista_partidos.insertItem(fila, item)
+        self.lista_partidos.setItemWidget(item, item_widget)
+
+    def aplicar_cambio(self, cambio):
+        """Actualiza solo la fila del partido afectado por el cambio."""
+        if cambio.entidad == "equipos":
+            # Un cambio de nombre o escudo afecta a las filas de ese equipo
+            for fila in range(self.lista_partidos.count()):
+                partido = self.lista_partidos.item(fila).data(Qt.UserRole)
+                if partido and cambio.id in (
+                    partido.equipo_local_id,
+                    partido.equipo_visitante_id,
+                ):
+                    self._actualizar_item_partido(partido.id)
+            return
+
+        if cambio.id is None:
+            self.cargar_partidos()
+        else:
+            self._actualizar_item_partido(cambio.id)
+
+    def _actualizar_item_partido(self, partido_id):
+        """Sustituye, inserta o quita la fila de un único partido."""
+        partido = Partido.obtener_por_id(partido_id)
+
+        fila_actual = None
+        misma_fecha = False
+        for fila in range(self.lista_partidos.count()):
+            existente = self.lista_partidos.item(fila).data(Qt.UserRole)
+            if existente and existente.id == partido_id:
+                fila_actual = fila
+                misma_fecha = (
+                    partido is not None and existente.fecha_hora == partido.fecha_hora
+                )
+                break
+
+        if fila_actual is not None:
+            self.lista_partidos.takeItem(fila_actual)
+
+        if partido is None:
+            return
+
+        # Quitar el aviso de lista vacía si lo había
+        if self.lista_partidos.count() == 1 and not self.lista_partidos.item(0).data(
+            Qt.UserRole
+        ):
+            self.lista_partidos.takeItem(0)
+
+        # Mantener el orden por fecha de obtener_todos(): la fila conserva su
+        # sitio salvo que el partido sea nuevo o haya cambiado de fecha
+        fila = fila_actual if misma_fecha else None
+        if fila is None:
+            fila = self.lista_partidos.count()
+            for i in range(self.lista_partidos.count()):
+                existente = self.lista_partidos.item(i).data(Qt.UserRole)
+                if existente and existente.fecha_hora > partido.fecha_hora:
+                    fila = i
+                    break
+
+        self._insertar_item_partido(fila, partido)
+
+        if self.partido_seleccionado and self.partido_seleccionado.id == partido_id:
+            self.partido_seleccionado = partido
 
     def _crear_item_partido(self, partido: Partido, e_local: Equipo, e_vis: Equipo):
         """Crea un widget para mostrar un partido en la lista con escudos."""
@@ -340,20 +416,24 @@ class ResultadosPage(BasePage):
             if child.widget():
                 child.widget().deleteLater()
 
-        # Obtener equipos
+        # Obtener equipos y el acta (plantillas con goles y tarjetas) en una consulta
         e_local = Equipo.obtener_por_id(partido.equipo_local_id)
         e_vis = Equipo.obtener_por_id(partido.equipo_visitante_id)
+        self._equipos_seleccionados = (e_local, e_vis)
+        self._acta = Partido.obtener_acta(partido.id)
 
         # Crear paneles de equipos
         if e_local:
-            panel_local = self._crear_panel_equipo(e_local, partido, "local")
+            panel_local = self._crear_panel_equipo(e_local, self._acta["local"], "local")
             self.layout_equipos.addWidget(panel_local)
 
         if e_vis:
-            panel_vis = self._crear_panel_equipo(e_vis, partido, "visitante")
+            panel_vis = self._crear_panel_equipo(
+                e_vis, self._acta["visitante"], "visitante"
+            )
             self.layout_equipos.addWidget(panel_vis)
 
-    def _crear_panel_equipo(self, equipo: Equipo, partido: Partido, lado: str):
+    def _crear_panel_equipo(self, equipo: Equipo, jugadores: list, lado: str):
         """Crea el panel de un equipo con sus jugadores."""
         panel = QFrame()
         panel.setStyleSheet(
@@ -442,16 +522,9 @@ class ResultadosPage(BasePage):
         layout_jugadores.setSpacing(5)
         layout_jugadores.setContentsMargins(0, 0, 0, 0)
 
-        # Obtener jugadores
-        jugadores = Equipo.obtener_jugadores(equipo.id)
-        goles_actuales = Gol.obtener_por_partido(partido.id)
-        tarjetas_actuales = Tarjeta.obtener_por_partido(partido.id)
-
         # Crear fila por cada jugador
         for jugador in jugadores:
-            fila = self._crear_fila_jugador(
-                jugador, goles_actuales, tarjetas_actuales, lado
-            )
+            fila = self._crear_fila_jugador(jugador, lado)
             layout_jugadores.addWidget(fila)
 
         layout_jugadores.addStretch()
@@ -460,9 +533,7 @@ class ResultadosPage(BasePage):
 
         return panel
 
-    def _crear_fila_jugador(
-        self, jugador: dict, goles_actuales: list, tarjetas_actuales: list, lado: str
-    ):
+    def _crear_fila_jugador(self, jugador: dict, lado: str):
         """Crea una fila con los controles para un jugador."""
         fila = QFrame()
         fila.setStyleSheet(
@@ -538,12 +609,8 @@ class ResultadosPage(BasePage):
         )
 
         # Cargar estado actual
-        for tarjeta in tarjetas_actuales:
-            if tarjeta["jugador_id"] == jugador["id"]:
-                if tarjeta["amarillas"] > 0:
-                    btn_amarilla.setChecked(True)
-                if tarjeta["rojas"] > 0:
-                    btn_roja.setChecked(True)
+        btn_amarilla.setChecked(jugador["amarillas_partido"] > 0)
+        btn_roja.setChecked(jugador["rojas_partido"] > 0)
 
         layout_tarjetas.addWidget(btn_amarilla)
         layout_tarjetas.addWidget(btn_roja)
@@ -572,81 +639,64 @@ class ResultadosPage(BasePage):
         txt_goles.setFixedWidth(55)
 
         # Cargar goles actuales
-        for gol in goles_actuales:
-            if gol["jugador_id"] == jugador["id"]:
-                txt_goles.setText(str(gol["cantidad"]))
-                break
+        if jugador["goles_partido"] > 0:
+            txt_goles.setText(str(jugador["goles_partido"]))
 
         layout.addWidget(txt_goles, 1)
 
+        # Sancionado: no puede jugar este partido
+        if jugador["sancion"]:
+            lbl_nombre.setText(f"⛔ {jugador['nombre']}")
+            lbl_nombre.setStyleSheet("font-size: 10pt; color: #95a5a6;")
+            fila.setToolTip(
+                f"Sancionado: {jugador['sancion']} partido(s) pendiente(s)"
+            )
+            for control in (btn_amarilla, btn_roja, txt_goles):
+                control.setEnabled(False)
+
         # Guardar referencias
         self._inputs_jugadores[(lado, jugador["id"])] = {
             "amarilla": btn_amarilla,
             "roja": btn_roja,
             "goles": txt_goles,
+            # Cantidades ya guardadas: marcar la casilla no debe reducirlas
+            "tarjetas_previas": (jugador["amarillas_partido"], jugador["rojas_partido"]),
         }
 
         return fila
 
     def _guardar_resultado(self):
-        """Guarda el resultado del partido."""
+        """Guarda el resultado del partido y hace avanzar al ganador en el cuadro."""
         if not self.partido_seleccionado:
             return
 
         try:
-            # Limpiar goles y tarjetas anteriores
-            Gol.eliminar_por_partido(self.partido_seleccionado.id)
-            Tarjeta.eliminar_por_partido(self.partido_seleccionado.id)
-
             total_local = 0
             total_visitante = 0
+            goles_jugadores = {}
+            tarjetas_jugadores = {}
 
-            # Procesar todos los inputs
+            # Leer todos los inputs antes de tocar la base de datos
             for (lado, jugador_id), controles in self._inputs_jugadores.items():
                 # Obtener goles del QLineEdit
                 texto_goles = controles["goles"].text().strip()
                 goles = int(texto_goles) if texto_goles.isdigit() else 0
 
-                # Registrar goles
+                amarillas_previas, rojas_previas = controles["tarjetas_previas"]
+                tarjetas_jugadores[jugador_id] = (
+                    max(1, amarillas_previas) if controles["amarilla"].isChecked() else 0,
+                    max(1, rojas_previas) if controles["roja"].isChecked() else 0,
+                )
+
                 if goles > 0:
-                    Gol.registrar_goles_partido(
-                        self.partido_seleccionado.id, jugador_id, goles
-                    )
+                    goles_jugadores[jugador_id] = goles
                     if lado == "local":
                         total_local += goles
                     else:
                         total_visitante += goles
 
-                # Registrar tarjetas
-                if controles["amarilla"].isChecked():
-                    Tarjeta.registrar_tarjetas_partido(
-                        self.partido_seleccionado.id, jugador_id, amarillas=1
-                    )
-                if controles["roja"].isChecked():
-                    Tarjeta.registrar_tarjetas_partido(
-                        self.partido_seleccionado.id, jugador_id, rojas=1
-                    )
-
-            # Actualizar partido
-            self.partido_seleccionado.goles_local = total_local
-            self.partido_seleccionado.goles_visitante = total_visitante
-            self.partido_seleccionado.jugado = True
-
-            # Determinar ganador
-            if total_local > total_visitante:
-                self.partido_seleccionado.ganador_id = (
-                    self.partido_seleccionado.equipo_local_id
-                )
-            elif total_visitante > total_local:
-                self.partido_seleccionado.ganador_id = (
-                    self.partido_seleccionado.equipo_visitante_id
-                )
-            else:
-                self.partido_seleccionado.ganador_id = None  # Empate
-
             # Mostrar diálogo de confirmación deportivo
-            e_local = Equipo.obtener_por_id(self.partido_seleccionado.equipo_local_id)
-            e_vis = Equipo.obtener_por_id(self.partido_seleccionado.equipo_visitante_id)
+            e_local, e_vis = self._equipos_seleccionados
 
             dialogo = DialogoConfirmacionResultado(
                 self,
@@ -656,23 +706,49 @@ class ResultadosPage(BasePage):
                 total_visitante,
                 self._inputs_jugadores,
                 self.partido_seleccionado,
+                self._acta,
             )
 
-            if dialogo.exec() == QDialog.Accepted:
-                # Guardar en BD
-                self.partido_seleccionado.goles_local = total_local
-                self.partido_seleccionado.goles_visitante = total_visitante
-                self.partido_seleccionado.jugado = True
-
-                if hasattr(self.partido_seleccionado, "actualizar"):
-                    self.partido_seleccionado.actualizar()
+            if dialogo.exec() != QDialog.Accepted:
+                return
+
+            partido = self.partido_seleccionado
+            minuto = self.reloj.minuto_partido() if self.reloj is not None else None
+
+            # Resultado, goles, tarjetas y avance del cuadro se guardan juntos
+            with database.transaccion():
+                # Solo se escriben las diferencias: lo ya registrado conserva su minuto
+                if not Gol.sincronizar_partido(partido.id, goles_jugadores, minuto):
+                    raise Exception("No se pudieron registrar los goles")
+                if not Tarjeta.sincronizar_partido(
+                    partido.id, tarjetas_jugadores, minuto
+                ):
+                    raise Exception("No se pudieron registrar las tarjetas")
+
+                # Actualizar partido
+                partido.goles_local = total_local
+                partido.goles_visitante = total_visitante
+                partido.jugado = True
+
+                # Determinar ganador
+                if total_local > total_visitante:
+                    partido.ganador_id = partido.equipo_local_id
+                elif total_visitante > total_local:
+                    partido.ganador_id = partido.equipo_visitante_id
                 else:
-                    self.partido_seleccionado.guardar()
+                    partido.ganador_id = None  # Empate
 
-                # Recargar lista
-                self.cargar_partidos()
+                if not partido.actualizar_campos(
+                    "goles_local", "goles_visitante", "jugado", "ganador_id"
+                ):
+                    raise Exception("No se pudo actualizar el partido")
+
+                progresion.avanzar(partido)
 
         except Exception as e:
+            # Lo guardado en memoria ya no coincide con la base de datos
+            if self.partido_seleccionado:
+                self._actualizar_item_partido(self.partido_seleccionado.id)
             QMessageBox.critical(
                 self, "Error", f"No se pudo guardar el resultado:\n{str(e)}"
             )
@@ -761,8 +837,11 @@ class DialogoConfirmacionResultado(QDialog):
         goles_vis,
         inputs_jugadores,
         partido,
+        acta=None,
     ):
         super().__init__(parent)
+        # Plantillas ya leídas por el editor; si no se pasan se consultan
+        self._acta = acta
         self.setWindowTitle("Confirmación de Resultado")
         self.setModal(True)
         self.setMinimumSize(900, 700)
@@ -1055,7 +1134,10 @@ class DialogoConfirmacionResultado(QDialog):
         layout_contenedor.setSpacing(8)
 
         # Buscar jugadores con goles o tarjetas
-        jugadores = Equipo.obtener_jugadores(equipo.id)
+        if self._acta is not None:
+            jugadores = self._acta[lado]
+        else:
+            jugadores = Equipo.obtener_jugadores(equipo.id)
 
         tiene_eventos = False
         for jugador in jugadores:
@@ -0,0 +1,318 @@
+"""
+Interfaz de línea de comandos para tareas por lotes.
+
+Usa solo los modelos y controladores sobre un QCoreApplication: no crea
+widgets ni carga estilos, por lo que arranca rápido y puede programarse
+con cron o el Programador de tareas.
+
+Ejemplos:
+    python cli.py exportar partidos partidos.csv
+    python cli.py exportar participantes jugadores.csv --filtro jugadores
+    python cli.py exportar analitica carpeta_parquet
+    python cli.py importar equipos.csv
+    python cli.py importar plantillas.csv --tipo jugadores_equipos
+    python cli.py informe clasificacion --eliminatoria Final
+    python cli.py mantenimiento comprobar
+    python cli.py mantenimiento reconciliar
+    python cli.py api --host 0.0.0.0
+    python cli.py directo --host 0.0.0.0
+    python cli.py mantenimiento copia copia_torneo.db
+"""
+
+import argparse
+import sys
+
+from PySide6.QtCore import QCoreApplication
+
+from Models import database
+
+
+def _exportar(args):
+    """
+    Exporta una tabla a CSV con los mismos formatos que la aplicación, o
+    todo el torneo en Parquet con el tipo "analitica".
+
+    Returns:
+        bool: True si se exportó correctamente
+    """
+    from Models.equipo import Equipo
+    from Models.participante import Participante
+    from Models.partido import Partido
+
+    if args.tipo == "analitica":
+        from Controllers import analitica_controller
+
+        if not analitica_controller.PYARROW_DISPONIBLE:
+            print("pyarrow no está instalado; no se puede exportar en Parquet")
+            return False
+        filas = analitica_controller.exportar_torneo(args.ruta)
+        for tabla, total in filas.items():
+            print(f"{tabla}: {total} filas")
+        exito = True
+    elif args.tipo == "equipos":
+        exito = Equipo.exportar_csv(args.ruta)
+    elif args.tipo == "participantes":
+        exito = Participante.exportar_csv(args.ruta, args.filtro)
+    elif args.tipo == "partidos":
+        exito = Partido.exportar_csv(args.ruta)
+    else:
+        exito = Partido.exportar_clasificacion_csv(args.ruta)
+
+    if exito:
+        print(f"Exportado: {args.ruta}")
+    return exito
+
+
+def _importar(args):
+    """
+    Importa un CSV de equipos, participantes o plantillas.
+
+    Returns:
+        bool: True si se importaron todas las filas sin errores
+    """
+    from Models import importacion
+
+    tipo = args.tipo or importacion.detectar_tipo(args.ruta)
+    if tipo is None:
+        print("No se reconoce la cabecera del archivo; indica --tipo")
+        return False
+
+    resultado = importacion.importar(tipo, args.ruta)
+    print(resultado.resumen(max_errores=args.max_errores))
+    return not resultado.errores
+
+
+def _informe(args):
+    """
+    Genera un informe PDF con JasperReports.
+
+    Returns:
+        bool: True si se generó el informe
+    """
+    # Se importa aquí: carga JasperReports, que solo hace falta en este comando
+    from Controllers import informes_controller
+
+    if not informes_controller.JASPER_DISPONIBLE:
+        print("pyreportjasper no está instalado; no se pueden generar informes")
+        return False
+
+    if args.tipo == "equipos":
+        ruta = informes_controller.generar_informe_equipos_jugadores(
+            args.salida, args.equipo_id
+        )
+    elif args.tipo == "partidos":
+        ruta = informes_controller.generar_informe_partidos_resultados(
+            args.salida, args.eliminatoria
+        )
+    else:
+        ruta = informes_controller.generar_informe_clasificacion(
+            args.salida, args.eliminatoria
+        )
+
+    print(f"Informe generado: {ruta}")
+    return True
+
+
+def _mantenimiento(args):
+    """
+    Comprueba, optimiza, reconcilia los contadores o copia la base de datos.
+
+    Returns:
+        bool: True si la operación terminó sin problemas
+    """
+    if args.operacion == "comprobar":
+        problemas = database.comprobar_integridad() + database.comprobar_contadores()
+        for problema in problemas:
+            print(problema)
+        if not problemas:
+            print("Base de datos correcta")
+        return not problemas
+
+    if args.operacion == "optimizar":
+        return database.optimizar()
+
+    if args.operacion == "reconciliar":
+        try:
+            with database.transaccion():
+                corregidos = database.reconciliar_contadores()
+        except Exception as e:
+            print(e)
+            return False
+        print(f"Contadores corregidos: {corregidos}")
+        return True
+
+    if not args.destino:
+        print("Indica el fichero de destino de la copia")
+        return False
+    if database.copia_seguridad(args.destino):
+        print(f"Copia creada: {args.destino}")
+        return True
+    return False
+
+
+def _api(args):
+    """
+    Sirve la API JSON de solo lectura hasta que se pulse Ctrl+C.
+
+    Returns:
+        bool: True si el servidor se detuvo sin errores
+    """
+    import time
+
+    from Controllers.api_controller import ServidorApi
+
+    servidor = ServidorApi(args.host, args.puerto)
+    servidor.iniciar()
+    print(f"API disponible en {servidor.url} (Ctrl+C para detener)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.detener()
+    return True
+
+
+def _directo(args):
+    """
+    Sirve el directo de resultados por Server-Sent Events hasta Ctrl+C.
+
+    Sin interfaz no se guardan resultados en este proceso: se emiten los
+    que confirman las instancias gráficas que comparten la base de datos.
+
+    Returns:
+        bool: True si el servidor se detuvo sin errores
+    """
+    import time
+
+    from Controllers.directo_controller import EmisorDirecto
+    from Models.vigilante_cambios import VigilanteCambios
+
+    emisor = EmisorDirecto(args.host, args.puerto)
+    emisor.iniciar()
+    vigilante = VigilanteCambios()
+    vigilante.iniciar()
+    print(f"Directo disponible en {emisor.url} (Ctrl+C para detener)")
+    try:
+        # Sin bucle de eventos de Qt: se comprueba a mano en lugar del QTimer
+        while True:
+            time.sleep(1)
+            vigilante.comprobar()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        vigilante.detener()
+        emisor.detener()
+    return True
+
+
+def crear_parser():
+    """
+    Construye el analizador de argumentos con todos los subcomandos.
+
+    Returns:
+        argparse.ArgumentParser: Analizador configurado
+    """
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Tareas por lotes del Gestor de Torneo de Fútbol sin interfaz gráfica.",
+    )
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    exportar = subparsers.add_parser("exportar", help="Exportar datos a CSV")
+    exportar.add_argument(
+        "tipo",
+        choices=["equipos", "participantes", "partidos", "clasificacion", "analitica"],
+    )
+    exportar.add_argument(
+        "ruta", help="Fichero CSV de destino (carpeta para analitica)"
+    )
+    exportar.add_argument(
+        "--filtro",
+        choices=["todos", "jugadores", "arbitros"],
+        default="todos",
+        help="Solo para participantes",
+    )
+    exportar.set_defaults(funcion=_exportar)
+
+    importar = subparsers.add_parser(
+        "importar", help="Importar equipos, participantes o plantillas desde CSV"
+    )
+    importar.add_argument("ruta", help="Fichero CSV de origen")
+    importar.add_argument(
+        "--tipo",
+        choices=["equipos", "participantes", "jugadores_equipos"],
+        help="Por defecto se deduce de la cabecera",
+    )
+    importar.add_argument(
+        "--max-errores", type=int, default=50, help="Errores que se muestran como máximo"
+    )
+    importar.set_defaults(funcion=_importar)
+
+    informe = subparsers.add_parser("informe", help="Generar un informe PDF")
+    informe.add_argument("tipo", choices=["equipos", "partidos", "clasificacion"])
+    informe.add_argument("--salida", help="Ruta del PDF (por defecto en reports/)")
+    informe.add_argument("--equipo-id", type=int, help="Solo para el informe de equipos")
+    informe.add_argument("--eliminatoria", help="Filtrar por eliminatoria")
+    informe.set_defaults(funcion=_informe)
+
+    api = subparsers.add_parser(
+        "api", help="Servir la API JSON de solo lectura para marcadores"
+    )
+    api.add_argument("--host", default="127.0.0.1", help="0.0.0.0 para la red local")
+    api.add_argument("--puerto", type=int, default=8765)
+    api.set_defaults(funcion=_api)
+
+    directo = subparsers.add_parser(
+        "directo", help="Servir el directo de resultados por Server-Sent Events"
+    )
+    directo.add_argument(
+        "--host", default="127.0.0.1", help="0.0.0.0 para la red local"
+    )
+    directo.add_argument("--puerto", type=int, default=8766)
+    directo.set_defaults(funcion=_directo)
+
+    mantenimiento = subparsers.add_parser(
+        "mantenimiento",
+        help="Comprobar, optimizar, reconciliar contadores o copiar la base de datos",
+    )
+    mantenimiento.add_argument(
+        "operacion", choices=["comprobar", "optimizar", "reconciliar", "copia"]
+    )
+    mantenimiento.add_argument("destino", nargs="?", help="Fichero de la copia")
+    mantenimiento.set_defaults(funcion=_mantenimiento)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Ejecuta el subcomando indicado y devuelve el código de salida.
+
+    Args:
+        argv (list, optional): Argumentos; por defecto los de sys.argv
+
+    Returns:
+        int: 0 si la operación terminó bien, 1 en caso contrario
+    """
+    args = crear_parser().parse_args(argv)
+
+    # Sin aplicación de widgets: basta con el núcleo para los drivers SQL
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    app.setApplicationName("Gestión Torneo de Fútbol")
+
+    try:
+        database.conectar()
+        exito = args.funcion(args)
+    except Exception as e:
+        print(f"Error: {e}")
+        exito = False
+    finally:
+        database.cerrar_conexion()
+
+    return 0 if exito else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
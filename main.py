@@ -102,11 +102,18 @@ def main():
         ventana_principal = MainWindow()
         ventana_principal.show()
 
+        # Detectar escrituras de otro equipo que comparta la base de datos
+        from Models.vigilante_cambios import VigilanteCambios
+
+        vigilante = VigilanteCambios(parent=app)
+        vigilante.iniciar()
+
         print("Aplicación iniciada correctamente")
         print("=" * 50)
 
         # Ejecutar el bucle de eventos de la aplicación
         codigo_salida = app.exec()
+        vigilante.detener()
 
         # Cerrar conexión a la base de datos al salir
         database.cerrar_conexion()
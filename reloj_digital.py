@@ -24,6 +24,7 @@ from PySide6.QtCore import (
     QTimer,
     QTime,
     QDateTime,
+    QElapsedTimer,
     Signal,
     Slot,
     Qt,
@@ -35,6 +36,10 @@ from PySide6.QtCore import (
 from enum import Enum
 from Views.ui_reloj_widget import Ui_lbl_tiempo
 
+# Milisegundos que se espera tras cada cambio de segundo antes de repintar,
+# para no leer el tiempo justo antes de que cambie
+MARGEN_TIC_MS = 5
+
 
 class Mode(Enum):
     """Enum para los modos del reloj."""
@@ -71,21 +76,36 @@ class RelojDigital(QWidget):
         self._alarm_hour = 0
         self._alarm_minute = 0
         self._alarm_message = "¡Alarma activada!"
-        self._alarm_triggered_today = False
 
-        # Temporizador
+        # Temporizador y cronómetro: el tiempo se mide con un reloj monótono
+        # (QElapsedTimer) y se acumula al pausar, en lugar de contar ticks,
+        # así que un bucle de eventos bloqueado no hace que se retrasen.
         self._timer_duration = 60
-        self._timer_remaining = 60
+        self._timer_consumido_ms = 0
         self._timer_active = False
+        self._timer_referencia = QElapsedTimer()
 
-        # Cronómetro
-        self._stopwatch_elapsed = 0
+        self._stopwatch_acumulado_ms = 0
         self._stopwatch_active = False
+        self._stopwatch_referencia = QElapsedTimer()
 
-        # QTimer principal
+        # Repintado: disparo único programado para el siguiente cambio de
+        # segundo, y solo mientras hay algo que cambie en pantalla
         self.timer = QTimer(self)
-        self.timer.timeout.connect(self._update_display)
-        self.timer.start(1000)  # Actualizar cada segundo
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self._tick)
+
+        # Fin del temporizador y alarma: disparos únicos en su instante
+        self._timer_fin = QTimer(self)
+        self._timer_fin.setSingleShot(True)
+        self._timer_fin.setTimerType(Qt.PreciseTimer)
+        self._timer_fin.timeout.connect(self._on_timer_finished)
+
+        self._alarm_timer = QTimer(self)
+        self._alarm_timer.setSingleShot(True)
+        self._alarm_timer.setTimerType(Qt.PreciseTimer)
+        self._alarm_timer.timeout.connect(self._on_alarm)
 
         # Configurar UI
         self._setup_ui()
@@ -392,6 +412,7 @@ class RelojDigital(QWidget):
             raise ValueError("Modo inválido")
         self._mode = value
         self._update_display()
+        self._programar_tick()
         
         # Sincronizar UI si el cambio no vino del combo
         idx = -1
@@ -423,8 +444,7 @@ class RelojDigital(QWidget):
         self._alarm_enabled = bool(value)
         if self.check_alarma.isChecked() != value:
             self.check_alarma.setChecked(value)
-        if value:
-            self._alarm_triggered_today = False
+        self._programar_alarma()
 
     @property
     def alarm_hour(self):
@@ -437,7 +457,7 @@ class RelojDigital(QWidget):
         self._alarm_hour = val
         if self.spin_hora_alarma.value() != val:
             self.spin_hora_alarma.setValue(val)
-        self._alarm_triggered_today = False
+        self._programar_alarma()
 
     @property
     def alarm_minute(self):
@@ -450,7 +470,7 @@ class RelojDigital(QWidget):
         self._alarm_minute = val
         if self.spin_minuto_alarma.value() != val:
             self.spin_minuto_alarma.setValue(val)
-        self._alarm_triggered_today = False
+        self._programar_alarma()
 
     @property
     def alarm_message(self):
@@ -476,47 +496,175 @@ class RelojDigital(QWidget):
             self.spin_duracion.setValue(val)
             
         # Si cambiamos duración en UI, reseteamos el timer logic
-        self._timer_remaining = val
+        self._timer_consumido_ms = 0
         self._timer_active = False
+        self._timer_fin.stop()
         self._update_display()
+        self._programar_tick()
 
     # ========== MÉTODOS PÚBLICOS TIMER/STOPWATCH ==========
     @Slot()
     def start_timer(self):
         if self._mode != Mode.TIMER: return
-        if self._timer_remaining > 0:
-            self._timer_active = True
+        restante = self._timer_restante_ms()
+        if self._timer_active or restante == 0: return
+        self._timer_referencia.start()
+        self._timer_active = True
+        self._timer_fin.start(restante)
+        self._programar_tick()
 
     @Slot()
     def pause_timer(self):
-        if self._mode != Mode.TIMER: return
+        if self._mode != Mode.TIMER or not self._timer_active: return
+        self._timer_consumido_ms += self._timer_referencia.elapsed()
         self._timer_active = False
+        self._timer_fin.stop()
+        self._update_display()
+        self._programar_tick()
 
     @Slot()
     def reset_timer(self):
         if self._mode != Mode.TIMER: return
-        self._timer_remaining = self._timer_duration
+        self._timer_consumido_ms = 0
         self._timer_active = False
+        self._timer_fin.stop()
         self._update_display()
+        self._programar_tick()
 
     @Slot()
     def start_stopwatch(self):
-        if self._mode != Mode.STOPWATCH: return
+        if self._mode != Mode.STOPWATCH or self._stopwatch_active: return
+        self._stopwatch_referencia.start()
         self._stopwatch_active = True
+        self._programar_tick()
 
     @Slot()
     def pause_stopwatch(self):
-        if self._mode != Mode.STOPWATCH: return
+        if self._mode != Mode.STOPWATCH or not self._stopwatch_active: return
+        self._stopwatch_acumulado_ms += self._stopwatch_referencia.elapsed()
         self._stopwatch_active = False
+        self._update_display()
+        self._programar_tick()
 
     @Slot()
     def reset_stopwatch(self):
         if self._mode != Mode.STOPWATCH: return
-        self._stopwatch_elapsed = 0
+        self._stopwatch_acumulado_ms = 0
         self._stopwatch_active = False
         self._update_display()
+        self._programar_tick()
+
+    @property
+    def stopwatch_active(self):
+        """bool: True si el cronómetro está en marcha."""
+        return self._stopwatch_active
+
+    @property
+    def stopwatch_elapsed(self):
+        """int: Segundos completos transcurridos en el cronómetro."""
+        return self._stopwatch_ms() // 1000
+
+    @property
+    def timer_remaining(self):
+        """int: Segundos que le quedan al temporizador, redondeados hacia arriba."""
+        return -(-self._timer_restante_ms() // 1000)
+
+    def minuto_partido(self):
+        """
+        Minuto de juego según el cronómetro, o None si no se ha iniciado.
+
+        Sigue la convención del fútbol: de 0:00 a 0:59 es el minuto 1. El
+        cronómetro sigue contando aunque el reloj cambie de modo.
+
+        Returns:
+            int: Minuto de juego, o None si el cronómetro no se ha iniciado
+        """
+        transcurrido = self._stopwatch_ms()
+        if transcurrido == 0:
+            return None
+        return transcurrido // 60000 + 1
 
     # ========== LÓGICA INTERNA ==========
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_display()
+        self._programar_tick()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._programar_tick()
+
+    def _stopwatch_ms(self):
+        transcurrido = self._stopwatch_acumulado_ms
+        if self._stopwatch_active:
+            transcurrido += self._stopwatch_referencia.elapsed()
+        return transcurrido
+
+    def _timer_restante_ms(self):
+        consumido = self._timer_consumido_ms
+        if self._timer_active:
+            consumido += self._timer_referencia.elapsed()
+        return max(0, self._timer_duration * 1000 - consumido)
+
+    def _programar_tick(self):
+        """Programa el siguiente repintado justo después del cambio de segundo."""
+        esperas = []
+        if self.isVisible():
+            if self._mode == Mode.CLOCK:
+                esperas.append(1000 - QTime.currentTime().msec())
+            elif self._mode == Mode.TIMER and self._timer_active:
+                esperas.append(self._timer_restante_ms() % 1000 or 1000)
+            elif self._mode == Mode.STOPWATCH and self._stopwatch_active:
+                esperas.append(1000 - self._stopwatch_ms() % 1000)
+        if self._stopwatch_active:
+            # Aunque no se vea, quien sigue el minuto de juego recibe
+            # stopwatchUpdated al menos en cada cambio de minuto
+            esperas.append(60000 - self._stopwatch_ms() % 60000)
+
+        if esperas:
+            self.timer.start(min(esperas) + MARGEN_TIC_MS)
+        else:
+            self.timer.stop()
+
+    def _tick(self):
+        if self.isVisible():
+            self._update_display()
+        if self._stopwatch_active:
+            self.stopwatchUpdated.emit(self.stopwatch_elapsed)
+        self._programar_tick()
+
+    def _programar_alarma(self):
+        """Programa un disparo único para la próxima hora de la alarma."""
+        self._alarm_timer.stop()
+        if not self._alarm_enabled:
+            return
+
+        ahora = QDateTime.currentDateTime()
+        objetivo = QDateTime(ahora.date(), QTime(self._alarm_hour, self._alarm_minute))
+        if objetivo <= ahora:
+            objetivo = objetivo.addDays(1)
+        self._alarm_timer.start(ahora.msecsTo(objetivo))
+
+    def _on_alarm(self):
+        ahora = QTime.currentTime()
+        if (ahora.hour(), ahora.minute()) != (self._alarm_hour, self._alarm_minute):
+            # La hora del sistema cambió (suspensión, horario de verano...)
+            self._programar_alarma()
+            return
+
+        # La siguiente, mañana; antes del diálogo, que bloquea hasta cerrarse
+        self._programar_alarma()
+        self.alarmTriggered.emit(self._alarm_message)
+        QMessageBox.information(self, "Alarma", self._alarm_message)
+
+    def _on_timer_finished(self):
+        self._timer_consumido_ms = self._timer_duration * 1000
+        self._timer_active = False
+        self._update_display()
+        self._programar_tick()
+        self.timerFinished.emit()
+        QMessageBox.information(self, "Timer", "¡Tiempo completado!")
+
     def _update_display(self):
         if self._mode == Mode.CLOCK:
             self._update_clock()
@@ -533,51 +681,18 @@ class RelojDigital(QWidget):
             time_str = current_time.toString("hh:mm:ss AP")
         self.ui.label.setText(time_str)
 
-        # Verificar alarma
-        if (
-            self._alarm_enabled
-            and not self._alarm_triggered_today
-            and current_time.hour() == self._alarm_hour
-            and current_time.minute() == self._alarm_minute
-            and current_time.second() == 0
-        ):
-            self._alarm_triggered_today = True
-            # Mostrar MessageBox por defecto, además de emitir señal
-            # El uso como componente puede decidir si mostrar o no, pero 
-            # como ahora es standalone, deberíamos manejarlo aquí o dejar
-            # que la app padre maneje.
-            # Para cumplir "self-contained", podemos mostrar un diálogo si nadie conecta,
-            # pero mejor emitimos y manejamos internamente si es necesario.
-            # Aquí emitimos la señal.
-            self.alarmTriggered.emit(self._alarm_message)
-            
-            # Mostramos un popup simple interno
-            QMessageBox.information(self, "Alarma", self._alarm_message)
-
-        if current_time.hour() == 0 and current_time.minute() == 0 and current_time.second() == 0:
-            self._alarm_triggered_today = False
-
     def _update_timer(self):
-        if self._timer_active and self._timer_remaining > 0:
-            self._timer_remaining -= 1
-            if self._timer_remaining == 0:
-                self._timer_active = False
-                self.timerFinished.emit()
-                QMessageBox.information(self, "Timer", "¡Tiempo completado!")
-
-        hours = self._timer_remaining // 3600
-        minutes = (self._timer_remaining % 3600) // 60
-        seconds = self._timer_remaining % 60
+        remaining = self.timer_remaining
+        hours = remaining // 3600
+        minutes = (remaining % 3600) // 60
+        seconds = remaining % 60
         time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
         self.ui.label.setText(time_str)
 
     def _update_stopwatch(self):
-        if self._stopwatch_active:
-            self._stopwatch_elapsed += 1
-            self.stopwatchUpdated.emit(self._stopwatch_elapsed)
-
-        hours = self._stopwatch_elapsed // 3600
-        minutes = (self._stopwatch_elapsed % 3600) // 60
-        seconds = self._stopwatch_elapsed % 60
+        elapsed = self.stopwatch_elapsed
+        hours = elapsed // 3600
+        minutes = (elapsed % 3600) // 60
+        seconds = elapsed % 60
         time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
         self.ui.label.setText(time_str)